@@ -7,10 +7,12 @@ the skillset internals.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
 
 from practice.content import ContentPage, ProjectContribution, ProjectSection
 from practice.entities import Project
+from shared.pages import LazyContentPage, file_body, load_section
 
 
 def _read_md(path: Path) -> str:
@@ -30,6 +32,19 @@ class BmcProjectPresenter:
         self,
         project: Project,
     ) -> ProjectContribution:
+        contribution, sections = self.stream(project)
+        return contribution.model_copy(
+            update={"sections": [load_section(s) for s in sections]}
+        )
+
+    def stream(
+        self, project: Project
+    ) -> tuple[ProjectContribution, Iterator[ProjectSection]]:
+        """The contribution without its sections, and a generator of them.
+
+        Page bodies are ``LazyContentPage`` loaders, read only when the
+        writer loads each page.
+        """
         proj_dir = (
             self._ws_root
             / project.client
@@ -38,6 +53,23 @@ class BmcProjectPresenter:
             / project.slug
         )
 
+        # The canvas is the overview as well as a page; read it once
+        canvas_md = _read_md(proj_dir / "canvas.agreed.md")
+
+        contribution = ProjectContribution(
+            slug=project.slug,
+            title=project.slug,
+            skillset=project.skillset,
+            status=project.status.value,
+            hero_figure=None,
+            overview_md=canvas_md,
+            sections=[],
+        )
+        return contribution, self._iter_sections(proj_dir, canvas_md)
+
+    def _iter_sections(
+        self, proj_dir: Path, canvas_md: str
+    ) -> Iterator[ProjectSection]:
         has_brief = (proj_dir / "brief.agreed.md").is_file()
         has_segments = (proj_dir / "segments" / "segments.agreed.md").is_file()
         has_canvas = (proj_dir / "canvas.agreed.md").is_file()
@@ -47,57 +79,41 @@ class BmcProjectPresenter:
 
         if has_canvas:
             pages.append(
-                ContentPage(
+                LazyContentPage(
                     title="Business Model Canvas",
                     slug="canvas",
-                    body_md=_read_md(proj_dir / "canvas.agreed.md"),
+                    loader=lambda: canvas_md,
                 )
             )
         if has_segments:
             pages.append(
-                ContentPage(
+                LazyContentPage(
                     title="Customer Segments",
                     slug="segments",
-                    body_md=_read_md(proj_dir / "segments" / "segments.agreed.md"),
+                    loader=file_body(proj_dir / "segments" / "segments.agreed.md"),
                 )
             )
         if has_brief:
             pages.append(
-                ContentPage(
+                LazyContentPage(
                     title="Project Brief",
                     slug="brief",
-                    body_md=_read_md(proj_dir / "brief.agreed.md"),
+                    loader=file_body(proj_dir / "brief.agreed.md"),
                 )
             )
         if has_decisions:
             pages.append(
-                ContentPage(
+                LazyContentPage(
                     title="Decisions",
                     slug="decisions",
-                    body_md=_read_md(proj_dir / "decisions.md"),
+                    loader=file_body(proj_dir / "decisions.md"),
                 )
             )
 
-        # Overview content is the canvas if available
-        overview_md = _read_md(proj_dir / "canvas.agreed.md") if has_canvas else ""
-
-        sections: list[ProjectSection] = []
         if pages:
-            sections.append(
-                ProjectSection(
-                    label="Analysis",
-                    slug="analysis",
-                    description="Business model analysis artifacts",
-                    pages=pages,
-                )
+            yield ProjectSection(
+                label="Analysis",
+                slug="analysis",
+                description="Business model analysis artifacts",
+                pages=pages,
             )
-
-        return ProjectContribution(
-            slug=project.slug,
-            title=project.slug,
-            skillset=project.skillset,
-            status=project.status.value,
-            hero_figure=None,
-            overview_md=overview_md,
-            sections=sections,
-        )
@@ -21,7 +21,6 @@
 set -euo pipefail
 
 REPO_DIR="$(git -C "$(dirname "$0")" rev-parse --show-toplevel)"
-CLI="uv run --project $REPO_DIR practice"
 
 CLIENT="" ENGAGEMENT="" PROJECT=""
 FIELDS=()
@@ -40,16 +39,20 @@ if [[ -z "$CLIENT" || -z "$ENGAGEMENT" || -z "$PROJECT" ]]; then
   exit 1
 fi
 
-# Record the brief agreement decision
-CMD=($CLI decision record \
-  --client "$CLIENT" --engagement "$ENGAGEMENT" --project "$PROJECT" \
-  --title "Stage 1: Project brief agreed" \
+# Both commands run in one practice process. Each is written as its
+# argument count followed by its arguments, all NUL-terminated, so
+# field values need no quoting and may even be empty.
+record=(decision record
+  --client "$CLIENT" --engagement "$ENGAGEMENT" --project "$PROJECT"
+  --title "Stage 1: Project brief agreed"
   --field "Agreed=Business Model Canvas project scope signed off by client")
 for f in "${FIELDS[@]}"; do
-  CMD+=(--field "$f")
+  record+=(--field "$f")
 done
-"${CMD[@]}"
 
 # Activate the project
-$CLI project update-status \
-  --client "$CLIENT" --engagement "$ENGAGEMENT" --project "$PROJECT" --status elaboration
+advance=(project update-status
+  --client "$CLIENT" --engagement "$ENGAGEMENT" --project "$PROJECT" --status elaboration)
+
+printf '%s\0' "${#record[@]}" "${record[@]}" "${#advance[@]}" "${advance[@]}" \
+  | uv run --project "$REPO_DIR" practice run-batch -0
@@ -13,6 +13,7 @@ import pytest
 
 from practice.content import ProjectContribution
 from practice.entities import Project, ProjectStatus
+from shared.pages import load_page
 from business_model_canvas.presenter import BmcProjectPresenter
 
 CLIENT = "test-corp"
@@ -126,6 +127,38 @@ class TestFullWorkspace:
         canvas_page = contrib.sections[0].pages[0]
         assert "Freight visibility" in canvas_page.body_md
 
+    def test_canvas_read_once(self, full_workspace, monkeypatch):
+        reads = []
+        original = Path.read_text
+
+        def counting(self, *args, **kwargs):
+            reads.append(self.name)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", counting)
+        presenter = BmcProjectPresenter(workspace_root=full_workspace)
+        contrib = presenter.present(_make_project())
+        assert reads.count("canvas.agreed.md") == 1
+        assert contrib.overview_md is contrib.sections[0].pages[0].body_md
+
+    def test_stream_reads_bodies_on_load(self, full_workspace, monkeypatch):
+        reads = []
+        original = Path.read_text
+
+        def counting(self, *args, **kwargs):
+            reads.append(self.name)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", counting)
+        presenter = BmcProjectPresenter(workspace_root=full_workspace)
+        contrib, sections = presenter.stream(_make_project())
+        [section] = list(sections)
+        assert contrib.sections == []
+        assert reads == ["canvas.agreed.md"]
+        page = load_page(section.pages[1])
+        assert reads == ["canvas.agreed.md", "segments.agreed.md"]
+        assert page.body_md
+
 
 class TestMinimalWorkspace:
     """BMC project with only a brief."""
@@ -1,6 +1,13 @@
 """Competitive Analysis bounded context."""
 
-from practice.entities import Skillset
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from shared.lazy import lazy_skillsets
+
+if TYPE_CHECKING:
+    from practice.entities import Skillset
 
 
 def _create_presenter(workspace_root, repo_root):
@@ -11,16 +18,23 @@ def _create_presenter(workspace_root, repo_root):
 
 PRESENTER_FACTORY = ("competitive-analysis", _create_presenter)
 
-SKILLSETS: list[Skillset] = [
-    Skillset(
-        name="competitive-analysis",
-        display_name="Competitive Analysis",
-        description="Market positioning methodology.",
-        slug_pattern="comp-{n}",
-        problem_domain="Market positioning",
-        value_proposition="Know your rivals.",
-        deliverables=["Competitor landscape report", "Market gap analysis"],
-        classification=["strategy", "market-analysis"],
-        evidence=["Porter's Five Forces"],
-    ),
-]
+
+def _skillsets() -> list[Skillset]:
+    from practice.entities import Skillset
+
+    return [
+        Skillset(
+            name="competitive-analysis",
+            display_name="Competitive Analysis",
+            description="Market positioning methodology.",
+            slug_pattern="comp-{n}",
+            problem_domain="Market positioning",
+            value_proposition="Know your rivals.",
+            deliverables=["Competitor landscape report", "Market gap analysis"],
+            classification=["strategy", "market-analysis"],
+            evidence=["Porter's Five Forces"],
+        ),
+    ]
+
+
+__getattr__ = lazy_skillsets(__name__, _skillsets)
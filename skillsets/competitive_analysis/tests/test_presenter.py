@@ -30,3 +30,19 @@ class TestPresenterContract:
         assert result.slug == "test-1"
         assert result.skillset == "competitive-analysis"
         assert isinstance(result.sections, list)
+
+    def test_stream_matches_present(self, tmp_path):
+        presenter = CompetitiveAnalysisPresenter(workspace_root=tmp_path)
+        project = Project(
+            slug="test-1",
+            client="test-corp",
+            engagement="strat-1",
+            skillset="competitive-analysis",
+            status=ProjectStatus.ELABORATION,
+            created=date(2025, 6, 1),
+        )
+        contribution, sections = presenter.stream(project)
+        assert contribution.sections == []
+        assert contribution.model_copy(
+            update={"sections": list(sections)}
+        ) == presenter.present(project)
@@ -0,0 +1,6 @@
+"""Infrastructure shared by the bounded contexts.
+
+Nothing here belongs to one skillset: it is what every bounded
+context's presenter and package definition builds on, kept in one
+place so that no bounded context imports another.
+"""
@@ -0,0 +1,195 @@
+"""Command groups shared by the bounded-context CLIs.
+
+Every practice invocation registers every bounded context's commands,
+so a group whose subcommands are generated from request DTOs builds
+them only when it is used. ``LazyGroup`` takes a loader that returns
+the subcommands and calls it on first lookup; listing the practice
+commands does not import the DTOs behind them. ``LazyCommand`` does
+the same for a single top-level command: its options and callback
+come from the command its loader builds when it is first parsed or
+run.
+
+``run-batch`` runs several practice commands in one process. Skill
+wrapper scripts that need more than one command (record a decision,
+then advance the project status) pipe them all to a single
+``practice run-batch -0``. Each command runs as a child of the root
+context, so environment resolution and bounded-context imports happen
+once instead of once per command. ``register_commands`` adds it to
+the root group alongside the bounded-context commands.
+"""
+
+from __future__ import annotations
+
+import shlex
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+import click
+
+
+# ---------------------------------------------------------------------------
+# Lazy commands
+# ---------------------------------------------------------------------------
+
+
+class LazyGroup(click.Group):
+    """Command group whose subcommands are built on first lookup."""
+
+    def __init__(
+        self, name: str, load: Callable[[], list[click.Command]], **kwargs: Any
+    ) -> None:
+        super().__init__(name, **kwargs)
+        self._load: Callable[[], list[click.Command]] | None = load
+
+    def _ensure_loaded(self) -> None:
+        if self._load is not None:
+            load, self._load = self._load, None
+            for command in load():
+                self.add_command(command)
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        self._ensure_loaded()
+        return super().list_commands(ctx)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        self._ensure_loaded()
+        return super().get_command(ctx, cmd_name)
+
+
+class LazyCommand(click.Command):
+    """Command whose options and callback are built on first use."""
+
+    def __init__(
+        self, name: str, load: Callable[[], click.Command], **kwargs: Any
+    ) -> None:
+        super().__init__(name, **kwargs)
+        self._load = load
+        self._command: click.Command | None = None
+
+    def _loaded(self) -> click.Command:
+        if self._command is None:
+            self._command = self._load()
+        return self._command
+
+    def get_params(self, ctx: click.Context) -> list[click.Parameter]:
+        return self._loaded().get_params(ctx)
+
+    def invoke(self, ctx: click.Context) -> Any:
+        return self._loaded().invoke(ctx)
+
+
+# ---------------------------------------------------------------------------
+# Batch parsing
+# ---------------------------------------------------------------------------
+
+
+def parse_batch(lines: Iterable[str]) -> Iterator[tuple[int, list[str]]]:
+    """Yield ``(line number, argv)`` for each command in a batch.
+
+    One command per line, quoted as for a POSIX shell and without the
+    leading ``practice``. Blank lines and ``#`` comments are skipped.
+    """
+    for lineno, line in enumerate(lines, start=1):
+        try:
+            argv = shlex.split(line, comments=True)
+        except ValueError as exc:
+            raise click.UsageError(f"line {lineno}: {exc}") from exc
+        if argv:
+            yield lineno, argv
+
+
+def parse_null_batch(data: str) -> Iterator[tuple[int, list[str]]]:
+    """Yield ``(command number, argv)`` from count-prefixed, NUL-terminated input.
+
+    Every field is terminated by a NUL. A command is its argument
+    count followed by that many arguments, which is what
+    ``printf '%s\\0' "${#cmd[@]}" "${cmd[@]}"`` writes for a bash array.
+    No quoting is involved, so arguments may hold any text, including
+    nothing at all.
+    """
+    fields = data.split("\0")
+    if fields[-1]:
+        raise click.UsageError("NUL batch: last field is not NUL-terminated")
+    fields.pop()
+    pos = 0
+    number = 0
+    while pos < len(fields):
+        number += 1
+        if not fields[pos].isdigit() or int(fields[pos]) == 0:
+            raise click.UsageError(
+                f"command {number}: expected an argument count, got {fields[pos]!r}"
+            )
+        count = int(fields[pos])
+        argv = fields[pos + 1 : pos + 1 + count]
+        if len(argv) < count:
+            raise click.UsageError(
+                f"command {number}: expected {count} arguments, got {len(argv)}"
+            )
+        pos += 1 + count
+        yield number, argv
+
+
+# ---------------------------------------------------------------------------
+# Commands
+# ---------------------------------------------------------------------------
+
+
+@click.command("run-batch")
+@click.option(
+    "--file",
+    "batch",
+    type=click.File("r"),
+    default="-",
+    show_default=True,
+    help="File of commands, one per line; '-' reads standard input.",
+)
+@click.option(
+    "-0",
+    "--null",
+    is_flag=True,
+    help="Each command is an argument count then its arguments, all NUL-terminated.",
+)
+@click.pass_context
+def run_batch(ctx: click.Context, batch, null: bool) -> None:
+    """Run several practice commands in one process, stopping at the first failure."""
+    root = ctx.find_root()
+    group = root.command
+    unit = "command" if null else "line"
+    commands = list(parse_null_batch(batch.read()) if null else parse_batch(batch))
+    for lineno, argv in commands:
+        if argv[0] == ctx.info_name:
+            raise click.UsageError(f"{unit} {lineno}: run-batch cannot be nested")
+
+    for lineno, argv in commands:
+        code = _invoke_in(root, group, argv)
+        if code:
+            click.echo(
+                f"run-batch: {unit} {lineno} failed: {shlex.join(argv)}", err=True
+            )
+            ctx.exit(code)
+
+
+def _invoke_in(root: click.Context, group: click.Group, argv: list[str]) -> int:
+    """Run one command under the already-initialised root context.
+
+    The root callback (environment resolution) is not run again: the
+    command's context is a child of *root* and shares its ``obj``.
+    Returns the exit code.
+    """
+    try:
+        name, command, args = group.resolve_command(root, argv)
+        with command.make_context(name, args, parent=root) as sub:
+            command.invoke(sub)
+    except click.ClickException as exc:
+        exc.show()
+        return exc.exit_code
+    except click.exceptions.Exit as exc:
+        return exc.exit_code
+    except click.Abort:
+        return 1
+    return 0
+
+
+def register_commands(cli: click.Group) -> None:
+    """Register the shared commands on the given CLI group."""
+    cli.add_command(run_batch)
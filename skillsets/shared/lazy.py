@@ -0,0 +1,31 @@
+"""Package attributes built on first access.
+
+Every practice invocation imports every bounded-context package, so a
+package defers building its ``SKILLSETS`` (and importing the models
+behind them) until something reads the attribute. ``lazy_skillsets``
+returns the PEP 562 module ``__getattr__`` that does this::
+
+    __getattr__ = lazy_skillsets(__name__, _skillsets)
+
+The built list is stored on the module, so later reads are ordinary
+attribute lookups and always return the same list.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_skillsets(module_name: str, build: Callable[[], Any]) -> Callable[[str], Any]:
+    """Module ``__getattr__`` that builds ``SKILLSETS`` with *build* once."""
+
+    def __getattr__(name: str) -> Any:
+        if name == "SKILLSETS":
+            value = build()
+            setattr(sys.modules[module_name], name, value)
+            return value
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    return __getattr__
@@ -0,0 +1,61 @@
+"""Page bodies loaded on demand.
+
+Presenters that stream their sections hand out ``LazyContentPage``
+objects: every field of a ``ContentPage`` except the markdown body,
+plus a loader bound to the file (or files) the body comes from. The
+writer calls ``load_page`` just before it writes each page, so only
+the page being written has its body in memory, however many projects
+and pages a client has.
+
+``load_section`` resolves a whole section, for callers such as
+``present`` that return an ordinary contribution.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+
+from pydantic import Field
+
+from practice.content import ContentPage, ProjectSection
+
+BodyLoader = Callable[[], str]
+
+
+class LazyContentPage(ContentPage):
+    """A ContentPage whose ``body_md`` is read when the page is loaded."""
+
+    loader: BodyLoader = Field(exclude=True, repr=False)
+
+    def load(self) -> ContentPage:
+        fields = {name: getattr(self, name) for name in ContentPage.model_fields}
+        fields["body_md"] = self.loader()
+        return ContentPage(**fields)
+
+
+def file_body(path: Path) -> BodyLoader:
+    """Loader for a markdown file; a missing file loads as empty text."""
+
+    def load() -> str:
+        return path.read_text() if path.is_file() else ""
+
+    return load
+
+
+def load_page(page: ContentPage) -> ContentPage:
+    """The page with its body read, if it was lazy."""
+    return page.load() if isinstance(page, LazyContentPage) else page
+
+
+def load_section(section: ProjectSection) -> ProjectSection:
+    """The section with every page body read, grouped pages included."""
+    return section.model_copy(
+        update={
+            "pages": [load_page(p) for p in section.pages],
+            "groups": [
+                g.model_copy(update={"pages": [load_page(p) for p in g.pages]})
+                for g in section.groups
+            ],
+        }
+    )
@@ -0,0 +1,211 @@
+"""Batch presentation of a client's projects.
+
+Each bounded context exposes ``PRESENTER_FACTORY``: a single
+``(skillset, factory)`` pair or a list of them. ``load_presenters``
+builds one presenter per distinct factory, and ``present_all`` runs
+every project of a client through its presenter on a thread pool.
+
+Presenting is dominated by file reads and renderer subprocesses, so
+threads overlap the waiting: a client site takes roughly as long as
+its slowest project rather than the sum of all of them. Results come
+back in the order the projects were given, whatever order they
+finished in.
+
+``present_all`` holds every contribution in memory at once. For very
+large clients, ``stream_all`` presents projects one after another and
+hands each section to a writer as soon as it is assembled. Streamed
+pages may be ``LazyContentPage`` (see ``shared.pages``); a writer that
+calls ``load_page`` as it writes each page holds one page body at a
+time however many projects there are. Every bounded-context presenter
+provides ``stream``; a presenter without it is presented whole and its
+sections handed over one by one.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import ModuleType
+from typing import Protocol
+
+from pydantic import BaseModel
+
+from practice.content import ProjectContribution, ProjectSection
+from practice.entities import Project
+
+logger = logging.getLogger(__name__)
+
+
+class ProjectPresenter(Protocol):
+    def present(self, project: Project) -> ProjectContribution: ...
+
+
+class StreamingPresenter(Protocol):
+    def stream(
+        self, project: Project
+    ) -> tuple[ProjectContribution, Iterator[ProjectSection]]: ...
+
+
+PresenterFactory = Callable[[Path, Path], ProjectPresenter]
+SectionWriter = Callable[[ProjectContribution, ProjectSection], None]
+
+
+def load_presenters(
+    packages: Iterable[ModuleType],
+    workspace_root: Path,
+    repo_root: Path,
+) -> dict[str, ProjectPresenter]:
+    """Instantiate the presenters declared by BC packages, keyed by skillset.
+
+    Skillsets that share a factory share one presenter instance, so
+    per-presenter state (render caches, batch renderers) is reused.
+    """
+    presenters: dict[str, ProjectPresenter] = {}
+    built: dict[PresenterFactory, ProjectPresenter] = {}
+    for package in packages:
+        declared = getattr(package, "PRESENTER_FACTORY", None)
+        if declared is None:
+            continue
+        pairs = [declared] if isinstance(declared, tuple) else declared
+        for skillset, factory in pairs:
+            if factory not in built:
+                built[factory] = factory(workspace_root, repo_root)
+            presenters[skillset] = built[factory]
+    return presenters
+
+
+class PresentOutcome(BaseModel):
+    """Result and timing for one presented project."""
+
+    slug: str
+    skillset: str
+    seconds: float
+    contribution: ProjectContribution | None = None
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return not self.error
+
+
+class PresentReport(BaseModel):
+    """Per-project outcomes of a batch, in submission order."""
+
+    outcomes: list[PresentOutcome] = []
+    wall_seconds: float = 0.0
+
+    @property
+    def contributions(self) -> list[ProjectContribution]:
+        return [o.contribution for o in self.outcomes if o.contribution is not None]
+
+    @property
+    def failures(self) -> list[PresentOutcome]:
+        return [o for o in self.outcomes if not o.ok]
+
+    @property
+    def seconds(self) -> float:
+        """Sum of per-project times: what a sequential run would take."""
+        return sum(o.seconds for o in self.outcomes)
+
+
+def present_all(
+    projects: Sequence[Project],
+    presenters: Mapping[str, ProjectPresenter],
+    max_workers: int | None = None,
+) -> PresentReport:
+    """Present every project concurrently; one failure does not stop the rest.
+
+    Whatever a presenter raises for a project is recorded as that
+    project's error. ``max_workers`` defaults to the CPU count; it
+    bounds projects, not renders, which each presenter bounds itself
+    across all the projects it presents.
+    """
+    if not projects:
+        return PresentReport()
+    workers = min(max_workers or os.cpu_count() or 1, len(projects))
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        outcomes = list(pool.map(lambda p: _present_one(presenters, p), projects))
+    return PresentReport(outcomes=outcomes, wall_seconds=time.perf_counter() - start)
+
+
+def _present_one(
+    presenters: Mapping[str, ProjectPresenter], project: Project
+) -> PresentOutcome:
+    start = time.perf_counter()
+    contribution = None
+    error = ""
+    presenter = presenters.get(project.skillset)
+    if presenter is None:
+        error = f"No presenter for skillset: {project.skillset}"
+    else:
+        try:
+            contribution = presenter.present(project)
+        except Exception as exc:
+            logger.exception("Presenting %s failed", project.slug)
+            error = f"{type(exc).__name__}: {exc}"
+    return PresentOutcome(
+        slug=project.slug,
+        skillset=project.skillset,
+        seconds=time.perf_counter() - start,
+        contribution=contribution,
+        error=error,
+    )
+
+
+def stream_sections(
+    presenter: ProjectPresenter, project: Project
+) -> tuple[ProjectContribution, Iterator[ProjectSection]]:
+    """A project's contribution without sections, and its sections lazily."""
+    stream = getattr(presenter, "stream", None)
+    if stream is not None:
+        return stream(project)
+    contribution = presenter.present(project)
+    return (
+        contribution.model_copy(update={"sections": []}),
+        iter(contribution.sections),
+    )
+
+
+def stream_all(
+    projects: Iterable[Project],
+    presenters: Mapping[str, ProjectPresenter],
+    write: SectionWriter,
+) -> PresentReport:
+    """Present projects one at a time, writing each section as it is produced.
+
+    ``write`` receives the section-less contribution (for the project's
+    title, status and hero figure) and one section, whose pages it
+    resolves with ``shared.pages.load_page`` as it writes them. Nothing
+    is kept after it returns: outcomes carry timings and errors but no
+    contributions. A failure stops that project only.
+    """
+    start = time.perf_counter()
+    outcomes: list[PresentOutcome] = []
+    for project in projects:
+        project_start = time.perf_counter()
+        error = ""
+        presenter = presenters.get(project.skillset)
+        if presenter is None:
+            error = f"No presenter for skillset: {project.skillset}"
+        else:
+            try:
+                contribution, sections = stream_sections(presenter, project)
+                for section in sections:
+                    write(contribution, section)
+            except Exception as exc:
+                logger.exception("Presenting %s failed", project.slug)
+                error = f"{type(exc).__name__}: {exc}"
+        outcomes.append(
+            PresentOutcome(
+                slug=project.slug,
+                skillset=project.skillset,
+                seconds=time.perf_counter() - project_start,
+                error=error,
+            )
+        )
+    return PresentReport(outcomes=outcomes, wall_seconds=time.perf_counter() - start)
@@ -0,0 +1,243 @@
+"""Incremental writing of a client's rendered site.
+
+Rendering a client site used to rewrite every page of every project,
+even when one ``analysis.md`` had changed. ``IncrementalSiteWriter``
+keeps an index (``.site-index.json`` in the site directory) of the
+hash of each page's inputs. The site renderer behind
+``bin/render-site.sh`` passes every content page through
+``write_page`` (and any other file, such as a project's index page,
+through ``write_file``); only files whose inputs differ are rendered
+and written. ``finish`` deletes pages that were not produced this
+time, works out which projects changed from the hashes of their
+pages, and saves the index.
+
+Pages are hashed as they are written, so the writer works the same
+whether a renderer has whole contributions or sections streamed by
+``shared.presentation.stream_all``. Inputs are hashed with
+``InputHasher``: markdown is hashed as text, and each SVG string is
+digested once per run, so a map shown on many pages (or in many
+projects) is hashed once. Lazy pages (see ``shared.pages``) are loaded
+one at a time to hash and write them.
+
+The index records the renderer's version. A renderer passes a new
+``renderer_version`` whenever its templates or output change, and the
+next run then writes every page again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+from practice.content import ContentPage, Figure, ProjectContribution
+from shared.pages import load_page
+from bin.cli.infrastructure.json_store import write_json_object
+
+SITE_INDEX = ".site-index.json"
+SITE_INDEX_VERSION = 3
+
+
+class InputHasher:
+    """SHA-256 digests of page inputs."""
+
+    def __init__(self) -> None:
+        # id(svg) -> (svg, digest); holding svg keeps the id valid
+        self._svgs: dict[int, tuple[str, str]] = {}
+
+    def svg(self, content: str) -> str:
+        cached = self._svgs.get(id(content))
+        if cached is not None and cached[0] is content:
+            return cached[1]
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        self._svgs[id(content)] = (content, digest)
+        return digest
+
+    def page(self, *markdown: str, figures: Iterable[Figure] = ()) -> str:
+        """Digest of a page's markdown parts and figures, in order."""
+        h = hashlib.sha256()
+        for part in markdown:
+            h.update(hashlib.sha256(part.encode("utf-8")).digest())
+        for figure in figures:
+            h.update(figure.caption.encode("utf-8") + b"\0")
+            h.update(self.svg(figure.svg_content).encode("ascii"))
+        return h.hexdigest()
+
+    def content_page(self, page: ContentPage) -> str:
+        """Digest of a content page, loading its body if it is lazy."""
+        page = load_page(page)
+        return self.page(page.title, page.slug, page.body_md, figures=page.figures)
+
+    def project(self, contribution: ProjectContribution) -> str:
+        """Digest of a project's own fields: title, status, hero figure.
+
+        Sections are left out; their pages are hashed one by one as
+        they are written, and a streamed contribution has none.
+        """
+        h = hashlib.sha256()
+        for name in type(contribution).model_fields:
+            if name != "sections":
+                h.update(name.encode("utf-8") + b"\0")
+                self._update(h, getattr(contribution, name))
+        return h.hexdigest()
+
+    def _update(self, h: Any, value: object) -> None:
+        if isinstance(value, ContentPage):
+            h.update(self.content_page(value).encode("ascii"))
+        elif isinstance(value, Figure):
+            h.update(self.page(figures=[value]).encode("ascii"))
+        elif isinstance(value, BaseModel):
+            for name in type(value).model_fields:
+                h.update(name.encode("utf-8") + b"\0")
+                self._update(h, getattr(value, name))
+        elif isinstance(value, list):
+            h.update(f"[{len(value)}\0".encode("ascii"))
+            for item in value:
+                self._update(h, item)
+        else:
+            h.update(json.dumps(value).encode("utf-8") + b"\0")
+
+
+class SiteWriteReport(BaseModel):
+    """Pages a render wrote, skipped and removed, and the projects that changed.
+
+    Pages are site-relative paths; projects are slugs, including
+    projects that are new or were removed.
+    """
+
+    written: list[str] = []
+    skipped: list[str] = []
+    removed: list[str] = []
+    changed: list[str] = []
+
+
+class IncrementalSiteWriter:
+    """Writes site pages whose inputs changed and removes orphaned ones."""
+
+    def __init__(
+        self,
+        site_dir: Path,
+        renderer_version: str = "",
+        hasher: InputHasher | None = None,
+    ) -> None:
+        self.site_dir = site_dir
+        self.renderer_version = renderer_version
+        self.hasher = hasher or InputHasher()
+        data = self._load()
+        self._old_pages: dict[str, dict[str, str]] = data.get("pages", {})
+        self._pages: dict[str, dict[str, str]] = {}
+        self._report = SiteWriteReport()
+
+    def _load(self) -> dict:
+        try:
+            data = json.loads((self.site_dir / SITE_INDEX).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != SITE_INDEX_VERSION
+            or data.get("renderer") != self.renderer_version
+        ):
+            return {}
+        return data
+
+    # -- pages -------------------------------------------------------------
+
+    def write_page(
+        self,
+        rel: str,
+        page: ContentPage,
+        render: Callable[[ContentPage], str],
+        project: str,
+    ) -> bool:
+        """Render and write *project*'s content *page* to *rel* unless unchanged.
+
+        A lazy page is loaded here, so only the page being written has
+        its body in memory. Returns whether the page was written.
+        """
+        page = load_page(page)
+        return self.write_file(
+            rel, self.hasher.content_page(page), lambda: render(page), project
+        )
+
+    def write_file(
+        self,
+        rel: str,
+        inputs: str,
+        render: Callable[[], str],
+        project: str,
+    ) -> bool:
+        """Render and write *project*'s file *rel* unless *inputs* is unchanged.
+
+        Returns whether the file was written.
+        """
+        path = self.site_dir / rel
+        self._pages[rel] = {"hash": inputs, "project": project}
+        old = self._old_pages.get(rel)
+        if old is not None and old.get("hash") == inputs and path.is_file():
+            self._report.skipped.append(rel)
+            return False
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(render(), encoding="utf-8")
+        os.replace(tmp, path)
+        self._report.written.append(rel)
+        return True
+
+    def finish(self) -> SiteWriteReport:
+        """Delete pages not produced this render and save the index.
+
+        A project changed if any of its pages was added, edited or
+        removed since the last render.
+        """
+        projects = self._project_digests(self._pages)
+        old_projects = self._project_digests(self._old_pages)
+        self._report.changed = sorted(
+            slug
+            for slug in set(projects) | set(old_projects)
+            if projects.get(slug) != old_projects.get(slug)
+        )
+        for rel in sorted(set(self._old_pages) - set(self._pages)):
+            path = self.site_dir / rel
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            self._report.removed.append(rel)
+            self._prune(path.parent)
+        index = self.site_dir / SITE_INDEX
+        tmp = index.with_name(f".{index.name}.{os.getpid()}.tmp")
+        write_json_object(
+            tmp,
+            {
+                "version": SITE_INDEX_VERSION,
+                "renderer": self.renderer_version,
+                "pages": self._pages,
+            },
+        )
+        os.replace(tmp, index)
+        return self._report
+
+    @staticmethod
+    def _project_digests(pages: dict[str, dict[str, str]]) -> dict[str, str]:
+        """Digest of each project's page paths and input hashes."""
+        hashes: dict[str, Any] = {}
+        for rel in sorted(pages):
+            entry = pages[rel]
+            h = hashes.setdefault(entry.get("project", ""), hashlib.sha256())
+            h.update(f"{rel}\0{entry.get('hash', '')}\0".encode())
+        return {slug: h.hexdigest() for slug, h in hashes.items()}
+
+    def _prune(self, directory: Path) -> None:
+        """Remove directories emptied by page deletion, up to the site root."""
+        while directory != self.site_dir and directory.is_relative_to(self.site_dir):
+            try:
+                directory.rmdir()
+            except OSError:
+                return
+            directory = directory.parent
@@ -0,0 +1,229 @@
+"""Tests for the lazily built commands and run-batch."""
+
+from __future__ import annotations
+
+import subprocess
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from shared.cli import (
+    LazyCommand,
+    LazyGroup,
+    parse_batch,
+    parse_null_batch,
+    register_commands,
+)
+
+
+def _root(*commands: click.Command) -> click.Group:
+    @click.group()
+    def practice():
+        pass
+
+    for command in commands:
+        practice.add_command(command)
+    return practice
+
+
+def _greet() -> click.Command:
+    @click.command("greet")
+    @click.option("--name", required=True)
+    def greet(name: str) -> None:
+        click.echo(f"hello {name}")
+
+    return greet
+
+
+class TestLazyCommand:
+    def test_not_built_to_list_commands(self):
+        loads = []
+        command = LazyCommand(
+            "greet", lambda: loads.append(1) or _greet(), help="Say hello."
+        )
+        result = CliRunner().invoke(_root(command), ["--help"])
+        assert "greet  Say hello." in result.output
+        assert loads == []
+
+    def test_options_and_callback_from_built_command(self):
+        command = LazyCommand("greet", _greet)
+        runner = CliRunner()
+        result = runner.invoke(_root(command), ["greet", "--name", "acme"])
+        assert result.output == "hello acme\n"
+        result = runner.invoke(_root(command), ["greet", "--help"])
+        assert "--name" in result.output
+        assert runner.invoke(_root(command), ["greet"]).exit_code == 2
+
+
+class TestLazyGroup:
+    def test_subcommands_built_on_first_lookup(self):
+        loads = []
+        group = LazyGroup("people", lambda: loads.append(1) or [_greet()])
+        practice = _root(group)
+        assert "people" in CliRunner().invoke(practice, ["--help"]).output
+        assert loads == []
+        result = CliRunner().invoke(practice, ["people", "greet", "--name", "x"])
+        assert result.output == "hello x\n"
+        assert loads == [1]
+
+
+@pytest.fixture
+def practice():
+    """A stand-in root CLI that records how many times it started."""
+    calls: list[tuple[str, ...]] = []
+
+    @click.group()
+    @click.pass_context
+    def cli(ctx):
+        ctx.ensure_object(dict).setdefault("starts", 0)
+        ctx.obj["starts"] += 1
+
+    @cli.command()
+    @click.option("--title")
+    @click.option("--field", multiple=True)
+    def record(title, field):
+        calls.append(("record", title, *field))
+
+    @cli.command()
+    @click.option("--status", required=True)
+    def advance(status):
+        calls.append(("advance", status))
+
+    @cli.command()
+    def fail():
+        raise click.ClickException("no such project")
+
+    register_commands(cli)
+    return cli, calls
+
+
+def _nul(*fields: str) -> str:
+    return "".join(f"{f}\0" for f in fields)
+
+
+class TestParseBatch:
+    def test_shell_quoting_and_comments(self):
+        lines = [
+            "# gate\n",
+            "\n",
+            "record --title 'Stage 5: agreed' --field Notes=two\\ words\n",
+        ]
+        assert list(parse_batch(lines)) == [
+            (3, ["record", "--title", "Stage 5: agreed", "--field", "Notes=two words"])
+        ]
+
+    def test_unbalanced_quote_is_usage_error(self):
+        with pytest.raises(click.UsageError, match="line 1"):
+            list(parse_batch(["record --title 'open\n"]))
+
+
+class TestParseNullBatch:
+    def test_count_prefixed_commands(self):
+        data = _nul("3", "record", "--title", "it's $5 \u2014 done")
+        data += _nul("3", "advance", "--status", "x")
+        assert list(parse_null_batch(data)) == [
+            (1, ["record", "--title", "it's $5 \u2014 done"]),
+            (2, ["advance", "--status", "x"]),
+        ]
+
+    def test_empty_argument_kept(self):
+        assert list(parse_null_batch("3\0record\0--field\0\0")) == [
+            (1, ["record", "--field", ""])
+        ]
+
+    def test_truncated_command_is_usage_error(self):
+        with pytest.raises(click.UsageError, match="expected 3 arguments, got 2"):
+            list(parse_null_batch("3\0advance\0--status\0"))
+
+    def test_missing_count_is_usage_error(self):
+        with pytest.raises(click.UsageError, match="expected an argument count"):
+            list(parse_null_batch("advance\0--status\0x\0"))
+
+    def test_unterminated_field_is_usage_error(self):
+        with pytest.raises(click.UsageError, match="not NUL-terminated"):
+            list(parse_null_batch("1\0advance"))
+
+    def test_bash_printf_round_trip(self):
+        script = (
+            'record=(record --field "$1" --field ""); '
+            "advance=(advance --status done); "
+            'printf \'%s\\0\' "${#record[@]}" "${record[@]}" '
+            '"${#advance[@]}" "${advance[@]}"'
+        )
+        value = "Notes=line one\nline 'two' & $HOME"
+        out = subprocess.run(
+            ["bash", "-c", script, "bash", value],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        assert list(parse_null_batch(out)) == [
+            (1, ["record", "--field", value, "--field", ""]),
+            (2, ["advance", "--status", "done"]),
+        ]
+
+
+class TestRunBatch:
+    def test_runs_commands_in_order(self, practice):
+        cli, calls = practice
+        batch = "record --title Agreed --field A=1 --field B=2\nadvance --status done\n"
+        result = CliRunner().invoke(cli, ["run-batch"], input=batch, obj={})
+        assert result.exit_code == 0, result.output
+        assert calls == [("record", "Agreed", "A=1", "B=2"), ("advance", "done")]
+
+    def test_root_callback_runs_once(self, practice):
+        cli, calls = practice
+        obj: dict = {}
+        batch = "advance --status a\nadvance --status b\nadvance --status c\n"
+        result = CliRunner().invoke(cli, ["run-batch"], input=batch, obj=obj)
+        assert result.exit_code == 0, result.output
+        assert len(calls) == 3
+        assert obj["starts"] == 1
+
+    def test_unknown_command_stops_batch(self, practice):
+        cli, calls = practice
+        batch = "advance --status a\nnope\nadvance --status b\n"
+        result = CliRunner().invoke(cli, ["run-batch"], input=batch, obj={})
+        assert result.exit_code == 2
+        assert calls == [("advance", "a")]
+        assert "line 2 failed" in result.output
+
+    def test_stops_at_first_failure(self, practice):
+        cli, calls = practice
+        batch = "advance --status a\nfail\nadvance --status b\n"
+        result = CliRunner().invoke(cli, ["run-batch"], input=batch, obj={})
+        assert result.exit_code == 1
+        assert calls == [("advance", "a")]
+        assert "no such project" in result.output
+        assert "line 2 failed" in result.output
+
+    def test_usage_error_stops_batch(self, practice):
+        cli, calls = practice
+        batch = "advance\nrecord --title never\n"
+        result = CliRunner().invoke(cli, ["run-batch"], input=batch, obj={})
+        assert result.exit_code == 2
+        assert calls == []
+
+    def test_nested_batch_rejected(self, practice):
+        cli, calls = practice
+        batch = "advance --status a\nrun-batch\n"
+        result = CliRunner().invoke(cli, ["run-batch"], input=batch, obj={})
+        assert result.exit_code == 2
+        assert calls == []
+
+    def test_reads_file(self, practice, tmp_path):
+        cli, calls = practice
+        path = tmp_path / "batch.txt"
+        path.write_text("advance --status done\n")
+        result = CliRunner().invoke(cli, ["run-batch", "--file", str(path)], obj={})
+        assert result.exit_code == 0, result.output
+        assert calls == [("advance", "done")]
+
+    def test_null_separated_input(self, practice):
+        cli, calls = practice
+        batch = _nul("3", "record", "--field", "a b\nc")
+        batch += _nul("3", "advance", "--status", "done")
+        result = CliRunner().invoke(cli, ["run-batch", "-0"], input=batch, obj={})
+        assert result.exit_code == 0, result.output
+        assert calls == [("record", None, "a b\nc"), ("advance", "done")]
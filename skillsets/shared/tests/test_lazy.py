@@ -0,0 +1,32 @@
+"""Tests for package attributes built on first access."""
+
+from __future__ import annotations
+
+import sys
+import types
+
+import pytest
+
+from shared.lazy import lazy_skillsets
+
+
+@pytest.fixture
+def module(monkeypatch):
+    module = types.ModuleType("demo_bc")
+    monkeypatch.setitem(sys.modules, "demo_bc", module)
+    return module
+
+
+class TestLazySkillsets:
+    def test_built_once_on_first_access(self, module):
+        calls = []
+        module.__getattr__ = lazy_skillsets("demo_bc", lambda: calls.append(1) or [])
+        assert "SKILLSETS" not in vars(module)
+        first = module.SKILLSETS
+        assert module.SKILLSETS is first
+        assert calls == [1]
+
+    def test_other_names_raise(self, module):
+        module.__getattr__ = lazy_skillsets("demo_bc", list)
+        with pytest.raises(AttributeError, match="'demo_bc' has no attribute 'X'"):
+            module.X  # noqa: B018
@@ -0,0 +1,55 @@
+"""Tests for lazily loaded page bodies."""
+
+from __future__ import annotations
+
+from practice.content import ContentPage, Figure, PageGroup, ProjectSection
+from shared.pages import LazyContentPage, file_body, load_page, load_section
+
+
+def _lazy(tmp_path, name="brief.md", text="# Brief\n"):
+    path = tmp_path / name
+    path.write_text(text)
+    return LazyContentPage(title="Brief", slug="brief", loader=file_body(path))
+
+
+class TestLazyContentPage:
+    def test_body_read_on_load(self, tmp_path):
+        page = _lazy(tmp_path)
+        assert page.body_md == ""
+        (tmp_path / "brief.md").write_text("# Edited\n")
+        assert page.load().body_md == "# Edited\n"
+
+    def test_load_keeps_other_fields(self, tmp_path):
+        page = _lazy(tmp_path).model_copy(
+            update={"figures": [Figure(caption="c", svg_content="<svg/>")]}
+        )
+        loaded = page.load()
+        assert type(loaded) is ContentPage
+        assert (loaded.title, loaded.slug) == ("Brief", "brief")
+        assert loaded.figures == [Figure(caption="c", svg_content="<svg/>")]
+
+    def test_loader_not_serialised(self, tmp_path):
+        assert "loader" not in _lazy(tmp_path).model_dump()
+
+    def test_missing_file_loads_empty(self, tmp_path):
+        assert file_body(tmp_path / "gone.md")() == ""
+
+
+class TestLoad:
+    def test_plain_page_unchanged(self):
+        page = ContentPage(title="T", slug="t", body_md="x")
+        assert load_page(page) is page
+
+    def test_section_pages_and_groups(self, tmp_path):
+        section = ProjectSection(
+            label="Atlas",
+            slug="atlas",
+            pages=[_lazy(tmp_path)],
+            groups=[
+                PageGroup(label="G", slug="g", pages=[_lazy(tmp_path, "g.md", "G")])
+            ],
+        )
+        loaded = load_section(section)
+        assert loaded.pages[0].body_md == "# Brief\n"
+        assert loaded.groups[0].pages[0].body_md == "G"
+        assert not isinstance(loaded.groups[0].pages[0], LazyContentPage)
@@ -0,0 +1,273 @@
+"""Tests for concurrent and streaming batch presentation."""
+
+from __future__ import annotations
+
+import threading
+import time
+import tracemalloc
+from datetime import date
+from pathlib import Path
+
+
+import business_model_canvas
+import competitive_analysis
+import skillset_engineering
+import test_method
+import wardley_mapping
+from practice.content import ContentPage, ProjectContribution, ProjectSection
+from practice.entities import Project, ProjectStatus
+from shared.pages import load_page
+from shared.presentation import (
+    load_presenters,
+    present_all,
+    stream_all,
+)
+from wardley_mapping.infrastructure import JsonTourManifestRepository
+from wardley_mapping.presenter import WardleyProjectPresenter
+
+CLIENT = "test-corp"
+
+
+def _project(slug: str, skillset: str = "fake") -> Project:
+    return Project(
+        slug=slug,
+        client=CLIENT,
+        engagement="strat-1",
+        skillset=skillset,
+        status=ProjectStatus.ELABORATION,
+        created=date(2025, 6, 1),
+    )
+
+
+class SleepyPresenter:
+    """Presents after a per-project delay, tracking peak concurrency."""
+
+    def __init__(self, delays: dict[str, float]) -> None:
+        self._delays = delays
+        self._lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def present(self, project: Project) -> ProjectContribution:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self._delays.get(project.slug, 0.0))
+        with self._lock:
+            self.active -= 1
+        if project.slug == "broken":
+            raise ValueError("bad manifest")
+        return ProjectContribution(
+            slug=project.slug,
+            title=project.slug,
+            skillset=project.skillset,
+            status=project.status.value,
+            hero_figure=None,
+            overview_md="",
+            sections=[],
+        )
+
+
+class TestPresentAll:
+    def test_empty(self):
+        assert present_all([], {}).outcomes == []
+
+    def test_results_in_submission_order(self):
+        presenter = SleepyPresenter({"a": 0.05, "b": 0.0, "c": 0.02})
+        projects = [_project(s) for s in ("a", "b", "c")]
+        report = present_all(projects, {"fake": presenter}, max_workers=3)
+        assert [c.slug for c in report.contributions] == ["a", "b", "c"]
+
+    def test_projects_overlap(self):
+        presenter = SleepyPresenter({f"p{i}": 0.05 for i in range(6)})
+        projects = [_project(f"p{i}") for i in range(6)]
+        report = present_all(projects, {"fake": presenter}, max_workers=6)
+        assert presenter.peak > 1
+        assert report.wall_seconds < report.seconds
+
+    def test_workers_bounded(self):
+        presenter = SleepyPresenter({f"p{i}": 0.02 for i in range(8)})
+        projects = [_project(f"p{i}") for i in range(8)]
+        present_all(projects, {"fake": presenter}, max_workers=2)
+        assert presenter.peak <= 2
+
+    def test_failure_isolated(self):
+        presenter = SleepyPresenter({})
+        projects = [_project("ok-1"), _project("broken"), _project("ok-2")]
+        report = present_all(projects, {"fake": presenter})
+        assert [c.slug for c in report.contributions] == ["ok-1", "ok-2"]
+        assert [f.slug for f in report.failures] == ["broken"]
+        assert "bad manifest" in report.failures[0].error
+
+    def test_presenter_bug_isolated(self):
+        class BuggyPresenter:
+            def present(self, project):
+                if project.slug == "b":
+                    raise KeyError("slug")
+                return SleepyPresenter({}).present(project)
+
+        projects = [_project("a"), _project("b"), _project("c")]
+        report = present_all(projects, {"fake": BuggyPresenter()})
+        assert [c.slug for c in report.contributions] == ["a", "c"]
+        assert report.failures[0].error == "KeyError: 'slug'"
+
+    def test_unknown_skillset_reported(self):
+        report = present_all([_project("x", skillset="nope")], {})
+        assert report.failures[0].error == "No presenter for skillset: nope"
+
+
+class TestStreamAll:
+    def test_sections_written_in_order(self):
+        written = []
+        presenter = SleepyPresenter({})
+        report = stream_all(
+            [_project("a"), _project("broken"), _project("b"), _project("x", "nope")],
+            {"fake": presenter},
+            lambda c, s: written.append((c.slug, s.slug)),
+        )
+        assert [o.ok for o in report.outcomes] == [True, False, True, False]
+        assert report.contributions == []
+        assert written == []  # SleepyPresenter contributions have no sections
+
+    def test_non_streaming_presenter_sections_handed_over(self):
+        class OnePage:
+            def present(self, project):
+                return ProjectContribution(
+                    slug=project.slug,
+                    title=project.slug,
+                    skillset=project.skillset,
+                    status=project.status.value,
+                    hero_figure=None,
+                    overview_md="",
+                    sections=[
+                        ProjectSection(label=x, slug=x, description="")
+                        for x in ("atlas", "analysis")
+                    ],
+                )
+
+        written = []
+        stream_all(
+            [_project("a"), _project("b")],
+            {"fake": OnePage()},
+            lambda c, s: written.append((c.slug, s.slug, len(c.sections))),
+        )
+        assert written == [
+            ("a", "atlas", 0),
+            ("a", "analysis", 0),
+            ("b", "atlas", 0),
+            ("b", "analysis", 0),
+        ]
+
+
+# ---------------------------------------------------------------------------
+# Memory benchmark: streaming a large Wardley client
+# ---------------------------------------------------------------------------
+
+VIEWS = 10
+SVG_BYTES = 20_000
+ANALYSIS_BYTES = 5_000
+PEAK_CEILING = 4_000_000
+
+
+def _wardley_client(root: Path, count: int) -> list[Project]:
+    """Synthetic client of Wardley projects with distinct atlas content."""
+    projects = []
+    for n in range(count):
+        slug = f"maps-{n}"
+        proj = root / CLIENT / "engagements" / "strat-1" / slug
+        (proj).mkdir(parents=True)
+        (proj / "brief.agreed.md").write_text(f"# Brief {n}\n\nScope.")
+        for v in range(VIEWS):
+            view = proj / "atlas" / f"view-{v}"
+            view.mkdir(parents=True)
+            (view / "map.svg").write_text(
+                f"<svg><!-- {slug} {v} -->" + "<g/>" * (SVG_BYTES // 4) + "</svg>"
+            )
+            (view / "analysis.md").write_text(f"# View {v}\n\n" + "a" * ANALYSIS_BYTES)
+        projects.append(_project(slug, "wardley-mapping"))
+    return projects
+
+
+def _page_writer(site: Path):
+    def write(contribution: ProjectContribution, section: ProjectSection) -> None:
+        pages: list[ContentPage] = [*section.pages]
+        for group in section.groups:
+            pages.extend(group.pages)
+        out = site / contribution.slug / section.slug
+        out.mkdir(parents=True, exist_ok=True)
+        for page in map(load_page, pages):
+            svgs = "".join(f.svg_content for f in page.figures)
+            (out / f"{page.slug}.html").write_text(f"{page.body_md}{svgs}")
+
+    return write
+
+
+def _streaming_peak(tmp_path: Path, count: int) -> int:
+    root = tmp_path / f"ws-{count}"
+    projects = _wardley_client(root, count)
+    script = tmp_path / "noop-owm.sh"
+    script.write_text("#!/bin/sh\ntrue\n")
+    script.chmod(0o755)
+    presenter = WardleyProjectPresenter(
+        workspace_root=root,
+        ensure_owm_script=script,
+        tours=JsonTourManifestRepository(root),
+    )
+    tracemalloc.start()
+    try:
+        report = stream_all(
+            projects,
+            {"wardley-mapping": presenter},
+            _page_writer(tmp_path / f"site-{count}"),
+        )
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert all(o.ok for o in report.outcomes)
+    assert len(list((tmp_path / f"site-{count}").rglob("*.html"))) >= count * VIEWS
+    return peak
+
+
+class TestStreamingMemory:
+    def test_peak_flat_across_hundred_projects(self, tmp_path):
+        small = _streaming_peak(tmp_path, 10)
+        large = _streaming_peak(tmp_path, 100)
+        content = 100 * VIEWS * (SVG_BYTES + ANALYSIS_BYTES)
+        assert large < PEAK_CEILING < content / 5
+        assert large < small * 1.5
+
+
+class TestLoadPresenters:
+    def test_presenters_from_bc_packages(self, tmp_path):
+        presenters = load_presenters(
+            [wardley_mapping, business_model_canvas, skillset_engineering],
+            workspace_root=tmp_path,
+            repo_root=tmp_path,
+        )
+        assert {"wardley-mapping", "business-model-canvas", "new-skillset"} <= set(
+            presenters
+        )
+
+    def test_every_presenter_streams(self, tmp_path):
+        presenters = load_presenters(
+            [
+                business_model_canvas,
+                competitive_analysis,
+                skillset_engineering,
+                test_method,
+                wardley_mapping,
+            ],
+            workspace_root=tmp_path,
+            repo_root=tmp_path,
+        )
+        assert len(presenters) >= 5
+        assert all(callable(getattr(p, "stream", None)) for p in presenters.values())
+
+    def test_shared_factory_shares_instance(self, tmp_path):
+        presenters = load_presenters(
+            [skillset_engineering], workspace_root=tmp_path, repo_root=tmp_path
+        )
+        assert presenters["new-skillset"] is presenters["refine-skillset"]
+
+    def test_packages_without_factory_skipped(self, tmp_path):
+        assert load_presenters([threading], tmp_path, tmp_path) == {}
@@ -0,0 +1,285 @@
+"""Tests for incremental site writing."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import date
+
+import pytest
+
+from practice.content import ContentPage, Figure, ProjectContribution, ProjectSection
+from practice.entities import Project, ProjectStatus
+from shared.pages import LazyContentPage, file_body
+from shared.presentation import stream_all
+from shared.site import SITE_INDEX, IncrementalSiteWriter
+
+SVG = "<svg xmlns='http://www.w3.org/2000/svg'/>"
+VIEWS = ("overview", "bottlenecks", "movement", "layers", "risk")
+
+
+def _contribution(
+    slug: str, edits: dict[str, str] | None = None
+) -> ProjectContribution:
+    edits = edits or {}
+    return ProjectContribution(
+        slug=slug,
+        title=slug,
+        skillset="wardley-mapping",
+        status="elaboration",
+        hero_figure=Figure(caption="Strategy map", svg_content=SVG),
+        overview_md="",
+        sections=[
+            ProjectSection(
+                label="Atlas",
+                slug="atlas",
+                description="",
+                pages=[
+                    ContentPage(
+                        title=view,
+                        slug=view,
+                        body_md=edits.get(view, f"# {view}\n\nAnalysis."),
+                        figures=[Figure(caption="", svg_content=SVG)],
+                    )
+                    for view in VIEWS
+                ],
+            )
+        ],
+    )
+
+
+def _render(writer: IncrementalSiteWriter, projects: list[ProjectContribution]):
+    """Minimal renderer: one HTML file per content page."""
+    renders = []
+    for c in projects:
+        writer.write_file(
+            f"{c.slug}/index.html",
+            writer.hasher.project(c),
+            lambda c=c: f"<h1>{c.title}</h1>",
+            project=c.slug,
+        )
+        for section in c.sections:
+            for page in section.pages:
+
+                def render(page):
+                    renders.append(page.slug)
+                    return f"<h1>{page.title}</h1>{page.body_md}"
+
+                writer.write_page(
+                    f"{c.slug}/{section.slug}/{page.slug}.html",
+                    page,
+                    render,
+                    project=c.slug,
+                )
+    return writer.finish(), renders
+
+
+class AnalysisPresenter:
+    """Streams one atlas section of lazy pages read from ``{view}/analysis.md``."""
+
+    def __init__(self, root) -> None:
+        self.root = root
+
+    def stream(self, project: Project):
+        contribution = ProjectContribution(
+            slug=project.slug,
+            title=project.slug,
+            skillset=project.skillset,
+            status=project.status.value,
+        )
+        pages = [
+            LazyContentPage(
+                title=view,
+                slug=view,
+                loader=file_body(self.root / project.slug / view / "analysis.md"),
+            )
+            for view in VIEWS
+        ]
+        return contribution, iter(
+            [ProjectSection(label="Atlas", slug="atlas", pages=pages)]
+        )
+
+
+def _stream(writer: IncrementalSiteWriter, root, slugs: list[str]):
+    """Render projects streamed by ``stream_all``, one section at a time."""
+
+    def write(contribution, section):
+        writer.write_file(
+            f"{contribution.slug}/index.html",
+            writer.hasher.project(contribution),
+            lambda: f"<h1>{contribution.title}</h1>",
+            project=contribution.slug,
+        )
+        for page in section.pages:
+            writer.write_page(
+                f"{contribution.slug}/{section.slug}/{page.slug}.html",
+                page,
+                lambda page: page.body_md,
+                project=contribution.slug,
+            )
+
+    projects = [
+        Project(
+            slug=slug,
+            client="test-corp",
+            engagement="strat-1",
+            skillset="wardley-mapping",
+            status=ProjectStatus.ELABORATION,
+            created=date(2025, 6, 1),
+        )
+        for slug in slugs
+    ]
+    stream_all(projects, {"wardley-mapping": AnalysisPresenter(root)}, write)
+    return writer.finish()
+
+
+@pytest.fixture
+def client():
+    return [_contribution(f"maps-{i}") for i in range(1, 41)]
+
+
+class TestIncrementalSiteWriter:
+    def test_first_render_writes_everything(self, tmp_path, client):
+        report, _ = _render(IncrementalSiteWriter(tmp_path), client)
+        assert len(report.written) == 240
+        assert (tmp_path / "maps-7" / "atlas" / "risk.html").is_file()
+        assert (tmp_path / SITE_INDEX).is_file()
+
+    def test_unchanged_client_writes_nothing(self, tmp_path, client):
+        _render(IncrementalSiteWriter(tmp_path), client)
+        report, renders = _render(IncrementalSiteWriter(tmp_path), client)
+        assert report.written == []
+        assert renders == []
+        assert len(report.skipped) == 240
+
+    def test_one_edited_analysis_touches_one_page(self, tmp_path, client):
+        _render(IncrementalSiteWriter(tmp_path), client)
+        page = tmp_path / "maps-12" / "atlas" / "overview.html"
+        before = {p: p.stat().st_mtime_ns for p in tmp_path.rglob("*.html")}
+
+        client[11] = _contribution("maps-12", {"risk": "# risk\n\nRevised."})
+        report, renders = _render(IncrementalSiteWriter(tmp_path), client)
+
+        assert report.written == ["maps-12/atlas/risk.html"]
+        assert renders == ["risk"]
+        after = {p: p.stat().st_mtime_ns for p in tmp_path.rglob("*.html")}
+        changed = [p for p in after if after[p] != before[p]]
+        assert changed == [tmp_path / "maps-12" / "atlas" / "risk.html"]
+        assert page.stat().st_mtime_ns == before[page]
+        assert report.changed == ["maps-12"]
+
+    def test_streamed_edit_rewrites_one_page(self, tmp_path):
+        root = tmp_path / "projects"
+        site = tmp_path / "site"
+        slugs = [f"maps-{i}" for i in range(1, 11)]
+        for slug in slugs:
+            for view in VIEWS:
+                analysis = root / slug / view / "analysis.md"
+                analysis.parent.mkdir(parents=True)
+                analysis.write_text(f"# {view}\n\nAnalysis.")
+        first = _stream(IncrementalSiteWriter(site), root, slugs)
+        assert len(first.written) == 60
+
+        (root / "maps-4" / "risk" / "analysis.md").write_text("# risk\n\nRevised.")
+        report = _stream(IncrementalSiteWriter(site), root, slugs)
+
+        assert report.written == ["maps-4/atlas/risk.html"]
+        assert report.changed == ["maps-4"]
+        assert report.removed == []
+        assert (
+            (site / "maps-4" / "atlas" / "risk.html").read_text().endswith("Revised.")
+        )
+
+    def test_project_metadata_rewrites_its_index_only(self, tmp_path, client):
+        _render(IncrementalSiteWriter(tmp_path), client)
+        client[4] = client[4].model_copy(update={"status": "complete"})
+        report, renders = _render(IncrementalSiteWriter(tmp_path), client)
+        assert report.written == ["maps-5/index.html"]
+        assert renders == []
+        assert report.changed == ["maps-5"]
+
+    def test_removed_pages_and_projects_deleted(self, tmp_path, client):
+        _render(IncrementalSiteWriter(tmp_path), client)
+        trimmed = client[:39]
+        trimmed[0].sections[0].pages.pop()  # maps-1 loses its risk view
+        report, _ = _render(IncrementalSiteWriter(tmp_path), trimmed)
+        assert "maps-1/atlas/risk.html" in report.removed
+        assert sum(r.startswith("maps-40/") for r in report.removed) == 6
+        assert report.changed == ["maps-1", "maps-40"]
+        assert not (tmp_path / "maps-1" / "atlas" / "risk.html").exists()
+        assert not (tmp_path / "maps-40").exists()
+        index = json.loads((tmp_path / SITE_INDEX).read_text())
+        assert not any(r.startswith("maps-40/") for r in index["pages"])
+
+    def test_missing_page_forces_render(self, tmp_path, client):
+        _render(IncrementalSiteWriter(tmp_path), client)
+        (tmp_path / "maps-3" / "atlas" / "layers.html").unlink()
+        report, _ = _render(IncrementalSiteWriter(tmp_path), client)
+        assert report.written == ["maps-3/atlas/layers.html"]
+
+    def test_corrupt_index_renders_everything(self, tmp_path, client):
+        _render(IncrementalSiteWriter(tmp_path), client)
+        (tmp_path / SITE_INDEX).write_text("{not json")
+        report, _ = _render(IncrementalSiteWriter(tmp_path), client)
+        assert len(report.written) == 240
+
+    def test_renderer_version_change_renders_everything(self, tmp_path, client):
+        _render(IncrementalSiteWriter(tmp_path, "templates-1"), client)
+        report, _ = _render(IncrementalSiteWriter(tmp_path, "templates-1"), client)
+        assert report.written == []
+        report, _ = _render(IncrementalSiteWriter(tmp_path, "templates-2"), client)
+        assert len(report.written) == 240
+
+    def test_lazy_pages_loaded_to_hash_and_write(self, tmp_path, client):
+        body = tmp_path / "risk.md"
+        body.write_text("# risk\n\nFrom disk.")
+        site = tmp_path / "site"
+
+        def lazy_risk():
+            c = _contribution("maps-1")
+            pages = c.sections[0].pages
+            pages[-1] = LazyContentPage(
+                title="risk", slug="risk", loader=body.read_text
+            )
+            return [c]
+
+        _render(IncrementalSiteWriter(site), lazy_risk())
+        assert "From disk." in (site / "maps-1" / "atlas" / "risk.html").read_text()
+        body.write_text("# risk\n\nEdited on disk.")
+        report, _ = _render(IncrementalSiteWriter(site), lazy_risk())
+        assert report.written == ["maps-1/atlas/risk.html"]
+
+    def test_shared_svg_hashed_once_across_projects(
+        self, tmp_path, client, monkeypatch
+    ):
+        digested = []
+        real_sha256 = hashlib.sha256
+
+        def counting(data=b""):
+            digested.append(len(data))
+            return real_sha256(data)
+
+        hasher = IncrementalSiteWriter(tmp_path).hasher
+        monkeypatch.setattr(hashlib, "sha256", counting)
+        for contribution in client:
+            hasher.project(contribution)
+            for page in contribution.sections[0].pages:
+                hasher.content_page(page)
+        assert digested.count(len(SVG)) == 1
+
+    def test_shared_svg_hashed_once(self, tmp_path, monkeypatch):
+        digested = []
+        real_sha256 = hashlib.sha256
+
+        def counting(data=b""):
+            digested.append(len(data))
+            return real_sha256(data)
+
+        writer = IncrementalSiteWriter(tmp_path)
+        svg = SVG * 100
+        figures = [Figure(caption="", svg_content=svg)] * 3
+        monkeypatch.setattr(hashlib, "sha256", counting)
+        first = writer.hasher.page("x", figures=figures)
+        second = writer.hasher.page("x", figures=figures)
+        assert first == second
+        assert digested.count(len(svg)) == 1
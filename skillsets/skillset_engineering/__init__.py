@@ -8,8 +8,12 @@ conformance tests that comprise a consulting methodology.
 
 from __future__ import annotations
 
-from practice.discovery import PipelineStage
-from practice.entities import Skillset
+from typing import TYPE_CHECKING
+
+from shared.lazy import lazy_skillsets
+
+if TYPE_CHECKING:
+    from practice.entities import Skillset
 
 
 def _create_presenter(workspace_root, repo_root):
@@ -23,127 +27,156 @@ PRESENTER_FACTORY = [
     ("refine-skillset", _create_presenter),
 ]
 
-SKILLSETS: list[Skillset] = [
-    Skillset(
-        name="new-skillset",
-        display_name="New Skillset",
-        description=(
-            "Meta-methodology for creating new consulting skillsets."
-            " Guides the operator from initial brief through domain research,"
-            " pipeline design, and full implementation — producing a BC package"
-            " that passes all conformance tests, with skill files, bash wrappers,"
-            " and hierarchical semantic bytecode references for token-efficient"
-            " agent operation."
-        ),
-        slug_pattern="skillset-{n}",
-        problem_domain="Practice engineering",
-        value_proposition=(
-            "Systematise the creation of new consulting products so they"
-            " are consistent, discoverable, and conformance-tested from"
-            " the moment they ship."
-        ),
-        deliverables=[
-            "Skillset prospectus or implemented BC package",
-            "Skill files with methodology guides",
-            "Bash script wrappers for CLI operations",
-            "Semantic bytecode reference hierarchy",
-            "Presenter and test infrastructure",
-        ],
-        classification=["meta", "practice-engineering"],
-        evidence=[
-            "Consultamatron conformance test suite",
-            "Existing WM and BMC skillset implementations",
-        ],
-        pipeline=[
-            PipelineStage(
-                order=1,
-                skill="ns-brief",
-                prerequisite_gate="resources/index.md",
-                produces_gate="brief.agreed.md",
-                description="Stage 1: Skillset brief agreed",
-                consumes=["topics", "confidence"],
-            ),
-            PipelineStage(
-                order=2,
-                skill="ns-research",
-                prerequisite_gate="brief.agreed.md",
-                produces_gate="research/synthesis.agreed.md",
-                description="Stage 2: Domain research synthesised",
-                consumes=["scope", "problem_domain"],
-            ),
-            PipelineStage(
-                order=3,
-                skill="ns-design",
-                prerequisite_gate="research/synthesis.agreed.md",
-                produces_gate="design/design.agreed.md",
-                description="Stage 3: Pipeline design agreed",
-                consumes=["methodology", "patterns"],
+
+def register_services(container) -> None:
+    """Register Skillset Engineering services on the DI container."""
+    from skillset_engineering.infrastructure import WorkspaceDirectories
+    from skillset_engineering.usecases import (
+        CheckPipelinesUseCase,
+        CompileSkillContextUseCase,
+        GetNextStageUseCase,
+    )
+
+    container.workspace_layout = WorkspaceDirectories(container.config.workspace_root)
+    container.get_next_stage_usecase = GetNextStageUseCase(
+        projects=container.projects,
+        layout=container.workspace_layout,
+    )
+    container.check_pipelines_usecase = CheckPipelinesUseCase()
+    container.compile_skill_context_usecase = CompileSkillContextUseCase(
+        projects=container.projects,
+        layout=container.workspace_layout,
+    )
+
+
+def _skillsets() -> list[Skillset]:
+    from practice.discovery import PipelineStage
+    from practice.entities import Skillset
+
+    return [
+        Skillset(
+            name="new-skillset",
+            display_name="New Skillset",
+            description=(
+                "Meta-methodology for creating new consulting skillsets."
+                " Guides the operator from initial brief through domain research,"
+                " pipeline design, and full implementation — producing a BC package"
+                " that passes all conformance tests, with skill files, bash wrappers,"
+                " and hierarchical semantic bytecode references for token-efficient"
+                " agent operation."
             ),
-            PipelineStage(
-                order=4,
-                skill="ns-implement",
-                prerequisite_gate="design/design.agreed.md",
-                produces_gate="implementation.agreed.md",
-                description="Stage 4: Implementation complete",
-                consumes=["pipeline", "skills", "gates"],
+            slug_pattern="skillset-{n}",
+            problem_domain="Practice engineering",
+            value_proposition=(
+                "Systematise the creation of new consulting products so they"
+                " are consistent, discoverable, and conformance-tested from"
+                " the moment they ship."
             ),
-        ],
-    ),
-    Skillset(
-        name="refine-skillset",
-        display_name="Refine Skillset",
-        description=(
-            "Iterative quality improvement for existing skillsets."
-            " Assesses a skillset against quality criteria derived from"
-            " usage feedback, conformance results, and domain evolution,"
-            " then plans and executes targeted improvements. Each cycle"
-            " monotonically improves quality — more tokens spent on"
-            " refinement yields higher-quality methodology, regardless"
-            " of evidence volume."
+            deliverables=[
+                "Skillset prospectus or implemented BC package",
+                "Skill files with methodology guides",
+                "Bash script wrappers for CLI operations",
+                "Semantic bytecode reference hierarchy",
+                "Presenter and test infrastructure",
+            ],
+            classification=["meta", "practice-engineering"],
+            evidence=[
+                "Consultamatron conformance test suite",
+                "Existing WM and BMC skillset implementations",
+            ],
+            pipeline=[
+                PipelineStage(
+                    order=1,
+                    skill="ns-brief",
+                    prerequisite_gate="resources/index.md",
+                    produces_gate="brief.agreed.md",
+                    description="Stage 1: Skillset brief agreed",
+                    consumes=["topics", "confidence"],
+                ),
+                PipelineStage(
+                    order=2,
+                    skill="ns-research",
+                    prerequisite_gate="brief.agreed.md",
+                    produces_gate="research/synthesis.agreed.md",
+                    description="Stage 2: Domain research synthesised",
+                    consumes=["scope", "problem_domain"],
+                ),
+                PipelineStage(
+                    order=3,
+                    skill="ns-design",
+                    prerequisite_gate="research/synthesis.agreed.md",
+                    produces_gate="design/design.agreed.md",
+                    description="Stage 3: Pipeline design agreed",
+                    consumes=["methodology", "patterns"],
+                ),
+                PipelineStage(
+                    order=4,
+                    skill="ns-implement",
+                    prerequisite_gate="design/design.agreed.md",
+                    produces_gate="implementation.agreed.md",
+                    description="Stage 4: Implementation complete",
+                    consumes=["pipeline", "skills", "gates"],
+                ),
+            ],
         ),
-        slug_pattern="refine-{n}",
-        problem_domain="Practice engineering",
-        value_proposition=(
-            "Continuously improve consulting methodologies through"
-            " structured assessment and iteration, ensuring skillsets"
-            " stay sharp as domains evolve and usage patterns reveal"
-            " weaknesses."
-        ),
-        deliverables=[
-            "Quality assessment report",
-            "Improvement plan with prioritised changes",
-            "Updated skillset artifacts",
-        ],
-        classification=["meta", "practice-engineering"],
-        evidence=[
-            "Consultamatron conformance test suite",
-            "Feedback from skillset usage",
-        ],
-        pipeline=[
-            PipelineStage(
-                order=1,
-                skill="rs-assess",
-                prerequisite_gate="resources/index.md",
-                produces_gate="assessment.agreed.md",
-                description="Stage 1: Quality assessment agreed",
-                consumes=["topics", "confidence"],
-            ),
-            PipelineStage(
-                order=2,
-                skill="rs-plan",
-                prerequisite_gate="assessment.agreed.md",
-                produces_gate="plan.agreed.md",
-                description="Stage 2: Improvement plan agreed",
-                consumes=["quality_scores", "issues"],
+        Skillset(
+            name="refine-skillset",
+            display_name="Refine Skillset",
+            description=(
+                "Iterative quality improvement for existing skillsets."
+                " Assesses a skillset against quality criteria derived from"
+                " usage feedback, conformance results, and domain evolution,"
+                " then plans and executes targeted improvements. Each cycle"
+                " monotonically improves quality — more tokens spent on"
+                " refinement yields higher-quality methodology, regardless"
+                " of evidence volume."
             ),
-            PipelineStage(
-                order=3,
-                skill="rs-iterate",
-                prerequisite_gate="plan.agreed.md",
-                produces_gate="iteration.agreed.md",
-                description="Stage 3: Iteration complete",
-                consumes=["changes", "acceptance_criteria"],
+            slug_pattern="refine-{n}",
+            problem_domain="Practice engineering",
+            value_proposition=(
+                "Continuously improve consulting methodologies through"
+                " structured assessment and iteration, ensuring skillsets"
+                " stay sharp as domains evolve and usage patterns reveal"
+                " weaknesses."
             ),
-        ],
-    ),
-]
+            deliverables=[
+                "Quality assessment report",
+                "Improvement plan with prioritised changes",
+                "Updated skillset artifacts",
+            ],
+            classification=["meta", "practice-engineering"],
+            evidence=[
+                "Consultamatron conformance test suite",
+                "Feedback from skillset usage",
+            ],
+            pipeline=[
+                PipelineStage(
+                    order=1,
+                    skill="rs-assess",
+                    prerequisite_gate="resources/index.md",
+                    produces_gate="assessment.agreed.md",
+                    description="Stage 1: Quality assessment agreed",
+                    consumes=["topics", "confidence"],
+                ),
+                PipelineStage(
+                    order=2,
+                    skill="rs-plan",
+                    prerequisite_gate="assessment.agreed.md",
+                    produces_gate="plan.agreed.md",
+                    description="Stage 2: Improvement plan agreed",
+                    consumes=["quality_scores", "issues"],
+                ),
+                PipelineStage(
+                    order=3,
+                    skill="rs-iterate",
+                    prerequisite_gate="plan.agreed.md",
+                    produces_gate="iteration.agreed.md",
+                    description="Stage 3: Iteration complete",
+                    consumes=["changes", "acceptance_criteria"],
+                ),
+            ],
+        ),
+    ]
+
+
+__getattr__ = lazy_skillsets(__name__, _skillsets)
@@ -0,0 +1,294 @@
+"""CLI command registration for the Skillset Engineering bounded context.
+
+Registers ``skill-tokens``, which reports token counts for every skill
+file and fails when a semantic bytecode level or ``SKILL.md`` is over
+budget (see ``skillset_engineering.tokens``).
+
+Registers ``skill-references``, which prints the canonical path of
+each reference a skill declares and can first link shared references
+into the skill (see ``skillset_engineering.references``),
+and ``skill-context``, which compiles a skill's references and
+prerequisites for one project into a single context pack in the user's
+cache directory (see ``skillset_engineering.context``). Like the
+``pipeline`` commands it addresses the project with ``--client``,
+``--engagement`` and ``--project`` and is generated from its request
+DTO on first use.
+
+Registers ``skill-fitness``, which evaluates the structural fitness
+predicates over every bounded-context package and prints the fitness
+function table ``rs-assess`` records (see ``skillset_engineering.fitness``).
+
+Registers the ``pipeline`` group over the gate graph of every
+registered skillset (see ``skillset_engineering.gates``): agents ask
+``pipeline next`` at the start of a session which stage a project can
+run, and ``pipeline check`` validates gate continuity. Its subcommands
+are generated from the request DTOs when the group is first used.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import click
+
+from bin.cli.introspect import generate_command
+from shared.cli import LazyCommand, LazyGroup
+
+
+# ---------------------------------------------------------------------------
+# Commands
+# ---------------------------------------------------------------------------
+
+
+@click.command("skill-tokens")
+@click.option(
+    "--tokenizer",
+    "tokenizer_name",
+    default="words",
+    show_default=True,
+    help="Tokenizer: 'words' (fast estimate) or 'tiktoken' (exact, optional).",
+)
+@click.option(
+    "--root",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=None,
+    help="Directory holding the bounded-context packages.",
+)
+@click.option("--files", "show_files", is_flag=True, help="List every file.")
+@click.option("--no-cache", is_flag=True, help="Do not read or write the cache.")
+def skill_tokens(
+    tokenizer_name: str, root: Path | None, show_files: bool, no_cache: bool
+) -> None:
+    """Report token counts for skill files and flag budget violations."""
+    from skillset_engineering.tokens import (
+        SKILLSETS_ROOT,
+        TOKEN_CACHE,
+        TokenCache,
+        analyse,
+        get_tokenizer,
+    )
+
+    root = root or SKILLSETS_ROOT
+    try:
+        tokenizer = get_tokenizer(tokenizer_name)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), param_hint="--tokenizer") from exc
+    cache = TokenCache(None if no_cache else root / TOKEN_CACHE)
+    report = analyse(root, tokenizer, cache)
+
+    width = max((len(s.skill) for s in report.skills), default=5)
+    for skill in report.skills:
+        click.echo(
+            f"{skill.skill:<{width}}  {len(skill.files):>3} files  "
+            f"{skill.tokens:>7} tokens"
+        )
+        if show_files:
+            for f in skill.files:
+                limit = (
+                    f" / {f.token_budget}"
+                    if f.token_budget
+                    else f" ({f.lines} / {f.line_limit} lines)"
+                    if f.line_limit
+                    else ""
+                )
+                click.echo(f"  {f.path}  {f.tokens} tokens{limit}")
+    click.echo(
+        f"{report.tokens} tokens in {len(report.skills)} skills ({report.tokenizer})"
+    )
+    violations = report.violations
+    for violation in violations:
+        click.echo(f"Over budget: {violation}", err=True)
+    if violations:
+        raise click.exceptions.Exit(1)
+
+
+@click.command("skill-references")
+@click.argument("skill")
+@click.option(
+    "--root",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=None,
+    help="Directory holding the bounded-context packages.",
+)
+@click.option(
+    "--link",
+    is_flag=True,
+    help="First symlink each shared reference into the skill's references/.",
+)
+def skill_references(skill: str, root: Path | None, link: bool) -> None:
+    """Print the canonical path of each reference SKILL declares."""
+    from skillset_engineering.references import ReferenceStore, find_skill
+    from skillset_engineering.tokens import SKILLSETS_ROOT
+
+    try:
+        skill_file = find_skill(skill, root or SKILLSETS_ROOT)
+        store = ReferenceStore(skill_file.parent.parent.parent)
+        if link:
+            for name in store.declared(skill):
+                if not (skill_file.parent / "references" / name).exists():
+                    store.link(skill, name)
+        resolved = store.resolve_all(skill)
+    except (FileNotFoundError, FileExistsError) as exc:
+        raise click.ClickException(str(exc)) from exc
+    for name, path in resolved.items():
+        click.echo(f"{name}\t{path}")
+
+
+@click.command("skill-fitness")
+@click.option(
+    "--package",
+    "packages",
+    multiple=True,
+    help="Bounded-context package to evaluate (repeatable; default all).",
+)
+@click.option(
+    "--predicate",
+    "predicates",
+    multiple=True,
+    help="Predicate to evaluate (repeatable; default all).",
+)
+@click.option(
+    "--root",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=None,
+    help="Directory holding the bounded-context packages.",
+)
+@click.option("--no-cache", is_flag=True, help="Do not read or write the cache.")
+def skill_fitness(
+    packages: tuple[str, ...],
+    predicates: tuple[str, ...],
+    root: Path | None,
+    no_cache: bool,
+) -> None:
+    """Evaluate skillset fitness predicates and print the results table."""
+    from skillset_engineering.fitness import FITNESS_CACHE, PREDICATES, evaluate
+    from skillset_engineering.tokens import SKILLSETS_ROOT
+
+    root = root or SKILLSETS_ROOT
+    try:
+        report = evaluate(
+            root,
+            packages=list(packages) or None,
+            predicates=list(predicates) or None,
+            cache_path=None if no_cache else root / FITNESS_CACHE,
+        )
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), param_hint="--predicate") from exc
+
+    click.echo("| Predicate | Package | Result | Evidence |")
+    click.echo("|-----------|---------|--------|----------|")
+    for r in report.results:
+        evidence = "; ".join(r.evidence).replace("|", "\\|")
+        description = PREDICATES[r.predicate].description
+        click.echo(f"| {description} | {r.package} | {r.result} | {evidence} |")
+    click.echo(
+        f"{len(report.results)} results: {report.evaluated} evaluated, "
+        f"{report.cached} cached"
+    )
+    if report.failed:
+        raise click.exceptions.Exit(1)
+
+
+_STATE_MARK = {"complete": "[x]", "ready": "[ ]", "blocked": "[-]"}
+
+
+def _format_pipeline_next(resp: Any) -> None:
+    progress = resp.progress
+    if progress.next is not None:
+        n = progress.next
+        headline = f"next stage {n.order} {n.skill} ({n.description})"
+    elif progress.complete:
+        headline = "all stages complete"
+    elif progress.stages and progress.stages[0].state == "blocked":
+        headline = (
+            f"blocked: no {progress.stages[0].prerequisite_gate} "
+            f"in the '{resp.client}' workspace"
+        )
+    else:
+        headline = "blocked"
+    click.echo(f"{resp.client}/{resp.project_slug} ({progress.skillset}): {headline}")
+    for stage in progress.stages:
+        click.echo(
+            f"  {_STATE_MARK[stage.state]} {stage.order} {stage.skill}"
+            f"  -> {stage.produces_gate}"
+        )
+
+
+def _format_pipeline_check(resp: Any) -> None:
+    for issue in resp.issues:
+        click.echo(
+            f"{issue.skillset} stage {issue.stage}: {issue.kind}: {issue.message}",
+            err=True,
+        )
+    click.echo(
+        f"{resp.gate_count} gates in {len(resp.skillsets)} skillsets, "
+        f"{len(resp.issues)} issues"
+    )
+    if resp.issues:
+        raise click.exceptions.Exit(1)
+
+
+def _format_skill_context(resp: Any) -> None:
+    pack = resp.pack
+    click.echo(pack.path)
+    state = "unchanged" if pack.cached else "compiled"
+    click.echo(f"{pack.tokens} tokens from {len(pack.sources)} files ({state})")
+    for missing in pack.missing:
+        click.echo(f"Missing prerequisite: {missing}", err=True)
+
+
+def _skill_context_command() -> click.Command:
+    from skillset_engineering.dtos import CompileSkillContextRequest
+
+    return generate_command(
+        name="skill-context",
+        request_model=CompileSkillContextRequest,
+        usecase_attr="compile_skill_context_usecase",
+        format_output=_format_skill_context,
+    )
+
+
+def _pipeline_commands() -> list[click.Command]:
+    from skillset_engineering.dtos import CheckPipelinesRequest, GetNextStageRequest
+
+    return [
+        generate_command(
+            name="next",
+            request_model=GetNextStageRequest,
+            usecase_attr="get_next_stage_usecase",
+            format_output=_format_pipeline_next,
+        ),
+        generate_command(
+            name="check",
+            request_model=CheckPipelinesRequest,
+            usecase_attr="check_pipelines_usecase",
+            format_output=_format_pipeline_check,
+        ),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Registration
+# ---------------------------------------------------------------------------
+
+
+def register_commands(cli: click.Group) -> None:
+    """Register Skillset Engineering commands on the given CLI group."""
+    cli.add_command(skill_tokens)
+    cli.add_command(skill_references)
+    cli.add_command(
+        LazyCommand(
+            "skill-context",
+            _skill_context_command,
+            help="Compile the references and prerequisites a skill reads.",
+        )
+    )
+    cli.add_command(skill_fitness)
+    cli.add_command(
+        LazyGroup(
+            "pipeline",
+            _pipeline_commands,
+            help="Query the gate graph of the registered skillset pipelines.",
+        )
+    )
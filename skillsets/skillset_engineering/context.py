@@ -0,0 +1,255 @@
+"""Context packs: a skill's prerequisites compiled into one file.
+
+A skill run starts by reading its SKILL.md, the shared references it
+declares, and every project file its ``## Prerequisites`` section
+lists, one read per file; an atlas skill can read dozens.
+``compile_pack`` assembles the references and project files, in that
+order, into a single markdown file so the agent reads once. The agent
+has already loaded SKILL.md when it runs the skill, so the skill body
+is left out unless asked for (``include_skill``).
+
+Packs are derived data and never written into a client's project.
+They live in the user's cache directory, under
+``$XDG_CACHE_HOME/practice/context/`` (``~/.cache`` by default), one
+subdirectory per project, and can be deleted at any time.
+
+Project inputs are the backticked paths at the start of each
+prerequisite bullet. A glob such as ``evolve/assessments/*.md``
+expands to its matching files and a path ending in ``/`` to the
+markdown and OWM files under it. Markdown front-matter is stripped,
+and a top-level heading already present in the pack is dropped.
+
+The pack's first line records the SHA-256 of its inputs (and of the
+tokenizer name and whether the skill body is included) and its token
+count. When the inputs are unchanged
+the existing pack is returned without being rebuilt.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from skillset_engineering.references import ReferenceStore, find_skill
+from skillset_engineering.tokens import SKILLSETS_ROOT, Tokenizer, WordTokenizer
+
+PACK_FORMAT = 2
+
+_HEADER = re.compile(
+    r"^<!-- context-pack v(\d+) skill=(\S+) inputs=([0-9a-f]{64}) tokens=(\d+) -->$"
+)
+_BULLET_PATHS = re.compile(r"`([^`\s]+)`")
+_DIR_SUFFIXES = (".md", ".owm")
+
+
+class ContextPack(BaseModel):
+    """A compiled pack and what went into it."""
+
+    skill: str
+    path: str
+    digest: str
+    tokens: int
+    sources: list[str]
+    missing: list[str] = []
+    cached: bool = False
+
+
+def default_cache_dir() -> Path:
+    """Where packs are written: ``$XDG_CACHE_HOME/practice/context``."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "practice" / "context"
+
+
+def pack_path(skill: str, project_dir: Path, cache_dir: Path) -> Path:
+    """The pack of *skill* for *project_dir*, keyed on the project's real path."""
+    project = project_dir.resolve()
+    key = hashlib.sha256(str(project).encode("utf-8")).hexdigest()[:12]
+    return cache_dir / f"{project.name}-{key}" / f"{skill}.md"
+
+
+# ---------------------------------------------------------------------------
+# Inputs
+# ---------------------------------------------------------------------------
+
+
+def prerequisite_paths(skill_text: str) -> list[str]:
+    """Project paths listed in a skill's ``## Prerequisites`` section.
+
+    Only bullets that open with a backticked path count, so prose
+    bullets mentioning commands or other skills are ignored.
+    """
+    paths: list[str] = []
+    in_section = False
+    for line in skill_text.splitlines():
+        if line.startswith("## "):
+            in_section = line.strip() == "## Prerequisites"
+            continue
+        bullet = line.strip()
+        if not in_section or not bullet.startswith("- `"):
+            continue
+        for candidate in _BULLET_PATHS.findall(bullet):
+            if (
+                ("/" in candidate or "." in candidate)
+                and "{" not in candidate
+                and candidate not in paths
+            ):
+                paths.append(candidate)
+    return paths
+
+
+def _expand(project_dir: Path, pattern: str) -> list[Path]:
+    if any(c in pattern for c in "*?["):
+        return sorted(p for p in project_dir.glob(pattern) if p.is_file())
+    path = project_dir / pattern
+    if pattern.endswith("/"):
+        if not path.is_dir():
+            return []
+        return sorted(
+            p for p in path.rglob("*") if p.is_file() and p.suffix in _DIR_SUFFIXES
+        )
+    return [path] if path.is_file() else []
+
+
+# ---------------------------------------------------------------------------
+# Rendering
+# ---------------------------------------------------------------------------
+
+
+def strip_front_matter(text: str) -> str:
+    """Drop a leading ``---``-delimited YAML block."""
+    if not text.startswith("---\n"):
+        return text
+    end = text.find("\n---\n", 4)
+    if end == -1:
+        return text
+    return text[end + 5 :].lstrip("\n")
+
+
+def _body(rel: str, text: str, seen_titles: set[str]) -> str:
+    if rel.endswith(".owm"):
+        return f"```owm\n{text.rstrip()}\n```"
+    kept = []
+    in_fence = False
+    for line in strip_front_matter(text).splitlines():
+        if line.startswith("```"):
+            in_fence = not in_fence
+        elif not in_fence and line.startswith("# "):
+            title = line[2:].strip().lower()
+            if title in seen_titles:
+                continue
+            seen_titles.add(title)
+        kept.append(line)
+    return "\n".join(kept).strip()
+
+
+# ---------------------------------------------------------------------------
+# Compilation
+# ---------------------------------------------------------------------------
+
+
+def _read_header(path: Path) -> re.Match | None:
+    try:
+        with path.open(encoding="utf-8") as f:
+            first = f.readline().rstrip("\n")
+    except OSError:
+        return None
+    return _HEADER.match(first)
+
+
+def compile_pack(
+    skill: str,
+    project_dir: Path,
+    root: Path = SKILLSETS_ROOT,
+    tokenizer: Tokenizer | None = None,
+    include_skill: bool = False,
+    cache_dir: Path | None = None,
+) -> ContextPack:
+    """Compile (or reuse) the context pack of *skill* for *project_dir*.
+
+    *cache_dir* defaults to ``default_cache_dir()``.
+    """
+    tokenizer = tokenizer or WordTokenizer()
+    skill_file = find_skill(skill, root)
+    package_dir = skill_file.parent.parent.parent
+    skill_text = skill_file.read_text(encoding="utf-8")
+
+    # (label, content) in pack order
+    inputs: list[tuple[str, bytes]] = []
+    if include_skill:
+        inputs.append((f"skill:{skill}", skill_text.encode("utf-8")))
+    for name, path in ReferenceStore(package_dir).resolve_all(skill).items():
+        inputs.append((f"reference:{name}", path.read_bytes()))
+    missing: list[str] = []
+    seen: set[Path] = set()
+    for pattern in prerequisite_paths(skill_text):
+        matched = _expand(project_dir, pattern)
+        if not matched:
+            missing.append(pattern)
+        for path in matched:
+            if path not in seen:
+                seen.add(path)
+                rel = path.relative_to(project_dir).as_posix()
+                inputs.append((f"project:{rel}", path.read_bytes()))
+
+    # The skill text decides which files are read, so it counts even when
+    # its body is left out of the pack.
+    h = hashlib.sha256(f"{tokenizer.name}\0{include_skill}\0".encode())
+    h.update(hashlib.sha256(skill_text.encode("utf-8")).digest())
+    for label, content in inputs:
+        h.update(label.encode("utf-8") + b"\0")
+        h.update(hashlib.sha256(content).digest())
+    digest = h.hexdigest()
+
+    path = pack_path(skill, project_dir, cache_dir or default_cache_dir())
+    sources = [label.split(":", 1)[1] for label, _ in inputs]
+    header = _read_header(path)
+    if (
+        header is not None
+        and int(header.group(1)) == PACK_FORMAT
+        and header.group(2) == skill
+        and header.group(3) == digest
+    ):
+        return ContextPack(
+            skill=skill,
+            path=str(path),
+            digest=digest,
+            tokens=int(header.group(4)),
+            sources=sources,
+            missing=missing,
+            cached=True,
+        )
+
+    seen_titles: set[str] = set()
+    parts = []
+    for label, content in inputs:
+        kind, rel = label.split(":", 1)
+        text = content.decode("utf-8")
+        parts.append(f"<!-- {kind}: {rel} -->\n\n{_body(rel, text, seen_titles)}")
+    if missing:
+        parts.append(
+            "<!-- missing prerequisites -->\n\n"
+            + "\n".join(f"- `{m}`" for m in missing)
+        )
+    body = "\n\n".join(parts) + "\n"
+    tokens = tokenizer.count(body)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(
+        f"<!-- context-pack v{PACK_FORMAT} skill={skill} inputs={digest} "
+        f"tokens={tokens} -->\n\n{body}",
+        encoding="utf-8",
+    )
+    os.replace(tmp, path)
+    return ContextPack(
+        skill=skill,
+        path=str(path),
+        digest=digest,
+        tokens=tokens,
+        sources=sources,
+        missing=missing,
+    )
@@ -0,0 +1,71 @@
+"""Request and response DTOs for Skillset Engineering usecases."""
+
+from __future__ import annotations
+
+from pydantic import BaseModel, Field, field_validator
+
+from skillset_engineering.context import ContextPack
+from skillset_engineering.gates import GateIssue, PipelineProgress
+from skillset_engineering.tokens import TOKENIZERS
+
+
+class GetNextStageRequest(BaseModel):
+    """Show which pipeline stage a project can run next."""
+
+    client: str = Field(description="Client slug.")
+    engagement: str = Field(description="Engagement slug.")
+    project_slug: str = Field(
+        description="Project slug.",
+        json_schema_extra={"cli_name": "project"},
+    )
+
+
+class GetNextStageResponse(BaseModel):
+    client: str
+    project_slug: str
+    progress: PipelineProgress
+
+
+class CheckPipelinesRequest(BaseModel):
+    """Validate gate continuity across every registered pipeline."""
+
+
+class CheckPipelinesResponse(BaseModel):
+    skillsets: list[str]
+    gate_count: int
+    issues: list[GateIssue]
+
+
+class CompileSkillContextRequest(BaseModel):
+    """Compile the references and prerequisites a skill reads into one pack."""
+
+    client: str = Field(description="Client slug.")
+    engagement: str = Field(description="Engagement slug.")
+    project_slug: str = Field(
+        description="Project slug.",
+        json_schema_extra={"cli_name": "project"},
+    )
+    skill: str = Field(description="Skill name (e.g. wm-atlas-bottlenecks).")
+    include_skill: bool = Field(
+        default=False,
+        description="Put the SKILL.md body at the top of the pack.",
+    )
+    tokenizer: str = Field(
+        default="words",
+        description="Tokenizer for the pack size: 'words' or 'tiktoken'.",
+    )
+
+    @field_validator("tokenizer")
+    @classmethod
+    def _known_tokenizer(cls, value: str) -> str:
+        if value not in TOKENIZERS:
+            raise ValueError(
+                f"Unknown tokenizer {value!r}; choose from {', '.join(TOKENIZERS)}"
+            )
+        return value
+
+
+class CompileSkillContextResponse(BaseModel):
+    client: str
+    project_slug: str
+    pack: ContextPack
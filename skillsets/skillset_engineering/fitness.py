@@ -0,0 +1,374 @@
+"""Executable fitness functions for skillset conformance.
+
+The fitness-functions strategy of ``rs-assess`` lists structural
+predicates (gates chain without gaps, stage descriptions are unique,
+skill files are under 500 lines, bash scripts are executable) that an
+agent used to evaluate by reading files. Here each one is a Python
+predicate in ``PREDICATES``, evaluated against every bounded-context
+package: its ``SKILLSETS`` definitions and its ``skills/`` tree.
+
+A predicate returns ``pass``, ``fail`` or ``partial`` with evidence.
+Per-item predicates pass when every item passes, fail when none do,
+and are partial in between.
+
+Each predicate declares the package files it reads. Results are
+cached against a digest of those files (path, content and mode) and
+of the predicate itself: its name, description (which states any
+limit it checks), input globs and the source of the modules that
+implement it. After a small change only the predicates whose inputs
+or code changed are evaluated again. Evaluation runs in a thread pool.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import inspect
+import os
+import stat
+import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+from pydantic import BaseModel
+
+from skillset_engineering.gates import GateGraph, import_skillsets
+from skillset_engineering.references import ReferenceStore
+from skillset_engineering.tokens import SKILL_LINE_LIMIT, SKILLSETS_ROOT
+
+if TYPE_CHECKING:
+    from practice.entities import Skillset
+
+FITNESS_CACHE = ".fitness-cache.json"
+FITNESS_CACHE_VERSION = 2
+
+FitnessOutcome = Literal["pass", "fail", "partial"]
+
+
+class FitnessResult(BaseModel):
+    """Outcome of one predicate for one package."""
+
+    predicate: str
+    package: str
+    result: FitnessOutcome
+    evidence: list[str] = []
+
+
+class FitnessReport(BaseModel):
+    """Every predicate's result, and how many were served from cache."""
+
+    results: list[FitnessResult]
+    evaluated: int = 0
+    cached: int = 0
+
+    @property
+    def failed(self) -> list[FitnessResult]:
+        return [r for r in self.results if r.result != "pass"]
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class Target:
+    """A bounded-context package under evaluation."""
+
+    package_dir: Path
+    skillsets: list[Skillset]
+
+    @property
+    def name(self) -> str:
+        return self.package_dir.name
+
+
+PredicateFn = Callable[[Target], tuple[FitnessOutcome, list[str]]]
+
+
+@dataclass(frozen=True)
+class Predicate:
+    name: str
+    description: str
+    inputs: tuple[str, ...]
+    check: PredicateFn
+
+
+PREDICATES: dict[str, Predicate] = {}
+
+
+def predicate(name: str, description: str, inputs: tuple[str, ...]):
+    """Register a fitness predicate reading the *inputs* globs of a package."""
+
+    def register(fn: PredicateFn) -> PredicateFn:
+        PREDICATES[name] = Predicate(name, description, inputs, fn)
+        return fn
+
+    return register
+
+
+def _tally(passed: int, total: int) -> FitnessOutcome:
+    if passed == total:
+        return "pass"
+    return "fail" if passed == 0 else "partial"
+
+
+# ---------------------------------------------------------------------------
+# Predicates
+# ---------------------------------------------------------------------------
+
+_SKILLSETS_DEF = ("__init__.py",)
+_SKILL_FILES = ("skills/*/SKILL.md",)
+
+
+@predicate(
+    "gates-chain",
+    "Gates chain without gaps, conflicts or unreachable stages",
+    _SKILLSETS_DEF,
+)
+def _gates_chain(target: Target) -> tuple[FitnessOutcome, list[str]]:
+    issues = GateGraph(target.skillsets).issues()
+    stages = sum(len(s.pipeline) for s in target.skillsets)
+    failing = {(i.skillset, i.stage) for i in issues}
+    evidence = [f"{i.skillset} stage {i.stage}: {i.kind}: {i.message}" for i in issues]
+    return _tally(stages - len(failing), stages), evidence or [f"{stages} stages chain"]
+
+
+@predicate(
+    "unique-stage-descriptions",
+    "Every stage description is unique",
+    _SKILLSETS_DEF,
+)
+def _unique_descriptions(target: Target) -> tuple[FitnessOutcome, list[str]]:
+    seen: dict[str, str] = {}
+    clashes = []
+    stages = [(s.name, st) for s in target.skillsets for st in s.pipeline]
+    for skillset, stage in stages:
+        where = f"{skillset} stage {stage.order}"
+        if stage.description in seen:
+            clashes.append(
+                f"{where} repeats {seen[stage.description]}: {stage.description!r}"
+            )
+        else:
+            seen[stage.description] = where
+    passed = len(stages) - len(clashes)
+    return _tally(passed, len(stages)), clashes or [f"{len(stages)} stages"]
+
+
+@predicate(
+    "pipeline-skills-exist",
+    "Every pipeline stage names a skill with a SKILL.md",
+    (*_SKILLSETS_DEF, *_SKILL_FILES),
+)
+def _pipeline_skills_exist(target: Target) -> tuple[FitnessOutcome, list[str]]:
+    stages = [(s.name, st) for s in target.skillsets for st in s.pipeline]
+    missing = [
+        f"{skillset} stage {stage.order}: no skills/{stage.skill}/SKILL.md"
+        for skillset, stage in stages
+        if not (target.package_dir / "skills" / stage.skill / "SKILL.md").is_file()
+    ]
+    passed = len(stages) - len(missing)
+    return _tally(passed, len(stages)), missing or [f"{len(stages)} stage skills"]
+
+
+@predicate(
+    "skill-line-limit",
+    f"Skill files are under {SKILL_LINE_LIMIT} lines",
+    _SKILL_FILES,
+)
+def _skill_line_limit(target: Target) -> tuple[FitnessOutcome, list[str]]:
+    files = sorted(target.package_dir.glob("skills/*/SKILL.md"))
+    over = []
+    for path in files:
+        lines = len(path.read_bytes().splitlines())
+        if lines > SKILL_LINE_LIMIT:
+            over.append(f"{path.parent.name}/SKILL.md: {lines} lines")
+    return _tally(len(files) - len(over), len(files)), over or [
+        f"{len(files)} skill files"
+    ]
+
+
+@predicate(
+    "scripts-executable",
+    "Bash scripts are executable",
+    ("skills/*/scripts/*",),
+)
+def _scripts_executable(target: Target) -> tuple[FitnessOutcome, list[str]]:
+    scripts = sorted(
+        p for p in target.package_dir.glob("skills/*/scripts/*") if p.is_file()
+    )
+    blocked = [
+        f"{p.relative_to(target.package_dir).as_posix()} is not executable"
+        for p in scripts
+        if not p.stat().st_mode & stat.S_IXUSR
+    ]
+    return _tally(len(scripts) - len(blocked), len(scripts)), blocked or [
+        f"{len(scripts)} scripts"
+    ]
+
+
+@predicate(
+    "references-resolve",
+    "Every reference a skill declares resolves inside the skill",
+    (*_SKILL_FILES, "references/*", "skills/*/references/**/*"),
+)
+def _references_resolve(target: Target) -> tuple[FitnessOutcome, list[str]]:
+    store = ReferenceStore(target.package_dir)
+    declared = sum(len(store.declared(s)) for s in store.skills())
+    problems = [f"unresolved {u}" for u in store.unresolved()]
+    problems += [f"not linked into the skill: {u}" for u in store.unlinked()]
+    return _tally(declared - len(problems), declared), problems or [
+        f"{declared} declared references"
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Evaluation
+# ---------------------------------------------------------------------------
+
+
+class _InputDigests:
+    """Digests of a package's predicate inputs, each file hashed once."""
+
+    def __init__(self) -> None:
+        self._files: dict[Path, bytes] = {}
+
+    def file(self, path: Path) -> bytes:
+        digest = self._files.get(path)
+        if digest is None:
+            h = hashlib.sha256(path.read_bytes())
+            h.update(f"\0{path.stat().st_mode & 0o777:o}".encode("ascii"))
+            digest = self._files[path] = h.digest()
+        return digest
+
+    def inputs(self, package_dir: Path, patterns: tuple[str, ...]) -> str:
+        h = hashlib.sha256()
+        paths = {p for pattern in patterns for p in package_dir.glob(pattern)}
+        for path in sorted(p for p in paths if p.is_file()):
+            h.update(path.relative_to(package_dir).as_posix().encode("utf-8") + b"\0")
+            h.update(self.file(path))
+        return h.hexdigest()
+
+
+# Modules whose code every predicate runs, besides its own
+_CODE_MODULES = (
+    __name__,
+    "skillset_engineering.gates",
+    "skillset_engineering.references",
+    "skillset_engineering.tokens",
+)
+
+
+def _predicate_digest(pred: Predicate) -> str:
+    """Digest of what a predicate is: its definition and its code."""
+    h = hashlib.sha256(
+        "\0".join((pred.name, pred.description, *pred.inputs)).encode("utf-8")
+    )
+    files = {sys.modules[m].__file__ for m in _CODE_MODULES}
+    files.add(inspect.getsourcefile(pred.check))
+    for path in sorted(f for f in files if f):
+        h.update(hashlib.sha256(Path(path).read_bytes()).digest())
+    return h.hexdigest()
+
+
+def _load_cache(path: Path | None) -> dict[str, dict]:
+    if path is None:
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != FITNESS_CACHE_VERSION:
+        return {}
+    return data.get("results", {})
+
+
+def _save_cache(path: Path, results: dict[str, dict]) -> None:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(
+        json.dumps(
+            {"version": FITNESS_CACHE_VERSION, "results": results},
+            indent=2,
+            sort_keys=True,
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    os.replace(tmp, path)
+
+
+def evaluate(
+    root: Path = SKILLSETS_ROOT,
+    packages: list[str] | None = None,
+    predicates: list[str] | None = None,
+    cache_path: Path | None = None,
+    load_skillsets: Callable[[Path], list[Skillset] | None] = import_skillsets,
+    max_workers: int | None = None,
+) -> FitnessReport:
+    """Run the registered predicates over every package under *root*.
+
+    *packages* and *predicates* narrow the run by name. Raises
+    ValueError for an unknown predicate name.
+    """
+    unknown = sorted(set(predicates or ()) - set(PREDICATES))
+    if unknown:
+        raise ValueError(
+            f"Unknown predicate {', '.join(unknown)}; "
+            f"choose from {', '.join(PREDICATES)}"
+        )
+    chosen = [PREDICATES[n] for n in predicates or PREDICATES]
+
+    targets = []
+    for init in sorted(root.glob("*/__init__.py")):
+        package_dir = init.parent
+        if packages and package_dir.name not in packages:
+            continue
+        skillsets = load_skillsets(package_dir)
+        if skillsets is not None:
+            targets.append(Target(package_dir, list(skillsets)))
+
+    digests = _InputDigests()
+    definitions = {pred.name: _predicate_digest(pred) for pred in chosen}
+    old = _load_cache(cache_path)
+    new = dict(old)
+    results: dict[str, FitnessResult] = {}
+    pending: list[tuple[str, str, Predicate, Target]] = []
+    for target in targets:
+        for pred in chosen:
+            key = f"{target.name}:{pred.name}"
+            digest = hashlib.sha256(
+                f"{definitions[pred.name]}\0".encode("ascii")
+                + digests.inputs(target.package_dir, pred.inputs).encode("ascii")
+            ).hexdigest()
+            cached = old.get(key)
+            if cached is not None and cached.get("inputs") == digest:
+                results[key] = FitnessResult.model_validate(cached["result"])
+            else:
+                pending.append((key, digest, pred, target))
+
+    def run(item: tuple[str, str, Predicate, Target]) -> FitnessResult:
+        _, _, pred, target = item
+        outcome, evidence = pred.check(target)
+        return FitnessResult(
+            predicate=pred.name,
+            package=target.name,
+            result=outcome,
+            evidence=evidence,
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for (key, digest, _, _), result in zip(pending, pool.map(run, pending)):
+            results[key] = result
+            new[key] = {"inputs": digest, "result": result.model_dump()}
+
+    if cache_path is not None and new != old:
+        _save_cache(cache_path, new)
+    ordered = [results[f"{t.name}:{p.name}"] for t in targets for p in chosen]
+    return FitnessReport(
+        results=ordered,
+        evaluated=len(pending),
+        cached=len(ordered) - len(pending),
+    )
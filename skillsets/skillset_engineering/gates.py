@@ -0,0 +1,256 @@
+"""Gate graph of every registered skillset pipeline.
+
+Each ``PipelineStage`` consumes a ``prerequisite_gate`` and produces a
+``produces_gate``, both paths relative to a project directory. Taken
+together the stages of a skillset form a graph from its entry gate
+(the first stage's prerequisite, usually the shared research gate)
+through each agreed artifact.
+
+``GateGraph`` builds that graph once for all skillsets and answers
+two questions:
+
+- ``issues``: is every pipeline continuous? A stage whose prerequisite
+  no earlier stage produces is a gap, two stages producing one gate
+  conflict, and a stage that cannot be reached from the entry gate is
+  unreachable.
+- ``progress``: given one snapshot of a project directory (a single
+  walk, see ``snapshot``), which stages are complete, which can run,
+  and which is next.
+
+Entry gates are not project files: the shared research gate,
+``resources/index.md``, lives in the client workspace
+(``clients/{org}/resources/``) and is shared by all of the client's
+projects. ``GateGraph.files`` therefore checks entry gates against the
+client directory and every other gate against the project.
+
+The fitness predicate ``gates-chain`` reports ``issues`` for each
+bounded-context package, so ``practice pipeline check`` and
+``practice skill-fitness`` apply the same continuity rules.
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+from pydantic import BaseModel
+
+from skillset_engineering.tokens import SKILLSETS_ROOT
+
+if TYPE_CHECKING:
+    from practice.discovery import PipelineStage
+    from practice.entities import Skillset
+
+StageState = Literal["complete", "ready", "blocked"]
+
+
+class GateIssue(BaseModel):
+    """A continuity problem in one skillset's pipeline."""
+
+    skillset: str
+    stage: int
+    kind: Literal["gap", "conflict", "unreachable"]
+    message: str
+
+
+class StageProgress(BaseModel):
+    """Where one stage stands in a project."""
+
+    order: int
+    skill: str
+    description: str
+    prerequisite_gate: str
+    produces_gate: str
+    state: StageState
+
+
+class PipelineProgress(BaseModel):
+    """Every stage of one skillset for a project, and the stage to run next."""
+
+    skillset: str
+    stages: list[StageProgress]
+    next: StageProgress | None = None
+
+    @property
+    def complete(self) -> bool:
+        return all(s.state == "complete" for s in self.stages)
+
+
+def snapshot(project_dir: Path) -> frozenset[str]:
+    """Relative paths of every file in a project, from one directory walk.
+
+    Hidden directories (caches, context packs, indexes) are skipped.
+    """
+    files: set[str] = set()
+    for dirpath, dirnames, filenames in os.walk(project_dir):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        rel = Path(dirpath).relative_to(project_dir)
+        for name in filenames:
+            files.add((rel / name).as_posix())
+    return frozenset(files)
+
+
+class GateGraph:
+    """Gate -> stage index over a set of skillsets."""
+
+    def __init__(self, skillsets: Iterable[Skillset]) -> None:
+        self._pipelines: dict[str, list[PipelineStage]] = {
+            s.name: sorted(s.pipeline, key=lambda st: st.order) for s in skillsets
+        }
+        # skillset -> gate -> stages producing it
+        self._producers: dict[str, dict[str, list[PipelineStage]]] = {}
+        for name, stages in self._pipelines.items():
+            producers: dict[str, list[PipelineStage]] = {}
+            for stage in stages:
+                producers.setdefault(stage.produces_gate, []).append(stage)
+            self._producers[name] = producers
+
+    @property
+    def skillsets(self) -> list[str]:
+        return sorted(self._pipelines)
+
+    def gates(self) -> dict[str, list[str]]:
+        """Every gate, with the ``skillset:order`` stages that touch it."""
+        index: dict[str, list[str]] = {}
+        for name, stages in sorted(self._pipelines.items()):
+            for stage in stages:
+                for gate in (stage.prerequisite_gate, stage.produces_gate):
+                    users = index.setdefault(gate, [])
+                    if f"{name}:{stage.order}" not in users:
+                        users.append(f"{name}:{stage.order}")
+        return dict(sorted(index.items()))
+
+    def entry_gates(self) -> set[str]:
+        """The prerequisite gate of each pipeline's first stage."""
+        return {
+            stages[0].prerequisite_gate for stages in self._pipelines.values() if stages
+        }
+
+    def files(self, project_dir: Path, client_dir: Path) -> frozenset[str]:
+        """Gates present for a project, from one walk of *project_dir*.
+
+        Entry gates are looked up in *client_dir* only; a copy inside
+        the project does not open a pipeline.
+        """
+        entry = self.entry_gates()
+        found = {g for g in entry if (client_dir / g).is_file()}
+        return frozenset(snapshot(project_dir) - entry | found)
+
+    # -- validation --------------------------------------------------------
+
+    def issues(self) -> list[GateIssue]:
+        """Gaps, conflicting producers and unreachable stages."""
+        found: list[GateIssue] = []
+        for name, stages in sorted(self._pipelines.items()):
+            if not stages:
+                continue
+            producers = self._producers[name]
+            for gate, makers in producers.items():
+                for stage in makers[1:]:
+                    found.append(
+                        GateIssue(
+                            skillset=name,
+                            stage=stage.order,
+                            kind="conflict",
+                            message=(
+                                f"{gate} is also produced by stage "
+                                f"{makers[0].order} ({makers[0].skill})"
+                            ),
+                        )
+                    )
+            for stage in stages[1:]:
+                earlier = [
+                    s
+                    for s in producers.get(stage.prerequisite_gate, [])
+                    if s.order < stage.order
+                ]
+                if not earlier:
+                    found.append(
+                        GateIssue(
+                            skillset=name,
+                            stage=stage.order,
+                            kind="gap",
+                            message=(
+                                f"{stage.skill} needs {stage.prerequisite_gate}, "
+                                "which no earlier stage produces"
+                            ),
+                        )
+                    )
+
+            reached = {stages[0].prerequisite_gate}
+            changed = True
+            while changed:
+                changed = False
+                for stage in stages:
+                    if (
+                        stage.prerequisite_gate in reached
+                        and stage.produces_gate not in reached
+                    ):
+                        reached.add(stage.produces_gate)
+                        changed = True
+            found.extend(
+                GateIssue(
+                    skillset=name,
+                    stage=stage.order,
+                    kind="unreachable",
+                    message=(
+                        f"{stage.skill} cannot be reached from "
+                        f"{stages[0].prerequisite_gate}"
+                    ),
+                )
+                for stage in stages
+                if stage.prerequisite_gate not in reached
+            )
+        return sorted(found, key=lambda i: (i.skillset, i.stage, i.kind))
+
+    # -- queries -----------------------------------------------------------
+
+    def progress(self, skillset: str, files: frozenset[str]) -> PipelineProgress:
+        """Stage states of *skillset* for a project whose files are *files*.
+
+        Raises KeyError for an unknown skillset.
+        """
+        stages = []
+        for stage in self._pipelines[skillset]:
+            if stage.produces_gate in files:
+                state: StageState = "complete"
+            elif stage.prerequisite_gate in files:
+                state = "ready"
+            else:
+                state = "blocked"
+            stages.append(
+                StageProgress(
+                    order=stage.order,
+                    skill=stage.skill,
+                    description=stage.description,
+                    prerequisite_gate=stage.prerequisite_gate,
+                    produces_gate=stage.produces_gate,
+                    state=state,
+                )
+            )
+        ready = [s for s in stages if s.state == "ready"]
+        return PipelineProgress(
+            skillset=skillset,
+            stages=stages,
+            next=ready[0] if ready else None,
+        )
+
+
+def import_skillsets(package_dir: Path) -> list[Skillset] | None:
+    """``SKILLSETS`` of an importable package, or None if it has none."""
+    module = importlib.import_module(package_dir.name)
+    return getattr(module, "SKILLSETS", None)
+
+
+def load_graph(
+    root: Path = SKILLSETS_ROOT,
+    load_skillsets: Callable[[Path], list[Skillset] | None] = import_skillsets,
+) -> GateGraph:
+    """Gate graph of the ``SKILLSETS`` of every package under *root*."""
+    skillsets: list[Skillset] = []
+    for init in sorted(root.glob("*/__init__.py")):
+        skillsets.extend(load_skillsets(init.parent) or [])
+    return GateGraph(skillsets)
@@ -0,0 +1,22 @@
+"""Filesystem adapters for the Skillset Engineering usecases."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+
+class WorkspaceDirectories:
+    """Client and project directories under the workspace root.
+
+    A client is ``{workspace_root}/{client}`` and a project is
+    ``{client}/engagements/{engagement}/{project}``.
+    """
+
+    def __init__(self, workspace_root: Path) -> None:
+        self._root = workspace_root
+
+    def client_dir(self, client: str) -> Path:
+        return self._root / client
+
+    def project_dir(self, client: str, engagement: str, project_slug: str) -> Path:
+        return self._root / client / "engagements" / engagement / project_slug
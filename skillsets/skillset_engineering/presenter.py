@@ -6,10 +6,12 @@ ProjectContribution that any renderer can consume.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
 
 from practice.content import ContentPage, ProjectContribution, ProjectSection
 from practice.entities import Project
+from shared.pages import LazyContentPage, file_body, load_section
 
 
 def _read_md(path: Path) -> str:
@@ -25,6 +27,19 @@ class SkillsetEngineeringPresenter:
         self._ws_root = workspace_root
 
     def present(self, project: Project) -> ProjectContribution:
+        contribution, sections = self.stream(project)
+        return contribution.model_copy(
+            update={"sections": [load_section(s) for s in sections]}
+        )
+
+    def stream(
+        self, project: Project
+    ) -> tuple[ProjectContribution, Iterator[ProjectSection]]:
+        """The contribution without its sections, and a generator of them.
+
+        Page bodies are ``LazyContentPage`` loaders, read only when the
+        writer loads each page.
+        """
         proj_dir = (
             self._ws_root
             / project.client
@@ -33,6 +48,23 @@ class SkillsetEngineeringPresenter:
             / project.slug
         )
 
+        # The design is the overview as well as a page; read it once
+        design_md = _read_md(proj_dir / "design" / "design.agreed.md")
+
+        contribution = ProjectContribution(
+            slug=project.slug,
+            title=project.slug,
+            skillset=project.skillset,
+            status=project.status.value,
+            hero_figure=None,
+            overview_md=design_md,
+            sections=[],
+        )
+        return contribution, self._iter_sections(proj_dir, design_md)
+
+    def _iter_sections(
+        self, proj_dir: Path, design_md: str
+    ) -> Iterator[ProjectSection]:
         has_brief = (proj_dir / "brief.agreed.md").is_file()
         has_synthesis = (proj_dir / "research" / "synthesis.agreed.md").is_file()
         has_design = (proj_dir / "design" / "design.agreed.md").is_file()
@@ -42,58 +74,41 @@ class SkillsetEngineeringPresenter:
 
         if has_design:
             pages.append(
-                ContentPage(
+                LazyContentPage(
                     title="Pipeline Design",
                     slug="design",
-                    body_md=_read_md(proj_dir / "design" / "design.agreed.md"),
+                    loader=lambda: design_md,
                 )
             )
         if has_synthesis:
             pages.append(
-                ContentPage(
+                LazyContentPage(
                     title="Domain Research",
                     slug="research",
-                    body_md=_read_md(proj_dir / "research" / "synthesis.agreed.md"),
+                    loader=file_body(proj_dir / "research" / "synthesis.agreed.md"),
                 )
             )
         if has_brief:
             pages.append(
-                ContentPage(
+                LazyContentPage(
                     title="Skillset Brief",
                     slug="brief",
-                    body_md=_read_md(proj_dir / "brief.agreed.md"),
+                    loader=file_body(proj_dir / "brief.agreed.md"),
                 )
             )
         if has_implementation:
             pages.append(
-                ContentPage(
+                LazyContentPage(
                     title="Implementation",
                     slug="implementation",
-                    body_md=_read_md(proj_dir / "implementation.agreed.md"),
+                    loader=file_body(proj_dir / "implementation.agreed.md"),
                 )
             )
 
-        overview_md = (
-            _read_md(proj_dir / "design" / "design.agreed.md") if has_design else ""
-        )
-
-        sections: list[ProjectSection] = []
         if pages:
-            sections.append(
-                ProjectSection(
-                    label="Engineering",
-                    slug="engineering",
-                    description="Skillset engineering artifacts",
-                    pages=pages,
-                )
+            yield ProjectSection(
+                label="Engineering",
+                slug="engineering",
+                description="Skillset engineering artifacts",
+                pages=pages,
             )
-
-        return ProjectContribution(
-            slug=project.slug,
-            title=project.slug,
-            skillset=project.skillset,
-            status=project.status.value,
-            hero_figure=None,
-            overview_md=overview_md,
-            sections=sections,
-        )
@@ -0,0 +1,187 @@
+"""Shared reference store for a bounded context's skills.
+
+A reference file needed by more than one skill lives once in the
+bounded context's store, ``<package>/references/``, instead of being
+copied into each ``<package>/skills/<skill>/references/``. A skill
+declares the shared references it reads in its SKILL.md frontmatter,
+as a space-separated ``metadata.references`` value::
+
+    metadata:
+      skillset: wardley-mapping
+      references: owm-dsl-reference.md
+
+The store file is symlinked into the skill's own ``references/``
+(``ReferenceStore.link``, or ``practice skill-references SKILL
+--link``), and SKILL.md links to ``references/{name}``. The skill
+stays self-contained: its links resolve the same way whether the
+skill is read from the package or through a ``.claude/skills/{skill}``
+symlink, where a lexical ``../../references`` would leave the
+package. ``ReferenceStore.resolve`` hands back the one canonical path
+for a declared name, preferring a skill's own copy over the store.
+
+The store is content-addressed: ``duplicates`` hashes every reference
+file in the skills and the store and reports any content held at more
+than one path, so copies that would load twice into agent context (and
+drift apart) are caught by a conformance test. Symlinks are not
+copies and are skipped.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from skillset_engineering.tokens import SKILLSETS_ROOT
+
+SHARED_REFERENCES = "references"
+
+_METADATA_REFERENCES = re.compile(r"^\s+references:\s*(.*?)\s*$")
+
+
+def find_skill(skill: str, root: Path = SKILLSETS_ROOT) -> Path:
+    """The SKILL.md of *skill* in any package under *root*."""
+    found = sorted(root.glob(f"*/skills/{skill}/SKILL.md"))
+    if not found:
+        raise FileNotFoundError(f"Skill not found: {skill}")
+    return found[0]
+
+
+def declared_references(skill_file: Path) -> list[str]:
+    """Names in the ``metadata.references`` value of a SKILL.md."""
+    lines = skill_file.read_text(encoding="utf-8").splitlines()
+    if not lines or lines[0].strip() != "---":
+        return []
+    in_metadata = False
+    for line in lines[1:]:
+        if line.strip() == "---":
+            break
+        if not line.startswith((" ", "\t")):
+            in_metadata = line.rstrip() == "metadata:"
+            continue
+        match = _METADATA_REFERENCES.match(line) if in_metadata else None
+        if match:
+            return match.group(1).strip("\"'").split()
+    return []
+
+
+class DuplicateReference(BaseModel):
+    """Reference content held at more than one path."""
+
+    digest: str
+    paths: list[str]
+
+
+class ReferenceStore:
+    """The skills and shared references of one bounded-context package."""
+
+    def __init__(self, package_dir: Path) -> None:
+        self.package_dir = package_dir
+        self.shared_dir = package_dir / SHARED_REFERENCES
+
+    def skills(self) -> list[str]:
+        return sorted(p.parent.name for p in self.package_dir.glob("skills/*/SKILL.md"))
+
+    def declared(self, skill: str) -> list[str]:
+        return declared_references(self.package_dir / "skills" / skill / "SKILL.md")
+
+    def resolve(self, skill: str, name: str) -> Path:
+        """Canonical path of reference *name* for *skill*.
+
+        A skill's own ``references/`` wins over the shared store.
+        Raises FileNotFoundError when neither holds it.
+        """
+        for candidate in (
+            self.package_dir / "skills" / skill / "references" / name,
+            self.shared_dir / name,
+        ):
+            if candidate.is_file():
+                return candidate
+        raise FileNotFoundError(
+            f"Reference {name!r} of skill {skill!r} is not in the skill's "
+            f"references/ or in {self.shared_dir}"
+        )
+
+    def link(self, skill: str, name: str) -> Path:
+        """Symlink store reference *name* into *skill*'s ``references/``.
+
+        The link is relative, so it survives the tree being moved.
+        Raises FileNotFoundError when the store does not hold *name*,
+        and FileExistsError when the skill already has a file by that
+        name that is not this link.
+        """
+        target = self.shared_dir / name
+        if not target.is_file():
+            raise FileNotFoundError(f"Reference {name!r} is not in {self.shared_dir}")
+        link = self.package_dir / "skills" / skill / "references" / name
+        relative = Path(os.path.relpath(target, link.parent))
+        if link.is_symlink() and Path(os.readlink(link)) == relative:
+            return link
+        link.parent.mkdir(parents=True, exist_ok=True)
+        link.symlink_to(relative)
+        return link
+
+    def resolve_all(self, skill: str) -> dict[str, Path]:
+        """Canonical paths of every reference *skill* declares."""
+        return {name: self.resolve(skill, name) for name in self.declared(skill)}
+
+    def unresolved(self) -> list[str]:
+        """``skill: name`` for each declared reference that does not resolve."""
+        missing = []
+        for skill in self.skills():
+            for name in self.declared(skill):
+                try:
+                    self.resolve(skill, name)
+                except FileNotFoundError:
+                    missing.append(f"{skill}: {name}")
+        return missing
+
+    def unlinked(self) -> list[str]:
+        """``skill: name`` for each declared reference only in the store.
+
+        Such a skill is not self-contained: it reads the store through
+        a path outside its own directory.
+        """
+        return [
+            f"{skill}: {name}"
+            for skill in self.skills()
+            for name in self.declared(skill)
+            if not (self.package_dir / "skills" / skill / "references" / name).exists()
+            and (self.shared_dir / name).is_file()
+        ]
+
+    def reference_files(self) -> list[Path]:
+        """Every file in the shared store and in each skill's references/.
+
+        Symlinks (store references linked into a skill) are left out.
+        """
+        files = [p for p in self.shared_dir.rglob("*") if p.is_file()]
+        files += self.package_dir.glob("skills/*/references/**/*")
+        return sorted(p for p in files if p.is_file() and not p.is_symlink())
+
+    def digests(self) -> dict[str, list[Path]]:
+        """Reference files grouped by the SHA-256 of their content."""
+        by_digest: dict[str, list[Path]] = {}
+        for path in self.reference_files():
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            by_digest.setdefault(digest, []).append(path)
+        return by_digest
+
+
+def duplicates(root: Path = SKILLSETS_ROOT) -> list[DuplicateReference]:
+    """Reference content duplicated anywhere under *root*, across packages."""
+    by_digest: dict[str, list[Path]] = {}
+    for package_dir in sorted(p.parent for p in root.glob("*/skills")):
+        for digest, paths in ReferenceStore(package_dir).digests().items():
+            by_digest.setdefault(digest, []).extend(paths)
+    return [
+        DuplicateReference(
+            digest=digest,
+            paths=[p.relative_to(root).as_posix() for p in paths],
+        )
+        for digest, paths in sorted(by_digest.items())
+        if len(paths) > 1
+    ]
@@ -14,7 +14,6 @@
 set -euo pipefail
 
 REPO_DIR="$(git -C "$(dirname "$0")" rev-parse --show-toplevel)"
-CLI="uv run --project $REPO_DIR practice"
 
 CLIENT="" ENGAGEMENT="" PROJECT=""
 FIELDS=()
@@ -33,14 +32,20 @@ if [[ -z "$CLIENT" || -z "$ENGAGEMENT" || -z "$PROJECT" ]]; then
   exit 1
 fi
 
-CMD=($CLI decision record \
-  --client "$CLIENT" --engagement "$ENGAGEMENT" --project "$PROJECT" \
-  --title "Stage 1: Skillset brief agreed" \
+# Both commands run in one practice process. Each is written as its
+# argument count followed by its arguments, all NUL-terminated, so
+# field values need no quoting and may even be empty.
+record=(decision record
+  --client "$CLIENT" --engagement "$ENGAGEMENT" --project "$PROJECT"
+  --title "Stage 1: Skillset brief agreed"
   --field "Agreed=New skillset scope signed off by operator")
 for f in "${FIELDS[@]}"; do
-  CMD+=(--field "$f")
+  record+=(--field "$f")
 done
-"${CMD[@]}"
 
-$CLI project update-status \
-  --client "$CLIENT" --engagement "$ENGAGEMENT" --project "$PROJECT" --status elaboration
+# Activate the project
+advance=(project update-status
+  --client "$CLIENT" --engagement "$ENGAGEMENT" --project "$PROJECT" --status elaboration)
+
+printf '%s\0' "${#record[@]}" "${record[@]}" "${#advance[@]}" "${advance[@]}" \
+  | uv run --project "$REPO_DIR" practice run-batch -0
@@ -0,0 +1,104 @@
+"""Fixtures and builders for skillset_engineering tests."""
+
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+
+import click
+import pytest
+
+from practice.discovery import PipelineStage
+from practice.entities import Project, ProjectStatus, Skillset
+from skillset_engineering.cli import register_commands
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def cli():
+    """A ``practice`` root group with the skillset_engineering commands."""
+
+    @click.group()
+    def practice():
+        pass
+
+    register_commands(practice)
+    return practice
+
+
+class Projects:
+    """ProjectLookup over a fixed set of projects."""
+
+    def __init__(self, *projects: Project) -> None:
+        self._projects = {(p.client, p.engagement, p.slug): p for p in projects}
+
+    def get(self, client: str, engagement: str, slug: str) -> Project | None:
+        return self._projects.get((client, engagement, slug))
+
+
+# ---------------------------------------------------------------------------
+# Builders
+# ---------------------------------------------------------------------------
+
+
+def make_project(skillset: str = "mapping", slug: str = "maps-1") -> Project:
+    """Project *slug* of client ``acme``, engagement ``strat-1``."""
+    return Project(
+        slug=slug,
+        client="acme",
+        engagement="strat-1",
+        skillset=skillset,
+        status=ProjectStatus.ELABORATION,
+        created=date(2025, 6, 1),
+    )
+
+
+def write_file(path: Path, text: str, mode: int = 0o644) -> Path:
+    """Write *text* to *path*, creating parent directories."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    path.chmod(mode)
+    return path
+
+
+def touch_files(project: Path, *paths: str) -> None:
+    """Create each project-relative path as an agreed artifact."""
+    for rel in paths:
+        write_file(project / rel, "agreed\n")
+
+
+def make_stage(
+    order: int,
+    skill: str,
+    needs: str,
+    produces: str,
+    description: str | None = None,
+) -> PipelineStage:
+    """A pipeline stage that needs gate *needs* and produces gate *produces*."""
+    return PipelineStage(
+        order=order,
+        skill=skill,
+        prerequisite_gate=needs,
+        produces_gate=produces,
+        description=description or f"Stage {order}: {skill}",
+        consumes=[],
+    )
+
+
+def make_skillset(name: str, stages: list[PipelineStage]) -> Skillset:
+    """A minimal skillset with *stages* as its pipeline."""
+    return Skillset(
+        name=name,
+        display_name=name.title(),
+        description="A demo skillset.",
+        slug_pattern="demo-{n}",
+        problem_domain="Testing",
+        value_proposition="Tests.",
+        deliverables=[],
+        classification=[],
+        evidence=[],
+        pipeline=stages,
+    )
@@ -0,0 +1,239 @@
+"""Tests for context pack compilation."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from practice.exceptions import NotFoundError
+from skillset_engineering.context import (
+    compile_pack,
+    default_cache_dir,
+    prerequisite_paths,
+    strip_front_matter,
+)
+from skillset_engineering.dtos import CompileSkillContextRequest
+from skillset_engineering.infrastructure import WorkspaceDirectories
+from skillset_engineering.tokens import WordTokenizer
+from skillset_engineering.usecases import CompileSkillContextUseCase
+
+from .conftest import Projects, make_project, write_file
+
+SKILL = """\
+---
+name: demo-atlas
+metadata:
+  references: dsl.md
+---
+
+# Atlas: Demo
+
+## Prerequisites
+
+Check that the project directory contains:
+- `strategy/map.agreed.owm` -- the strategy map
+- `evolve/assessments/*.md`
+- `resources/index.md` and research sub-reports in `resources/`
+- The `engage` skill has created the project (check `projects/index.md`)
+- `decisions.md`
+
+## Step 1: Analyse
+"""
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """Packs go to a temporary cache, never the user's."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def root(tmp_path):
+    package = tmp_path / "skillsets" / "demo_bc"
+    write_file(package / "skills" / "demo-atlas" / "SKILL.md", SKILL)
+    write_file(package / "references" / "dsl.md", "# OWM DSL\n\nSyntax.\n")
+    return tmp_path / "skillsets"
+
+
+@pytest.fixture
+def project(tmp_path):
+    project = tmp_path / "clients" / "acme" / "engagements" / "strat-1" / "maps-1"
+    write_file(
+        project / "strategy" / "map.agreed.owm", "title Demo\nanchor User [0.9, 0.5]\n"
+    )
+    for name in ("kernel", "api"):
+        write_file(
+            project / "evolve" / "assessments" / f"{name}.md",
+            "---\nstatus: agreed\n---\n\n"
+            f"# Evolution assessment\n\n{name} is a product.\n",
+        )
+    write_file(project / "resources" / "index.md", "# Resources\n")
+    write_file(project / "resources" / "market.md", "# Market\n\nGrowing.\n")
+    return project
+
+
+class TestPrerequisitePaths:
+    def test_paths_from_bullets(self):
+        assert prerequisite_paths(SKILL) == [
+            "strategy/map.agreed.owm",
+            "evolve/assessments/*.md",
+            "resources/index.md",
+            "resources/",
+            "decisions.md",
+        ]
+
+    def test_real_atlas_skill(self):
+        from skillset_engineering.references import find_skill
+
+        text = find_skill("wm-atlas-bottlenecks").read_text()
+        assert prerequisite_paths(text)[:3] == [
+            "strategy/map.agreed.owm",
+            "chain/supply-chain.agreed.md",
+            "evolve/assessments/*.md",
+        ]
+
+
+class TestStripFrontMatter:
+    def test_strips_leading_block(self):
+        assert strip_front_matter("---\na: 1\n---\n\n# T\n") == "# T\n"
+
+    def test_leaves_text_without_block(self):
+        assert strip_front_matter("# T\n---\n") == "# T\n---\n"
+
+
+class TestCompilePack:
+    def test_one_ordered_pack(self, root, project):
+        pack = compile_pack("demo-atlas", project, root)
+        assert pack.sources == [
+            "dsl.md",
+            "strategy/map.agreed.owm",
+            "evolve/assessments/api.md",
+            "evolve/assessments/kernel.md",
+            "resources/index.md",
+            "resources/market.md",
+        ]
+        assert pack.missing == ["decisions.md"]
+        text = Path(pack.path).read_text()
+        assert "# Atlas: Demo" not in text
+        assert text.index("# OWM DSL") < text.index("```owm\ntitle Demo")
+        assert "status: agreed" not in text
+        # the second assessment's repeated title is dropped
+        assert text.count("# Evolution assessment") == 1
+        assert "kernel is a product." in text
+        assert "- `decisions.md`" in text
+
+    def test_skill_body_on_request(self, root, project):
+        pack = compile_pack("demo-atlas", project, root, include_skill=True)
+        assert pack.sources[:2] == ["demo-atlas", "dsl.md"]
+        text = Path(pack.path).read_text()
+        assert text.index("# Atlas: Demo") < text.index("# OWM DSL")
+        assert "name: demo-atlas" not in text
+        assert not compile_pack("demo-atlas", project, root).cached
+
+    def test_written_to_cache_not_project(self, root, project, cache_home):
+        pack = compile_pack("demo-atlas", project, root)
+        path = Path(pack.path)
+        assert path.is_relative_to(default_cache_dir())
+        assert default_cache_dir() == cache_home / "practice" / "context"
+        assert path.parent.name.startswith("maps-1-")
+        assert not any(p.name.startswith(".") for p in project.rglob("*"))
+
+    def test_projects_do_not_share_packs(self, root, project, tmp_path):
+        other = tmp_path / "elsewhere" / "maps-1"
+        write_file(other / "decisions.md", "# Decisions\n")
+        first = compile_pack("demo-atlas", project, root)
+        second = compile_pack("demo-atlas", other, root)
+        assert first.path != second.path
+
+    def test_reports_token_size(self, root, project):
+        pack = compile_pack("demo-atlas", project, root)
+        body = Path(pack.path).read_text().split("\n", 2)[2]
+        assert pack.tokens == WordTokenizer().count(body)
+        header = Path(pack.path).read_text().split("\n")[0]
+        assert header.endswith(f"tokens={pack.tokens} -->")
+
+    def test_unchanged_inputs_reuse_pack(self, root, project):
+        first = compile_pack("demo-atlas", project, root)
+        path = Path(first.path)
+        mtime = path.stat().st_mtime_ns
+        second = compile_pack("demo-atlas", project, root)
+        assert second.cached
+        assert second.digest == first.digest
+        assert second.tokens == first.tokens
+        assert path.stat().st_mtime_ns == mtime
+
+    def test_changed_input_rebuilds(self, root, project):
+        first = compile_pack("demo-atlas", project, root)
+        write_file(project / "decisions.md", "# Decisions\n\nShip it.\n")
+        second = compile_pack("demo-atlas", project, root)
+        assert not second.cached
+        assert second.digest != first.digest
+        assert second.missing == []
+        assert "Ship it." in Path(second.path).read_text()
+
+    def test_changed_skill_rebuilds(self, root, project):
+        compile_pack("demo-atlas", project, root)
+        skill = root / "demo_bc" / "skills" / "demo-atlas" / "SKILL.md"
+        skill.write_text(SKILL + "\nMore steps.\n")
+        assert not compile_pack("demo-atlas", project, root).cached
+
+    def test_tokenizer_change_rebuilds(self, root, project):
+        compile_pack("demo-atlas", project, root)
+        pack = compile_pack("demo-atlas", project, root, WordTokenizer(1))
+        assert not pack.cached
+
+    def test_unknown_skill(self, root, project):
+        with pytest.raises(FileNotFoundError, match="Skill not found"):
+            compile_pack("nope", project, root)
+
+    def test_real_skill_with_shared_reference(self, project):
+        pack = compile_pack("wm-atlas-bottlenecks", project)
+        assert pack.sources[:2] == [
+            "owm-dsl-reference.md",
+            "strategy/map.agreed.owm",
+        ]
+        assert "chain/supply-chain.agreed.md" in pack.missing
+
+
+def _request(**fields) -> CompileSkillContextRequest:
+    defaults = {
+        "client": "acme",
+        "engagement": "strat-1",
+        "project_slug": "maps-1",
+        "skill": "demo-atlas",
+    }
+    return CompileSkillContextRequest(**(defaults | fields))
+
+
+class TestCompileSkillContextUseCase:
+    @pytest.fixture
+    def usecase(self, root, tmp_path):
+        return CompileSkillContextUseCase(
+            projects=Projects(make_project()),
+            layout=WorkspaceDirectories(tmp_path / "clients"),
+            root=root,
+            cache_dir=tmp_path / "packs",
+        )
+
+    def test_pack_for_the_addressed_project(self, usecase, project, tmp_path):
+        resp = usecase.execute(_request())
+        assert resp.pack.path.startswith(str(tmp_path / "packs"))
+        assert len(resp.pack.sources) == 6
+        assert resp.pack.missing == ["decisions.md"]
+        assert usecase.execute(_request()).pack.cached
+        assert len(usecase.execute(_request(include_skill=True)).pack.sources) == 7
+
+    def test_unknown_project(self, usecase, project):
+        with pytest.raises(NotFoundError, match="Project not found"):
+            usecase.execute(_request(project_slug="maps-2"))
+
+    def test_unknown_skill(self, usecase, project):
+        with pytest.raises(NotFoundError, match="Skill not found"):
+            usecase.execute(_request(skill="nope"))
+
+    def test_unknown_tokenizer_rejected(self):
+        with pytest.raises(ValidationError, match="Unknown tokenizer 'bpe'"):
+            _request(tokenizer="bpe")
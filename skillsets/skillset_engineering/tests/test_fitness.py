@@ -0,0 +1,236 @@
+"""Tests for the fitness-function engine, and the repo's own fitness."""
+
+from __future__ import annotations
+
+import pytest
+from click.testing import CliRunner
+
+from skillset_engineering import fitness
+from skillset_engineering.fitness import FITNESS_CACHE, PREDICATES, evaluate
+
+from .conftest import make_skillset, make_stage, write_file
+
+
+@pytest.fixture
+def root(tmp_path):
+    package = tmp_path / "demo_bc"
+    write_file(package / "__init__.py", '"""Demo BC."""\n')
+    for skill in ("demo-brief", "demo-plan"):
+        write_file(package / "skills" / skill / "SKILL.md", f"# {skill}\n")
+        write_file(
+            package / "skills" / skill / "scripts" / "record.sh", "#!/bin/sh\n", 0o755
+        )
+    write_file(tmp_path / "not_a_bc" / "__init__.py", "")
+    return tmp_path
+
+
+@pytest.fixture
+def skillsets():
+    """Skillsets per package, editable by tests."""
+    return {
+        "demo_bc": [
+            make_skillset(
+                "demo",
+                [
+                    make_stage(
+                        1, "demo-brief", "resources/index.md", "brief.agreed.md"
+                    ),
+                    make_stage(2, "demo-plan", "brief.agreed.md", "plan.agreed.md"),
+                ],
+            )
+        ]
+    }
+
+
+def _run(root, skillsets, **kwargs):
+    return evaluate(root, load_skillsets=lambda d: skillsets.get(d.name), **kwargs)
+
+
+def _by_name(report):
+    return {r.predicate: r for r in report.results}
+
+
+class TestPredicates:
+    def test_conforming_package_passes(self, root, skillsets):
+        report = _run(root, skillsets)
+        assert {r.package for r in report.results} == {"demo_bc"}
+        assert [r.predicate for r in report.results] == list(PREDICATES)
+        assert report.failed == []
+
+    def test_gate_gap_reports_graph_issues(self, root, skillsets):
+        skillsets["demo_bc"][0].pipeline[1].prerequisite_gate = "scope.agreed.md"
+        result = _by_name(_run(root, skillsets))["gates-chain"]
+        assert result.result == "partial"
+        assert result.evidence == [
+            (
+                "demo stage 2: gap: demo-plan needs scope.agreed.md, "
+                "which no earlier stage produces"
+            ),
+            (
+                "demo stage 2: unreachable: demo-plan cannot be reached from "
+                "resources/index.md"
+            ),
+        ]
+
+    def test_gate_conflict_reported(self, root, skillsets):
+        skillsets["demo_bc"][0].pipeline[1].produces_gate = "brief.agreed.md"
+        result = _by_name(_run(root, skillsets))["gates-chain"]
+        assert result.evidence == [
+            (
+                "demo stage 2: conflict: brief.agreed.md is also produced by stage 1 "
+                "(demo-brief)"
+            )
+        ]
+
+    def test_duplicate_description(self, root, skillsets):
+        for stage in skillsets["demo_bc"][0].pipeline:
+            stage.description = "Stage: same"
+        result = _by_name(_run(root, skillsets))["unique-stage-descriptions"]
+        assert result.result == "partial"
+        assert "demo stage 2 repeats demo stage 1" in result.evidence[0]
+
+    def test_missing_stage_skill(self, root, skillsets):
+        skillsets["demo_bc"][0].pipeline[1].skill = "demo-gone"
+        result = _by_name(_run(root, skillsets))["pipeline-skills-exist"]
+        assert result.result == "partial"
+        assert result.evidence == ["demo stage 2: no skills/demo-gone/SKILL.md"]
+
+    def test_long_skill_file(self, root, skillsets):
+        write_file(root / "demo_bc" / "skills" / "demo-plan" / "SKILL.md", "x\n" * 501)
+        result = _by_name(_run(root, skillsets))["skill-line-limit"]
+        assert result.result == "partial"
+        assert result.evidence == ["demo-plan/SKILL.md: 501 lines"]
+
+    def test_long_skill_file_without_final_newline(self, root, skillsets):
+        write_file(
+            root / "demo_bc" / "skills" / "demo-plan" / "SKILL.md", "x\n" * 500 + "x"
+        )
+        result = _by_name(_run(root, skillsets))["skill-line-limit"]
+        assert result.evidence == ["demo-plan/SKILL.md: 501 lines"]
+
+    def test_non_executable_scripts(self, root, skillsets):
+        for skill in ("demo-brief", "demo-plan"):
+            (root / "demo_bc" / "skills" / skill / "scripts" / "record.sh").chmod(0o644)
+        result = _by_name(_run(root, skillsets))["scripts-executable"]
+        assert result.result == "fail"
+        assert len(result.evidence) == 2
+
+    def test_narrowed_run(self, root, skillsets):
+        report = _run(root, skillsets, predicates=["gates-chain"])
+        assert [r.predicate for r in report.results] == ["gates-chain"]
+        assert _run(root, skillsets, packages=["other"]).results == []
+
+    def test_unknown_predicate(self, root, skillsets):
+        with pytest.raises(ValueError, match="Unknown predicate nope"):
+            _run(root, skillsets, predicates=["nope"])
+
+
+class TestCache:
+    @pytest.fixture
+    def counted(self, monkeypatch):
+        calls: list[str] = []
+        for name, pred in list(PREDICATES.items()):
+
+            def check(target, pred=pred):
+                calls.append(pred.name)
+                return pred.check(target)
+
+            monkeypatch.setitem(
+                PREDICATES,
+                name,
+                fitness.Predicate(pred.name, pred.description, pred.inputs, check),
+            )
+        return calls
+
+    def test_unchanged_tree_served_from_cache(self, root, skillsets, counted):
+        cache = root / FITNESS_CACHE
+        first = _run(root, skillsets, cache_path=cache)
+        assert first.evaluated == len(PREDICATES)
+        counted.clear()
+        second = _run(root, skillsets, cache_path=cache)
+        assert counted == []
+        assert second.cached == len(PREDICATES)
+        assert second.results == first.results
+
+    def test_changed_file_reevaluates_its_predicates(self, root, skillsets, counted):
+        cache = root / FITNESS_CACHE
+        _run(root, skillsets, cache_path=cache)
+        counted.clear()
+        write_file(root / "demo_bc" / "skills" / "demo-plan" / "SKILL.md", "# edited\n")
+        report = _run(root, skillsets, cache_path=cache)
+        assert sorted(counted) == [
+            "pipeline-skills-exist",
+            "references-resolve",
+            "skill-line-limit",
+        ]
+        assert report.evaluated == 3
+
+    def test_mode_change_reevaluates(self, root, skillsets, counted):
+        cache = root / FITNESS_CACHE
+        _run(root, skillsets, cache_path=cache)
+        counted.clear()
+        (root / "demo_bc" / "skills" / "demo-plan" / "scripts" / "record.sh").chmod(
+            0o644
+        )
+        report = _run(root, skillsets, cache_path=cache)
+        assert counted == ["scripts-executable"]
+        assert _by_name(report)["scripts-executable"].result == "partial"
+
+    def test_changed_description_reevaluates(self, root, skillsets, monkeypatch):
+        cache = root / FITNESS_CACHE
+        _run(root, skillsets, cache_path=cache)
+        pred = PREDICATES["skill-line-limit"]
+        monkeypatch.setitem(
+            PREDICATES,
+            pred.name,
+            fitness.Predicate(
+                pred.name, "Skill files are under 400 lines", pred.inputs, pred.check
+            ),
+        )
+        report = _run(root, skillsets, cache_path=cache)
+        assert report.evaluated == 1
+
+    def test_changed_code_reevaluates(self, root, skillsets, tmp_path, monkeypatch):
+        module = write_file(
+            tmp_path / "lib" / "demo_check.py",
+            "def check(target):\n    return 'pass', ['v1']\n",
+        )
+        monkeypatch.syspath_prepend(str(module.parent))
+        import demo_check
+
+        monkeypatch.setattr(
+            fitness,
+            "PREDICATES",
+            {"demo": fitness.Predicate("demo", "Demo", (), demo_check.check)},
+        )
+        cache = root / FITNESS_CACHE
+        assert _run(root, skillsets, cache_path=cache).evaluated == 1
+        assert _run(root, skillsets, cache_path=cache).evaluated == 0
+        module.write_text("def check(target):\n    return 'pass', ['v2']\n")
+        assert _run(root, skillsets, cache_path=cache).evaluated == 1
+
+
+class TestSkillFitnessCommand:
+    def test_prints_table(self, cli):
+        result = CliRunner().invoke(
+            cli,
+            ["skill-fitness", "--package", "skillset_engineering", "--no-cache"],
+        )
+        assert result.exit_code == 0, result.output
+        assert "| Predicate | Package | Result | Evidence |" in result.output
+        assert "| Bash scripts are executable | skillset_engineering | pass |" in (
+            result.output
+        )
+
+
+class TestRepoFitness:
+    """Conformance: every bounded-context package passes every predicate."""
+
+    def test_all_packages_fit(self):
+        report = evaluate()
+        assert {r.package for r in report.results} >= {
+            "business_model_canvas",
+            "skillset_engineering",
+            "wardley_mapping",
+        }
+        assert report.failed == []
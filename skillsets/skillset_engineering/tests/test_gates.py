@@ -0,0 +1,196 @@
+"""Tests for the pipeline gate graph, and the repo's gate continuity."""
+
+from __future__ import annotations
+
+import pytest
+
+from practice.exceptions import NotFoundError
+from skillset_engineering.dtos import CheckPipelinesRequest, GetNextStageRequest
+from skillset_engineering.gates import GateGraph, load_graph, snapshot
+from skillset_engineering.infrastructure import WorkspaceDirectories
+from skillset_engineering.usecases import CheckPipelinesUseCase, GetNextStageUseCase
+
+from .conftest import (
+    Projects,
+    make_project,
+    make_skillset,
+    make_stage,
+    touch_files,
+)
+
+
+MAPPING = make_skillset(
+    "mapping",
+    [
+        make_stage(1, "m-research", "resources/index.md", "brief.agreed.md"),
+        make_stage(2, "m-needs", "brief.agreed.md", "needs/needs.agreed.md"),
+        make_stage(3, "m-chain", "needs/needs.agreed.md", "chain/chain.agreed.md"),
+    ],
+)
+
+
+class TestIssues:
+    def test_continuous_pipeline(self):
+        assert GateGraph([MAPPING, make_skillset("empty", [])]).issues() == []
+
+    def test_gap_and_unreachable(self):
+        broken = make_skillset(
+            "broken",
+            [
+                make_stage(1, "b-brief", "resources/index.md", "brief.agreed.md"),
+                make_stage(2, "b-plan", "scope.agreed.md", "plan.agreed.md"),
+                make_stage(3, "b-build", "plan.agreed.md", "build.agreed.md"),
+            ],
+        )
+        issues = [(i.stage, i.kind) for i in GateGraph([broken]).issues()]
+        assert issues == [(2, "gap"), (2, "unreachable"), (3, "unreachable")]
+
+    def test_conflicting_producers(self):
+        twice = make_skillset(
+            "twice",
+            [
+                make_stage(1, "t-brief", "resources/index.md", "brief.agreed.md"),
+                make_stage(2, "t-redo", "brief.agreed.md", "brief.agreed.md"),
+            ],
+        )
+        [issue] = GateGraph([twice]).issues()
+        assert issue.kind == "conflict"
+        assert issue.message == "brief.agreed.md is also produced by stage 1 (t-brief)"
+
+    def test_gate_index(self):
+        gates = GateGraph([MAPPING]).gates()
+        assert gates["brief.agreed.md"] == ["mapping:1", "mapping:2"]
+        assert len(gates) == 4
+
+
+@pytest.fixture
+def client(tmp_path):
+    """A client workspace with its shared research gate."""
+    client = tmp_path / "clients" / "acme"
+    touch_files(client, "resources/index.md")
+    return client
+
+
+@pytest.fixture
+def project(client):
+    project = client / "engagements" / "strat-1" / "maps-1"
+    project.mkdir(parents=True)
+    return project
+
+
+class TestProgress:
+    def test_next_stage_from_snapshot(self, client, project):
+        touch_files(project, "brief.agreed.md")
+        graph = GateGraph([MAPPING])
+        progress = graph.progress("mapping", graph.files(project, client))
+        assert [s.state for s in progress.stages] == ["complete", "ready", "blocked"]
+        assert progress.next.skill == "m-needs"
+        assert not progress.complete
+
+    def test_entry_gate_read_from_client(self, client, project, tmp_path):
+        graph = GateGraph([MAPPING])
+        progress = graph.progress("mapping", graph.files(project, client))
+        assert progress.next.skill == "m-research"
+
+        bare = tmp_path / "bare"
+        touch_files(project, "resources/index.md")
+        progress = graph.progress("mapping", graph.files(project, bare))
+        assert progress.next is None
+
+    def test_all_complete(self, client, project):
+        touch_files(
+            project,
+            "brief.agreed.md",
+            "needs/needs.agreed.md",
+            "chain/chain.agreed.md",
+        )
+        graph = GateGraph([MAPPING])
+        progress = graph.progress("mapping", graph.files(project, client))
+        assert progress.complete
+        assert progress.next is None
+
+    def test_snapshot_skips_hidden_dirs(self, tmp_path):
+        touch_files(tmp_path, "brief.agreed.md", ".cache/m-needs.md", "atlas/x/map.owm")
+        assert snapshot(tmp_path) == {"brief.agreed.md", "atlas/x/map.owm"}
+
+    def test_unknown_skillset(self):
+        with pytest.raises(KeyError):
+            GateGraph([MAPPING]).progress("nope", frozenset())
+
+
+NEXT = GetNextStageRequest(client="acme", engagement="strat-1", project_slug="maps-1")
+
+
+class TestNextStageUseCase:
+    def _usecase(self, tmp_path, *projects):
+        return GetNextStageUseCase(
+            projects=Projects(*projects),
+            layout=WorkspaceDirectories(tmp_path / "clients"),
+            graph=lambda: GateGraph([MAPPING]),
+        )
+
+    def test_next_stage_of_the_project_skillset(self, tmp_path, project):
+        touch_files(project, "brief.agreed.md")
+        resp = self._usecase(tmp_path, make_project()).execute(NEXT)
+        assert resp.progress.skillset == "mapping"
+        assert resp.progress.next.skill == "m-needs"
+
+    def test_entry_gate_read_from_client(self, tmp_path, client, project):
+        usecase = self._usecase(tmp_path, make_project())
+        assert usecase.execute(NEXT).progress.next.skill == "m-research"
+
+        (client / "resources" / "index.md").unlink()
+        touch_files(project, "resources/index.md")
+        progress = usecase.execute(NEXT).progress
+        assert progress.next is None
+        assert progress.stages[0].state == "blocked"
+
+    def test_unknown_project(self, tmp_path, project):
+        with pytest.raises(NotFoundError, match="Project not found: acme/maps-1"):
+            self._usecase(tmp_path).execute(NEXT)
+
+    def test_skillset_without_pipeline(self, tmp_path, project):
+        usecase = self._usecase(tmp_path, make_project("canvas"))
+        with pytest.raises(NotFoundError, match="No pipeline for skillset: canvas"):
+            usecase.execute(NEXT)
+
+    def test_graph_loaded_once(self, tmp_path, project):
+        loads = []
+        usecase = GetNextStageUseCase(
+            projects=Projects(make_project()),
+            layout=WorkspaceDirectories(tmp_path / "clients"),
+            graph=lambda: loads.append(1) or GateGraph([MAPPING]),
+        )
+        usecase.execute(NEXT)
+        usecase.execute(NEXT)
+        assert loads == [1]
+
+
+class TestCheckPipelinesUseCase:
+    def test_repo_pipelines(self):
+        resp = CheckPipelinesUseCase().execute(CheckPipelinesRequest())
+        assert "wardley-mapping" in resp.skillsets
+        assert resp.gate_count > 0
+        assert resp.issues == []
+
+    def test_issues_reported(self):
+        broken = make_skillset(
+            "broken",
+            [
+                make_stage(1, "b-brief", "resources/index.md", "brief.agreed.md"),
+                make_stage(2, "b-plan", "scope.agreed.md", "plan.agreed.md"),
+            ],
+        )
+        resp = CheckPipelinesUseCase(lambda: GateGraph([broken])).execute(
+            CheckPipelinesRequest()
+        )
+        assert [i.kind for i in resp.issues] == ["gap", "unreachable"]
+
+
+class TestRepoGateGraph:
+    """Conformance: every registered pipeline is continuous."""
+
+    def test_no_gate_issues(self):
+        graph = load_graph()
+        assert "wardley-mapping" in graph.skillsets
+        assert graph.issues() == []
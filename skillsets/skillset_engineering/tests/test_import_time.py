@@ -0,0 +1,112 @@
+"""Lazy imports in the bounded-context packages.
+
+Every practice invocation imports every BC package and registers its
+commands, so anything a package does at import is paid by all
+commands. These tests run the imports in a fresh interpreter and fail
+when a package starts building models or importing its DTOs up front.
+They check what was loaded rather than how long it took, so they do
+not depend on the speed of the machine. ``_STARTUP``
+stands in for the ``practice`` entry point: it imports every BC
+package, registers their commands on a root group and prints help.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+BC_PACKAGES = (
+    "business_model_canvas",
+    "competitive_analysis",
+    "skillset_engineering",
+    "test_method",
+    "wardley_mapping",
+)
+
+_STARTUP = f"""
+import sys
+import click
+
+packages = [__import__(name) for name in {BC_PACKAGES!r}]
+
+@click.group()
+def practice():
+    pass
+
+for name in ("shared", "wardley_mapping", "skillset_engineering"):
+    __import__(f"{{name}}.cli", fromlist=["register_commands"]).register_commands(
+        practice
+    )
+practice.main(["--help"], prog_name="practice", standalone_mode=False)
+
+print("LOADED", *sorted(sys.modules))
+print("BUILT", *[p.__name__ for p in packages if "SKILLSETS" in vars(p)])
+"""
+
+
+def _run_startup(*flags: str) -> subprocess.CompletedProcess:
+    env = os.environ | {"PYTHONPATH": os.pathsep.join(sys.path)}
+    return subprocess.run(
+        [sys.executable, *flags, "-c", _STARTUP],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+
+def _tagged(stdout: str, tag: str) -> list[str]:
+    for line in stdout.splitlines():
+        if line.startswith(f"{tag} ") or line == tag:
+            return line.split()[1:]
+    raise AssertionError(f"no {tag} line in output")
+
+
+class TestLazyImports:
+    def test_help_lists_commands(self):
+        out = _run_startup().stdout
+        for command in (
+            "tour",
+            "map",
+            "atlas",
+            "run-batch",
+            "skill-tokens",
+            "skill-references",
+            "skill-context",
+            "skill-fitness",
+            "pipeline",
+        ):
+            assert command in out
+
+    def test_skillsets_not_built_at_import(self):
+        assert _tagged(_run_startup().stdout, "BUILT") == []
+
+    def test_dtos_and_services_not_imported(self):
+        loaded = set(_tagged(_run_startup().stdout, "LOADED"))
+        for module in (
+            "wardley_mapping.dtos",
+            "wardley_mapping.types",
+            "wardley_mapping.infrastructure",
+            "wardley_mapping.presenter",
+            "skillset_engineering.dtos",
+            "skillset_engineering.usecases",
+            "skillset_engineering.infrastructure",
+            "skillset_engineering.presenter",
+            "skillset_engineering.tokens",
+            "skillset_engineering.references",
+            "skillset_engineering.context",
+            "skillset_engineering.fitness",
+            "skillset_engineering.gates",
+        ):
+            assert module not in loaded
+
+    def test_skillsets_still_available(self):
+        import wardley_mapping
+
+        assert [s.name for s in wardley_mapping.SKILLSETS] == ["wardley-mapping"]
+        assert wardley_mapping.SKILLSETS is wardley_mapping.SKILLSETS
+        with pytest.raises(AttributeError):
+            wardley_mapping.NOT_AN_ATTRIBUTE  # noqa: B018
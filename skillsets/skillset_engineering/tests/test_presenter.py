@@ -9,6 +9,7 @@ import pytest
 
 from practice.content import ProjectContribution
 from practice.entities import Project, ProjectStatus
+from shared.pages import load_page
 from skillset_engineering.presenter import SkillsetEngineeringPresenter
 
 CLIENT = "test-corp"
@@ -103,6 +104,38 @@ class TestFullWorkspace:
         contrib = presenter.present(_make_project())
         assert "Pipeline Design" in contrib.overview_md
 
+    def test_design_read_once(self, full_workspace, monkeypatch):
+        reads = []
+        original = Path.read_text
+
+        def counting(self, *args, **kwargs):
+            reads.append(self.name)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", counting)
+        presenter = SkillsetEngineeringPresenter(workspace_root=full_workspace)
+        contrib = presenter.present(_make_project())
+        assert reads.count("design.agreed.md") == 1
+        assert contrib.overview_md is contrib.sections[0].pages[0].body_md
+
+    def test_stream_reads_bodies_on_load(self, full_workspace, monkeypatch):
+        reads = []
+        original = Path.read_text
+
+        def counting(self, *args, **kwargs):
+            reads.append(self.name)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", counting)
+        presenter = SkillsetEngineeringPresenter(workspace_root=full_workspace)
+        contrib, sections = presenter.stream(_make_project())
+        [section] = list(sections)
+        assert contrib.sections == []
+        assert reads == ["design.agreed.md"]
+        page = load_page(section.pages[1])
+        assert reads == ["design.agreed.md", "synthesis.agreed.md"]
+        assert page.body_md
+
 
 class TestEmptyWorkspace:
     def test_no_sections(self, tmp_path):
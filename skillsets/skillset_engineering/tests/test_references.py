@@ -0,0 +1,180 @@
+"""Tests for the shared reference store, and reference conformance."""
+
+from __future__ import annotations
+
+import pytest
+from click.testing import CliRunner
+
+from skillset_engineering.references import (
+    ReferenceStore,
+    declared_references,
+    duplicates,
+)
+from skillset_engineering.tokens import SKILLSETS_ROOT
+
+DSL = "# OWM DSL\n\ncomponent Name [visibility, maturity]\n"
+
+
+def _skill(package, name, references="", files=None):
+    skill = package / "skills" / name
+    skill.mkdir(parents=True)
+    declared = f"  references: {references}\n" if references else ""
+    (skill / "SKILL.md").write_text(
+        f"---\nname: {name}\ndescription: >\n  A skill.\n"
+        f"metadata:\n  skillset: demo\n{declared}---\n\n# {name}\n"
+    )
+    for rel, text in (files or {}).items():
+        path = skill / "references" / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+
+
+@pytest.fixture
+def package(tmp_path):
+    package = tmp_path / "demo_bc"
+    (package / "references").mkdir(parents=True)
+    (package / "references" / "dsl.md").write_text(DSL)
+    _skill(package, "demo-evolve", "dsl.md", {"template.md": "# Template\n"})
+    _skill(package, "demo-iterate", "dsl.md template.md", {"template.md": "# Own\n"})
+    _skill(package, "demo-needs")
+    return package
+
+
+class TestDeclaredReferences:
+    def test_space_separated_names(self, package):
+        skill = package / "skills" / "demo-iterate" / "SKILL.md"
+        assert declared_references(skill) == ["dsl.md", "template.md"]
+
+    def test_none_declared(self, package):
+        assert declared_references(package / "skills" / "demo-needs" / "SKILL.md") == []
+
+    def test_only_metadata_key_counts(self, tmp_path):
+        skill = tmp_path / "SKILL.md"
+        skill.write_text(
+            "---\nname: x\ndescription: >\n  references: not.md\n---\n"
+            "\nmetadata:\n  references: body.md\n"
+        )
+        assert declared_references(skill) == []
+
+
+class TestReferenceStore:
+    def test_shared_reference_resolves_to_store(self, package):
+        store = ReferenceStore(package)
+        assert (
+            store.resolve("demo-evolve", "dsl.md") == package / "references" / "dsl.md"
+        )
+
+    def test_skill_copy_wins(self, package):
+        resolved = ReferenceStore(package).resolve_all("demo-iterate")
+        assert resolved == {
+            "dsl.md": package / "references" / "dsl.md",
+            "template.md": package / "skills/demo-iterate/references/template.md",
+        }
+
+    def test_missing_reference(self, package):
+        store = ReferenceStore(package)
+        with pytest.raises(FileNotFoundError, match="nothing.md"):
+            store.resolve("demo-needs", "nothing.md")
+        _skill(package, "demo-broken", "nothing.md")
+        assert store.unresolved() == ["demo-broken: nothing.md"]
+
+
+class TestLinks:
+    def test_link_makes_skill_self_contained(self, package):
+        store = ReferenceStore(package)
+        assert store.unlinked() == ["demo-evolve: dsl.md", "demo-iterate: dsl.md"]
+        link = store.link("demo-evolve", "dsl.md")
+        assert link == package / "skills/demo-evolve/references/dsl.md"
+        assert link.readlink().as_posix() == "../../../references/dsl.md"
+        assert store.resolve("demo-evolve", "dsl.md") == link
+        assert store.unlinked() == ["demo-iterate: dsl.md"]
+        assert store.link("demo-evolve", "dsl.md") == link
+        assert duplicates(package.parent) == []
+
+    def test_link_resolves_through_symlinked_skill(self, package, tmp_path):
+        ReferenceStore(package).link("demo-evolve", "dsl.md")
+        installed = tmp_path / ".claude" / "skills" / "demo-evolve"
+        installed.parent.mkdir(parents=True)
+        installed.symlink_to(package / "skills" / "demo-evolve")
+        assert (installed / "references" / "dsl.md").read_text() == DSL
+
+    def test_link_refuses_to_replace_skill_copy(self, package):
+        store = ReferenceStore(package)
+        (package / "references" / "template.md").write_text("# Shared\n")
+        with pytest.raises(FileExistsError):
+            store.link("demo-iterate", "template.md")
+        with pytest.raises(FileNotFoundError):
+            store.link("demo-needs", "nothing.md")
+
+
+class TestDuplicates:
+    def test_distinct_content_passes(self, package):
+        assert duplicates(package.parent) == []
+
+    def test_copied_reference_detected(self, package):
+        _skill(package, "demo-strategy", "", {"dsl.md": DSL})
+        _skill(package.parent / "other_bc", "other-skill", "", {"owm.md": DSL})
+        [duplicate] = duplicates(package.parent)
+        assert duplicate.paths == [
+            "demo_bc/references/dsl.md",
+            "demo_bc/skills/demo-strategy/references/dsl.md",
+            "other_bc/skills/other-skill/references/owm.md",
+        ]
+
+
+class TestSkillReferencesCommand:
+    def test_prints_canonical_paths(self, cli, package):
+        result = CliRunner().invoke(
+            cli, ["skill-references", "demo-evolve", "--root", str(package.parent)]
+        )
+        assert result.exit_code == 0, result.output
+        assert result.output == f"dsl.md\t{package / 'references' / 'dsl.md'}\n"
+
+    def test_link_option(self, cli, package):
+        result = CliRunner().invoke(
+            cli,
+            [
+                "skill-references",
+                "demo-evolve",
+                "--root",
+                str(package.parent),
+                "--link",
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        link = package / "skills" / "demo-evolve" / "references" / "dsl.md"
+        assert result.output == f"dsl.md\t{link}\n"
+        assert link.is_symlink()
+
+    def test_unknown_skill(self, cli, package):
+        result = CliRunner().invoke(
+            cli, ["skill-references", "nope", "--root", str(package.parent)]
+        )
+        assert result.exit_code == 1
+        assert "Skill not found: nope" in result.output
+
+
+class TestRepoReferences:
+    """Conformance: one copy of each reference, and declarations resolve."""
+
+    def test_no_duplicate_reference_content(self):
+        assert duplicates() == []
+
+    def test_declared_references_resolve(self):
+        for package_dir in sorted(p.parent for p in SKILLSETS_ROOT.glob("*/skills")):
+            assert ReferenceStore(package_dir).unresolved() == []
+
+    def test_skills_self_contained(self):
+        for package_dir in sorted(p.parent for p in SKILLSETS_ROOT.glob("*/skills")):
+            assert ReferenceStore(package_dir).unlinked() == []
+            for skill_file in package_dir.glob("skills/*/SKILL.md"):
+                assert "](../../references/" not in skill_file.read_text(), skill_file
+
+    def test_shared_references_declared_by_their_readers(self):
+        for package_dir in sorted(p.parent for p in SKILLSETS_ROOT.glob("*/skills")):
+            store = ReferenceStore(package_dir)
+            for skill in store.skills():
+                text = (package_dir / "skills" / skill / "SKILL.md").read_text()
+                for shared in store.shared_dir.glob("*"):
+                    if f"](references/{shared.name})" in text:
+                        assert shared.name in store.declared(skill), skill
@@ -0,0 +1,139 @@
+"""Tests for the skill token analyzer, and the repo's token budgets."""
+
+from __future__ import annotations
+
+import pytest
+from click.testing import CliRunner
+
+from skillset_engineering.tokens import (
+    SKILL_LINE_LIMIT,
+    TOKEN_CACHE,
+    TokenCache,
+    WordTokenizer,
+    analyse,
+    get_tokenizer,
+)
+
+from .conftest import write_file
+
+
+class CountingTokenizer(WordTokenizer):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def count(self, text: str) -> int:
+        self.calls += 1
+        return super().count(text)
+
+
+@pytest.fixture
+def root(tmp_path):
+    skill = tmp_path / "demo_bc" / "skills" / "demo-assess"
+    write_file(skill / "SKILL.md", "# Assess\n\nRead the brief.\n")
+    write_file(skill / "references" / "executive.md", "word " * 300)
+    write_file(skill / "references" / "methodology.md", "word " * 30)
+    write_file(tmp_path / "demo_bc" / "skills" / "demo-plan" / "SKILL.md", "line\n" * 3)
+    write_file(tmp_path / "demo_bc" / "docs" / "notes.md", "not a skill")
+    return tmp_path
+
+
+class TestAnalyse:
+    def test_per_file_and_per_skill_counts(self, root):
+        report = analyse(root)
+        assert [s.skill for s in report.skills] == ["demo-assess", "demo-plan"]
+        assess = report.skills[0]
+        assert assess.skillset_package == "demo_bc"
+        assert [f.path for f in assess.files] == [
+            "demo_bc/skills/demo-assess/SKILL.md",
+            "demo_bc/skills/demo-assess/references/executive.md",
+            "demo_bc/skills/demo-assess/references/methodology.md",
+        ]
+        assert [f.tokens for f in assess.files] == [7, 400, 40]
+        assert assess.tokens == 447
+        assert report.tokens == 447 + 4
+
+    def test_last_line_without_newline_counted(self, root):
+        report = analyse(root)
+        assess, plan = report.skills
+        assert [f.lines for f in assess.files] == [3, 1, 1]
+        assert [f.lines for f in plan.files] == [3]
+
+    def test_budget_violations_flagged(self, root):
+        assert analyse(root).violations == []
+        write_file(
+            root / "demo_bc" / "skills" / "demo-assess" / "references" / "executive.md",
+            "word " * 400,
+        )
+        write_file(
+            root / "demo_bc" / "skills" / "demo-plan" / "SKILL.md",
+            "line\n" * (SKILL_LINE_LIMIT + 1),
+        )
+        assert analyse(root).violations == [
+            (
+                "demo_bc/skills/demo-assess/references/executive.md: "
+                "534 tokens exceeds budget of 500"
+            ),
+            "demo_bc/skills/demo-plan/SKILL.md: 501 lines exceeds limit of 500",
+        ]
+
+    def test_cache_keyed_by_content(self, root):
+        path = root / TOKEN_CACHE
+        tokenizer = CountingTokenizer()
+        analyse(root, tokenizer, TokenCache(path))
+        assert tokenizer.calls == 4
+
+        tokenizer = CountingTokenizer()
+        cache = TokenCache(path)
+        analyse(root, tokenizer, cache)
+        assert tokenizer.calls == 0
+        assert cache.hits == 4
+
+        write_file(root / "demo_bc" / "skills" / "demo-plan" / "SKILL.md", "edited\n")
+        tokenizer = CountingTokenizer()
+        analyse(root, tokenizer, TokenCache(path))
+        assert tokenizer.calls == 1
+
+    def test_cache_separates_tokenizers(self, root):
+        path = root / TOKEN_CACHE
+        analyse(root, WordTokenizer(), TokenCache(path))
+        report = analyse(root, WordTokenizer(words_per_token=1), TokenCache(path))
+        assert report.skills[0].files[1].tokens == 300
+
+    def test_corrupt_cache_ignored(self, root):
+        (root / TOKEN_CACHE).write_text("{not json")
+        assert analyse(root, cache=TokenCache(root / TOKEN_CACHE)).tokens == 451
+
+    def test_unknown_tokenizer(self):
+        with pytest.raises(ValueError, match="Unknown tokenizer"):
+            get_tokenizer("bytes")
+
+
+class TestSkillTokensCommand:
+    def test_reports_and_caches(self, cli, root):
+        result = CliRunner().invoke(cli, ["skill-tokens", "--root", str(root)])
+        assert result.exit_code == 0, result.output
+        assert "demo-assess" in result.output
+        assert "451 tokens in 2 skills" in result.output
+        assert (root / TOKEN_CACHE).is_file()
+
+    def test_violation_exits_nonzero(self, cli, root):
+        write_file(
+            root / "demo_bc" / "skills" / "demo-assess" / "references" / "executive.md",
+            "word " * 400,
+        )
+        result = CliRunner().invoke(
+            cli, ["skill-tokens", "--root", str(root), "--no-cache"]
+        )
+        assert result.exit_code == 1
+        assert "Over budget" in result.output
+        assert not (root / TOKEN_CACHE).exists()
+
+
+class TestRepoTokenBudgets:
+    """Conformance: every skill in this tree is within its budgets."""
+
+    def test_skill_files_within_budget(self):
+        report = analyse()
+        assert report.skills
+        assert report.violations == []
@@ -0,0 +1,265 @@
+"""Token counts for skill files and semantic bytecode budgets.
+
+``semantic-bytecode-format.md`` budgets each bytecode level:
+``executive.md`` (L0) at 500 tokens, ``domain-model.md`` (L1) at 1500
+and ``methodology.md`` (L2) at 3000. The context-efficiency strategy
+also caps ``SKILL.md`` at 500 lines. ``analyse`` counts every markdown
+file under each bounded context's ``skills/`` tree, totals them per
+skill and flags files over their budget, so a context audit reads a
+report instead of estimating by hand.
+
+Tokenizers are pluggable. ``WordTokenizer`` is a fast estimate from
+word counts; ``TiktokenTokenizer`` gives exact BPE counts when the
+optional ``tiktoken`` package is installed. Counts are cached by the
+SHA-256 of each file and the tokenizer name, so unchanged files are
+not tokenized again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+from pathlib import Path
+from typing import Protocol
+
+from pydantic import BaseModel
+
+SKILLSETS_ROOT = Path(__file__).resolve().parent.parent
+TOKEN_CACHE = ".token-cache.json"
+TOKEN_CACHE_VERSION = 1
+
+# Semantic bytecode levels, by file name
+TOKEN_BUDGETS = {
+    "executive.md": 500,
+    "domain-model.md": 1500,
+    "methodology.md": 3000,
+}
+SKILL_LINE_LIMIT = 500
+
+
+# ---------------------------------------------------------------------------
+# Tokenizers
+# ---------------------------------------------------------------------------
+
+
+class Tokenizer(Protocol):
+    """Counts the tokens in a text. ``name`` keys the cache."""
+
+    name: str
+
+    def count(self, text: str) -> int: ...
+
+
+class WordTokenizer:
+    """Estimate tokens from whitespace-separated words.
+
+    English prose runs at about 0.75 words per token with BPE
+    tokenizers, so the estimate is ``ceil(words / 0.75)``.
+    """
+
+    def __init__(self, words_per_token: float = 0.75) -> None:
+        self.words_per_token = words_per_token
+        self.name = f"words-{words_per_token:g}"
+
+    def count(self, text: str) -> int:
+        return math.ceil(len(text.split()) / self.words_per_token)
+
+
+class TiktokenTokenizer:
+    """Exact counts from a ``tiktoken`` encoding."""
+
+    def __init__(self, encoding: str = "cl100k_base") -> None:
+        import tiktoken
+
+        self._encoding = tiktoken.get_encoding(encoding)
+        self.name = f"tiktoken-{encoding}"
+
+    def count(self, text: str) -> int:
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+
+TOKENIZERS = {
+    "words": WordTokenizer,
+    "tiktoken": TiktokenTokenizer,
+}
+
+
+def get_tokenizer(name: str) -> Tokenizer:
+    """Build a tokenizer by name.
+
+    Raises ValueError for an unknown name or when its package is not
+    installed.
+    """
+    try:
+        factory = TOKENIZERS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown tokenizer {name!r}; choose from {', '.join(TOKENIZERS)}"
+        ) from None
+    try:
+        return factory()
+    except ImportError as exc:
+        raise ValueError(f"Tokenizer {name!r} is not available: {exc}") from exc
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+
+class TokenCache:
+    """Token counts keyed by tokenizer name and file SHA-256.
+
+    Loaded from and saved to a JSON file; a missing or unreadable file
+    starts an empty cache. Entries for files no longer seen are dropped
+    on save.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self._old: dict[str, dict[str, int]] = self._load()
+        self._new: dict[str, dict[str, int]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> dict[str, dict[str, int]]:
+        if self.path is None:
+            return {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != TOKEN_CACHE_VERSION:
+            return {}
+        return data.get("counts", {})
+
+    def count(self, tokenizer: Tokenizer, content: bytes) -> int:
+        digest = hashlib.sha256(content).hexdigest()
+        tokens = self._old.get(tokenizer.name, {}).get(digest)
+        if tokens is None:
+            self.misses += 1
+            tokens = tokenizer.count(content.decode("utf-8"))
+        else:
+            self.hits += 1
+        self._new.setdefault(tokenizer.name, {})[digest] = tokens
+        return tokens
+
+    def save(self) -> None:
+        if self.path is None or self._new == self._old:
+            return
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(
+            json.dumps(
+                {"version": TOKEN_CACHE_VERSION, "counts": self._new},
+                indent=2,
+                sort_keys=True,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+        os.replace(tmp, self.path)
+
+
+# ---------------------------------------------------------------------------
+# Report
+# ---------------------------------------------------------------------------
+
+
+class FileTokens(BaseModel):
+    """Token and line counts of one skill file, with any limits that apply."""
+
+    path: str
+    tokens: int
+    lines: int
+    token_budget: int | None = None
+    line_limit: int | None = None
+
+    @property
+    def violations(self) -> list[str]:
+        found = []
+        if self.token_budget is not None and self.tokens > self.token_budget:
+            found.append(
+                f"{self.path}: {self.tokens} tokens exceeds budget "
+                f"of {self.token_budget}"
+            )
+        if self.line_limit is not None and self.lines > self.line_limit:
+            found.append(
+                f"{self.path}: {self.lines} lines exceeds limit of {self.line_limit}"
+            )
+        return found
+
+
+class SkillTokens(BaseModel):
+    """All markdown files of one skill."""
+
+    skillset_package: str
+    skill: str
+    files: list[FileTokens]
+
+    @property
+    def tokens(self) -> int:
+        return sum(f.tokens for f in self.files)
+
+
+class TokenReport(BaseModel):
+    """Token counts of every skill under a skillsets root."""
+
+    tokenizer: str
+    skills: list[SkillTokens]
+
+    @property
+    def tokens(self) -> int:
+        return sum(s.tokens for s in self.skills)
+
+    @property
+    def violations(self) -> list[str]:
+        return [v for s in self.skills for f in s.files for v in f.violations]
+
+
+# ---------------------------------------------------------------------------
+# Analysis
+# ---------------------------------------------------------------------------
+
+
+def _limits(path: Path) -> tuple[int | None, int | None]:
+    """(token budget, line limit) for a skill file."""
+    if path.name == "SKILL.md":
+        return None, SKILL_LINE_LIMIT
+    return TOKEN_BUDGETS.get(path.name), None
+
+
+def analyse(
+    root: Path = SKILLSETS_ROOT,
+    tokenizer: Tokenizer | None = None,
+    cache: TokenCache | None = None,
+) -> TokenReport:
+    """Count tokens in every ``<package>/skills/<skill>/**/*.md`` under *root*."""
+    tokenizer = tokenizer or WordTokenizer()
+    cache = cache or TokenCache()
+    skills = []
+    for skill_dir in sorted(root.glob("*/skills/*/")):
+        files = []
+        for path in sorted(skill_dir.rglob("*.md")):
+            content = path.read_bytes()
+            budget, line_limit = _limits(path)
+            files.append(
+                FileTokens(
+                    path=path.relative_to(root).as_posix(),
+                    tokens=cache.count(tokenizer, content),
+                    lines=len(content.splitlines()),
+                    token_budget=budget,
+                    line_limit=line_limit,
+                )
+            )
+        if files:
+            skills.append(
+                SkillTokens(
+                    skillset_package=skill_dir.parent.parent.name,
+                    skill=skill_dir.name,
+                    files=files,
+                )
+            )
+    cache.save()
+    return TokenReport(tokenizer=tokenizer.name, skills=skills)
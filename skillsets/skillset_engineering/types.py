@@ -0,0 +1,35 @@
+"""Ports the Skillset Engineering usecases depend on."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    from practice.entities import Project
+
+
+@runtime_checkable
+class ProjectLookup(Protocol):
+    """Project lookup by natural key.
+
+    ProjectRepository already satisfies this shape, so DI passes it
+    through with no adapter.
+    """
+
+    def get(self, client: str, engagement: str, slug: str) -> Project | None:
+        """Return the project, or None if it does not exist."""
+        ...
+
+
+@runtime_checkable
+class WorkspaceLayout(Protocol):
+    """Where a client's shared files and a project's files live."""
+
+    def client_dir(self, client: str) -> Path:
+        """Client workspace holding ``resources/``."""
+        ...
+
+    def project_dir(self, client: str, engagement: str, project_slug: str) -> Path:
+        """Directory holding a project's artifacts."""
+        ...
@@ -0,0 +1,140 @@
+"""Skillset Engineering usecase implementations."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+
+from practice.exceptions import NotFoundError
+from skillset_engineering.context import compile_pack
+from skillset_engineering.dtos import (
+    CheckPipelinesRequest,
+    CheckPipelinesResponse,
+    CompileSkillContextRequest,
+    CompileSkillContextResponse,
+    GetNextStageRequest,
+    GetNextStageResponse,
+)
+from skillset_engineering.gates import GateGraph, load_graph
+from skillset_engineering.tokens import SKILLSETS_ROOT, get_tokenizer
+from skillset_engineering.types import ProjectLookup, WorkspaceLayout
+
+
+class _Graph:
+    """The gate graph, loaded on first use and kept for later requests."""
+
+    def __init__(self, load: Callable[[], GateGraph]) -> None:
+        self._load = load
+        self._graph: GateGraph | None = None
+
+    def get(self) -> GateGraph:
+        if self._graph is None:
+            self._graph = self._load()
+        return self._graph
+
+
+class GetNextStageUseCase:
+    """Validate project existence then report where its pipeline stands.
+
+    Entry gates are read from the client workspace and every other
+    gate from the project directory (see ``GateGraph.files``).
+    """
+
+    def __init__(
+        self,
+        projects: ProjectLookup,
+        layout: WorkspaceLayout,
+        graph: Callable[[], GateGraph] = load_graph,
+    ) -> None:
+        self._projects = projects
+        self._layout = layout
+        self._graph = _Graph(graph)
+
+    def execute(self, request: GetNextStageRequest) -> GetNextStageResponse:
+        project = self._projects.get(
+            request.client, request.engagement, request.project_slug
+        )
+        if project is None:
+            raise NotFoundError(
+                f"Project not found: {request.client}/{request.project_slug}"
+            )
+
+        graph = self._graph.get()
+        if project.skillset not in graph.skillsets:
+            raise NotFoundError(f"No pipeline for skillset: {project.skillset}")
+        files = graph.files(
+            self._layout.project_dir(
+                request.client, request.engagement, request.project_slug
+            ),
+            self._layout.client_dir(request.client),
+        )
+        return GetNextStageResponse(
+            client=request.client,
+            project_slug=request.project_slug,
+            progress=graph.progress(project.skillset, files),
+        )
+
+
+class CheckPipelinesUseCase:
+    """Report gate continuity issues across every registered pipeline."""
+
+    def __init__(self, graph: Callable[[], GateGraph] = load_graph) -> None:
+        self._graph = _Graph(graph)
+
+    def execute(self, request: CheckPipelinesRequest) -> CheckPipelinesResponse:
+        graph = self._graph.get()
+        return CheckPipelinesResponse(
+            skillsets=graph.skillsets,
+            gate_count=len(graph.gates()),
+            issues=graph.issues(),
+        )
+
+
+class CompileSkillContextUseCase:
+    """Validate project existence then compile a skill's context pack for it.
+
+    Packs are written under *cache_dir* (default: the user's cache, see
+    ``skillset_engineering.context.default_cache_dir``).
+    """
+
+    def __init__(
+        self,
+        projects: ProjectLookup,
+        layout: WorkspaceLayout,
+        root: Path = SKILLSETS_ROOT,
+        cache_dir: Path | None = None,
+    ) -> None:
+        self._projects = projects
+        self._layout = layout
+        self._root = root
+        self._cache_dir = cache_dir
+
+    def execute(
+        self, request: CompileSkillContextRequest
+    ) -> CompileSkillContextResponse:
+        if (
+            self._projects.get(request.client, request.engagement, request.project_slug)
+            is None
+        ):
+            raise NotFoundError(
+                f"Project not found: {request.client}/{request.project_slug}"
+            )
+
+        try:
+            pack = compile_pack(
+                request.skill,
+                self._layout.project_dir(
+                    request.client, request.engagement, request.project_slug
+                ),
+                self._root,
+                get_tokenizer(request.tokenizer),
+                include_skill=request.include_skill,
+                cache_dir=self._cache_dir,
+            )
+        except FileNotFoundError as exc:
+            raise NotFoundError(str(exc)) from exc
+        return CompileSkillContextResponse(
+            client=request.client,
+            project_slug=request.project_slug,
+            pack=pack,
+        )
@@ -1,6 +1,13 @@
 """Test Method bounded context."""
 
-from practice.entities import Skillset
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from shared.lazy import lazy_skillsets
+
+if TYPE_CHECKING:
+    from practice.entities import Skillset
 
 
 def _create_presenter(workspace_root, repo_root):
@@ -11,12 +18,19 @@ def _create_presenter(workspace_root, repo_root):
 
 PRESENTER_FACTORY = ("test-method", _create_presenter)
 
-SKILLSETS: list[Skillset] = [
-    Skillset(
-        name="test-method",
-        display_name="Test Method",
-        description="Updated.",
-        slug_pattern="test-{n}",
-        problem_domain="Testing",
-    ),
-]
+
+def _skillsets() -> list[Skillset]:
+    from practice.entities import Skillset
+
+    return [
+        Skillset(
+            name="test-method",
+            display_name="Test Method",
+            description="Updated.",
+            slug_pattern="test-{n}",
+            problem_domain="Testing",
+        ),
+    ]
+
+
+__getattr__ = lazy_skillsets(__name__, _skillsets)
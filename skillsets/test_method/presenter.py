@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
 
-from practice.content import ProjectContribution
+from practice.content import ProjectContribution, ProjectSection
 from practice.entities import Project
+from shared.pages import load_section
 
 
 class TestMethodPresenter:
@@ -15,7 +17,16 @@ class TestMethodPresenter:
         self._ws_root = workspace_root
 
     def present(self, project: Project) -> ProjectContribution:
-        return ProjectContribution(
+        contribution, sections = self.stream(project)
+        return contribution.model_copy(
+            update={"sections": [load_section(s) for s in sections]}
+        )
+
+    def stream(
+        self, project: Project
+    ) -> tuple[ProjectContribution, Iterator[ProjectSection]]:
+        """The contribution without its sections, and a generator of them."""
+        contribution = ProjectContribution(
             slug=project.slug,
             title=project.slug,
             skillset=project.skillset,
@@ -24,3 +35,4 @@ class TestMethodPresenter:
             overview_md="",
             sections=[],
         )
+        return contribution, iter(())
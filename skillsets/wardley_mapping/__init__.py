@@ -2,18 +2,43 @@
 
 from __future__ import annotations
 
-from practice.discovery import PipelineStage
-from practice.entities import Skillset
+from typing import TYPE_CHECKING
+
+from shared.lazy import lazy_skillsets
+
+if TYPE_CHECKING:
+    from practice.entities import Skillset
+
+
+TOUR_DATABASE = "tours.sqlite3"
+
+
+def _tour_repository(workspace_root):
+    """SQLite tours if the workspace has opted in, else JSON with a catalog.
+
+    A workspace opts in by creating ``tours.sqlite3`` at its root, for
+    example with ``SqliteTourManifestRepository(path).import_workspace``.
+    """
+    from wardley_mapping.infrastructure import (
+        CatalogTourManifestRepository,
+        SqliteTourManifestRepository,
+    )
+
+    db_path = workspace_root / TOUR_DATABASE
+    if db_path.is_file():
+        return SqliteTourManifestRepository(db_path)
+    return CatalogTourManifestRepository(workspace_root)
 
 
 def _create_presenter(workspace_root, repo_root):
-    from wardley_mapping.infrastructure import JsonTourManifestRepository
     from wardley_mapping.presenter import WardleyProjectPresenter
 
+    batch_script = repo_root / "bin" / "owm-batch.sh"
     return WardleyProjectPresenter(
         workspace_root=workspace_root,
         ensure_owm_script=repo_root / "bin" / "ensure-owm.sh",
-        tours=JsonTourManifestRepository(workspace_root),
+        tours=_tour_repository(workspace_root),
+        owm_batch_command=[str(batch_script)] if batch_script.is_file() else None,
     )
 
 
@@ -22,67 +47,110 @@ PRESENTER_FACTORY = ("wardley-mapping", _create_presenter)
 
 def register_services(container) -> None:
     """Register WM-specific services on the DI container."""
-    from wardley_mapping.infrastructure import JsonTourManifestRepository
-    from wardley_mapping.usecases import RegisterTourUseCase
+    from wardley_mapping.infrastructure import (
+        FileAtlasIndex,
+        FileMapAnalytics,
+        FileTourStopChecker,
+    )
+    from wardley_mapping.usecases import (
+        AnalyseMapUseCase,
+        GetAtlasStatusUseCase,
+        ListToursUseCase,
+        RecordAtlasViewUseCase,
+        RegisterToursBatchUseCase,
+        RegisterTourUseCase,
+    )
 
-    container.tours = JsonTourManifestRepository(container.config.workspace_root)
+    container.tours = _tour_repository(container.config.workspace_root)
+    container.tour_stops = FileTourStopChecker(container.config.workspace_root)
     container.register_tour_usecase = RegisterTourUseCase(
         projects=container.projects,
         tours=container.tours,
+        stops=container.tour_stops,
+    )
+    container.register_tours_batch_usecase = RegisterToursBatchUseCase(
+        projects=container.projects,
+        tours=container.tours,
+        stops=container.tour_stops,
+    )
+    container.list_tours_usecase = ListToursUseCase(
+        projects=container.projects,
+        tours=container.tours,
+    )
+    container.map_analytics = FileMapAnalytics(container.config.workspace_root)
+    container.analyse_map_usecase = AnalyseMapUseCase(
+        projects=container.projects,
+        analytics=container.map_analytics,
+    )
+    container.atlas_index = FileAtlasIndex(container.config.workspace_root)
+    container.get_atlas_status_usecase = GetAtlasStatusUseCase(
+        projects=container.projects,
+        atlas=container.atlas_index,
+    )
+    container.record_atlas_view_usecase = RecordAtlasViewUseCase(
+        projects=container.projects,
+        atlas=container.atlas_index,
     )
 
 
-SKILLSETS: list[Skillset] = [
-    Skillset(
-        name="wardley-mapping",
-        display_name="Wardley Mapping",
-        description=(
-            "Strategic mapping methodology that positions components by"
-            " visibility to the user and evolutionary maturity. Produces"
-            " OWM map files suitable for strategic decision-making."
-        ),
-        slug_pattern="maps-{n}",
-        pipeline=[
-            PipelineStage(
-                order=1,
-                skill="wm-research",
-                prerequisite_gate="resources/index.md",
-                produces_gate="brief.agreed.md",
-                description="Stage 1: Project brief agreed",
-                consumes=["topics", "confidence"],
-            ),
-            PipelineStage(
-                order=2,
-                skill="wm-needs",
-                prerequisite_gate="brief.agreed.md",
-                produces_gate="needs/needs.agreed.md",
-                description="Stage 2: User needs agreed",
-                consumes=["scope", "context"],
-            ),
-            PipelineStage(
-                order=3,
-                skill="wm-chain",
-                prerequisite_gate="needs/needs.agreed.md",
-                produces_gate="chain/supply-chain.agreed.md",
-                description="Stage 3: Supply chain agreed",
-                consumes=["users", "needs"],
-            ),
-            PipelineStage(
-                order=4,
-                skill="wm-evolve",
-                prerequisite_gate="chain/supply-chain.agreed.md",
-                produces_gate="evolve/map.agreed.owm",
-                description="Stage 4: Evolution map agreed",
-                consumes=["components", "dependencies"],
-            ),
-            PipelineStage(
-                order=5,
-                skill="wm-strategy",
-                prerequisite_gate="evolve/map.agreed.owm",
-                produces_gate="strategy/map.agreed.owm",
-                description="Stage 5: Strategy map agreed",
-                consumes=["components", "evolution"],
+def _skillsets() -> list[Skillset]:
+    from practice.discovery import PipelineStage
+    from practice.entities import Skillset
+
+    return [
+        Skillset(
+            name="wardley-mapping",
+            display_name="Wardley Mapping",
+            description=(
+                "Strategic mapping methodology that positions components by"
+                " visibility to the user and evolutionary maturity. Produces"
+                " OWM map files suitable for strategic decision-making."
             ),
-        ],
-    ),
-]
+            slug_pattern="maps-{n}",
+            pipeline=[
+                PipelineStage(
+                    order=1,
+                    skill="wm-research",
+                    prerequisite_gate="resources/index.md",
+                    produces_gate="brief.agreed.md",
+                    description="Stage 1: Project brief agreed",
+                    consumes=["topics", "confidence"],
+                ),
+                PipelineStage(
+                    order=2,
+                    skill="wm-needs",
+                    prerequisite_gate="brief.agreed.md",
+                    produces_gate="needs/needs.agreed.md",
+                    description="Stage 2: User needs agreed",
+                    consumes=["scope", "context"],
+                ),
+                PipelineStage(
+                    order=3,
+                    skill="wm-chain",
+                    prerequisite_gate="needs/needs.agreed.md",
+                    produces_gate="chain/supply-chain.agreed.md",
+                    description="Stage 3: Supply chain agreed",
+                    consumes=["users", "needs"],
+                ),
+                PipelineStage(
+                    order=4,
+                    skill="wm-evolve",
+                    prerequisite_gate="chain/supply-chain.agreed.md",
+                    produces_gate="evolve/map.agreed.owm",
+                    description="Stage 4: Evolution map agreed",
+                    consumes=["components", "dependencies"],
+                ),
+                PipelineStage(
+                    order=5,
+                    skill="wm-strategy",
+                    prerequisite_gate="evolve/map.agreed.owm",
+                    produces_gate="strategy/map.agreed.owm",
+                    description="Stage 5: Strategy map agreed",
+                    consumes=["components", "evolution"],
+                ),
+            ],
+        ),
+    ]
+
+
+__getattr__ = lazy_skillsets(__name__, _skillsets)
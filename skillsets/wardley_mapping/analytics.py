@@ -0,0 +1,246 @@
+"""Graph analytics over parsed Wardley maps.
+
+Computes, in one pass over an ``OwmMap``, everything the connectivity
+atlas views otherwise derive by hand: direct and transitive fan-in and
+fan-out, per-anchor reachability, need traces, shared components and
+visibility layers.
+
+Reachability sets are Python ints used as bitsets: bit ``j`` of
+``reach[i]`` is set when node ``i`` depends on node ``j``, directly or
+transitively. Unions are single big-int ORs, so the closure of a
+500-node map costs a few thousand word operations.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+from wardley_mapping.owm import OwmMap
+from wardley_mapping.types import (
+    ComponentMetrics,
+    MapAnalytics,
+    NeedTrace,
+    SharedComponent,
+    VisibilityLayer,
+)
+
+# Bump when the shape or meaning of MapAnalytics changes, so cached
+# results computed by an older engine are not served.
+ANALYTICS_VERSION = "1"
+
+# Visibility bands from wm-atlas-layers: (name, lower bound inclusive)
+LAYERS = (
+    ("user-visible", 0.80),
+    ("capabilities", 0.45),
+    ("infrastructure", 0.0),
+)
+BOUNDARY_MARGIN = 0.05
+
+
+def _postorder(adj: list[list[int]]) -> list[int]:
+    """Iterative DFS post-order: successors before predecessors on a DAG."""
+    seen = [False] * len(adj)
+    order: list[int] = []
+    for root in range(len(adj)):
+        if seen[root]:
+            continue
+        seen[root] = True
+        stack: list[tuple[int, int]] = [(root, 0)]
+        while stack:
+            node, i = stack[-1]
+            if i < len(adj[node]):
+                stack[-1] = (node, i + 1)
+                nxt = adj[node][i]
+                if not seen[nxt]:
+                    seen[nxt] = True
+                    stack.append((nxt, 0))
+            else:
+                stack.pop()
+                order.append(node)
+    return order
+
+
+def transitive_closure(adj: list[list[int]]) -> list[int]:
+    """Bitset reachability for every node of an adjacency list.
+
+    One sweep in post-order settles a DAG; cycles (which a well-formed
+    map should not have) converge with further sweeps.
+    """
+    order = _postorder(adj)
+    reach = [0] * len(adj)
+    changed = True
+    while changed:
+        changed = False
+        for node in order:
+            bits = reach[node]
+            for nxt in adj[node]:
+                bits |= (1 << nxt) | reach[nxt]
+            if bits != reach[node]:
+                reach[node] = bits
+                changed = True
+    return reach
+
+
+def _bits(mask: int) -> Iterator[int]:
+    """Yield the set bit positions of a mask in ascending order."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _heights(adj: list[list[int]]) -> list[int]:
+    """Longest path (in edges) from each node down to a leaf.
+
+    Exact on a DAG. A back edge in a cycle counts as one step, which
+    keeps the result finite.
+    """
+    height = [0] * len(adj)
+    for node in _postorder(adj):
+        height[node] = max((height[n] + 1 for n in adj[node]), default=0)
+    return height
+
+
+def _width(m: OwmMap, root: int) -> int:
+    """Widest breadth-first level below a node."""
+    seen = {root}
+    level = [root]
+    widest = 0
+    while level:
+        nxt: list[int] = []
+        for node in level:
+            for child in m.depends_on[node]:
+                if child not in seen:
+                    seen.add(child)
+                    nxt.append(child)
+        widest = max(widest, len(nxt))
+        level = nxt
+    return widest
+
+
+def _layer(visibility: float | None) -> str:
+    if visibility is None:
+        return LAYERS[-1][0]
+    for name, lower in LAYERS:
+        if visibility >= lower:
+            return name
+    return LAYERS[-1][0]
+
+
+def analyse_map(m: OwmMap, source_hash: str = "") -> MapAnalytics:
+    """Compute all atlas analytics for a parsed map."""
+    n = len(m)
+    names = m.names
+    down = transitive_closure(m.depends_on)
+    up = transitive_closure(m.dependents)
+    heights = _heights(m.depends_on)
+
+    components = sorted(
+        (
+            ComponentMetrics(
+                name=names[i],
+                kind=m.kinds[i],
+                visibility=m.visibility[i],
+                maturity=m.maturity[i],
+                fan_in=len(m.dependents[i]),
+                fan_out=len(m.depends_on[i]),
+                transitive_fan_in=up[i].bit_count(),
+                transitive_fan_out=down[i].bit_count(),
+                depth=heights[i],
+            )
+            for i in range(n)
+        ),
+        key=lambda c: (-c.transitive_fan_in, c.name),
+    )
+
+    anchors = m.anchors
+    anchor_mask = sum(1 << a for a in anchors)
+    anchor_reach = {names[a]: [names[j] for j in _bits(down[a])] for a in anchors}
+
+    # Needs: non-anchor nodes an anchor depends on directly
+    needs: list[int] = []
+    for a in anchors:
+        for node in m.depends_on[a]:
+            if m.kinds[node] != "anchor" and node not in needs:
+                needs.append(node)
+    need_masks = {need: down[need] | (1 << need) for need in needs}
+
+    shared: list[SharedComponent] = []
+    shared_by: dict[int, list[int]] = {}
+    for node in range(n):
+        if m.kinds[node] == "anchor":
+            continue
+        serving = [need for need in needs if need_masks[need] >> node & 1]
+        if len(serving) > 1:
+            shared_by[node] = serving
+            shared.append(
+                SharedComponent(
+                    name=names[node],
+                    needs=[names[s] for s in serving],
+                    anchors=[names[a] for a in _bits(up[node] & anchor_mask)],
+                )
+            )
+
+    need_traces = []
+    for need in needs:
+        others = {
+            other
+            for node in _bits(need_masks[need])
+            for other in shared_by.get(node, ())
+            if other != need
+        }
+        need_traces.append(
+            NeedTrace(
+                need=names[need],
+                anchors=[names[a] for a in _bits(up[need] & anchor_mask)],
+                components=[names[j] for j in _bits(down[need])],
+                depth=heights[need],
+                width=_width(m, need),
+                shared_with=[names[o] for o in needs if o in others],
+            )
+        )
+
+    members: dict[str, list[int]] = {name: [] for name, _ in LAYERS}
+    for node in range(n):
+        members[_layer(m.visibility[node])].append(node)
+    thresholds = [lower for _, lower in LAYERS if lower > 0]
+    layers = []
+    for name, _ in LAYERS:
+        nodes = members[name]
+        mats = [m.maturity[i] for i in nodes if m.maturity[i] is not None]
+        layers.append(
+            VisibilityLayer(
+                name=name,
+                components=[names[i] for i in nodes],
+                maturity_min=min(mats) if mats else None,
+                maturity_max=max(mats) if mats else None,
+                maturity_mean=round(sum(mats) / len(mats), 4) if mats else None,
+                near_boundary=[
+                    names[i]
+                    for i in nodes
+                    if m.visibility[i] is not None
+                    and any(
+                        abs(m.visibility[i] - t) <= BOUNDARY_MARGIN for t in thresholds
+                    )
+                ],
+            )
+        )
+
+    cross: dict[str, int] = {}
+    for source, target in m.edges():
+        a, b = _layer(m.visibility[source]), _layer(m.visibility[target])
+        if a != b:
+            key = f"{a}->{b}"
+            cross[key] = cross.get(key, 0) + 1
+
+    return MapAnalytics(
+        title=m.title,
+        source_hash=source_hash,
+        components=components,
+        anchor_reach=anchor_reach,
+        need_traces=need_traces,
+        shared_components=shared,
+        layers=layers,
+        cross_layer_edges=cross,
+        warnings=[*m.warnings, *(f"unresolved {u}" for u in m.unresolved)],
+    )
@@ -0,0 +1,45 @@
+"""Content-addressed SVG assets.
+
+A rendered map is typically shown several times in one project: as
+the hero figure, on its analysis page, and again at every tour stop
+that visits it. ``SvgAssetStore`` reads each SVG file at most once and
+keeps one string per distinct content hash, so every figure showing
+the same map shares a single string instead of carrying its own copy.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+
+class SvgAssetStore:
+    """SVG contents keyed by file and deduplicated by SHA-256."""
+
+    def __init__(self) -> None:
+        self._digests: dict[Path, str] = {}
+        self._contents: dict[str, str] = {}
+        self.reads = 0
+
+    def digest(self, path: Path) -> str:
+        """Content hash of an SVG, loading it on first use."""
+        digest = self._digests.get(path)
+        if digest is None:
+            raw = path.read_bytes()
+            self.reads += 1
+            digest = hashlib.sha256(raw).hexdigest()
+            self._contents.setdefault(digest, raw.decode("utf-8"))
+            self._digests[path] = digest
+        return digest
+
+    def load(self, path: Path) -> str:
+        """SVG text for *path*; equal contents return the same object."""
+        return self._contents[self.digest(path)]
+
+    def __len__(self) -> int:
+        return len(self._contents)
+
+    @property
+    def size(self) -> int:
+        """Total characters held across distinct assets."""
+        return sum(len(svg) for svg in self._contents.values())
@@ -0,0 +1,325 @@
+"""Atlas build index.
+
+Every atlas view is derived from a handful of agreed project files.
+This module declares those source -> view edges once, and keeps a
+per-project index (``atlas/.index.json``) of the content hashes each
+view was last built from. One status query then answers which of the
+atlas views are stale and why, instead of each skill comparing
+modification times on its own.
+
+Most sources live in the project directory. Primary research is shared
+by every project of a client, so a source written ``client:{path}``
+is resolved against the client directory instead, as
+``clients/{org}/resources/index.md`` is.
+
+Source hashes are cached in the index against file size and mtime, so
+a status query only re-reads files that were touched since the last
+query. Views that were built before the index existed fall back to
+the mtime comparison the skills used to perform by hand.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from pathlib import Path
+
+from bin.cli.infrastructure.json_store import read_json_object, write_json_object
+from wardley_mapping.owm import OwmMap, load_owm
+from wardley_mapping.types import AtlasView, AtlasViewStatus
+
+INDEX_VERSION = 2
+INDEX_PATH = "atlas/.index.json"
+STRATEGY_MAP = "strategy/map.agreed.owm"
+
+_MAP = STRATEGY_MAP
+_CHAIN = "chain/supply-chain.agreed.md"
+_ASSESSMENTS = "evolve/assessments/*.md"
+_PLAYS = "strategy/plays/*.md"
+CLIENT_PREFIX = "client:"
+_RESOURCES = f"{CLIENT_PREFIX}resources/index.md"
+
+# (strategy map digest, play slugs) that a view expansion depends on
+_ExpansionKey = tuple[str, tuple[str, ...]]
+
+
+def _view(
+    name: str,
+    sources: list[str],
+    outputs: list[str],
+    skill: str = "",
+    per: str = "",
+) -> AtlasView:
+    return AtlasView(
+        name=name,
+        skill=f"wm-atlas-{skill or name}",
+        sources=sources,
+        outputs=[f"atlas/{name}/{o}" for o in outputs],
+        per=per,
+    )
+
+
+_STANDARD = ["map.owm", "analysis.md"]
+
+# Mirrors the staleness sections of the wm-atlas-* skills. ``{slug}``
+# in a name or path is expanded once per anchor, need or play.
+ATLAS_VIEWS: tuple[AtlasView, ...] = (
+    _view("overview", [_MAP, "brief.agreed.md"], _STANDARD),
+    _view(
+        "anchor-{slug}",
+        [_MAP, "needs/needs.agreed.md", _CHAIN],
+        _STANDARD,
+        skill="anchor-chains",
+        per="anchor",
+    ),
+    _view(
+        "need-{slug}",
+        [_MAP, _CHAIN],
+        _STANDARD,
+        skill="need-traces",
+        per="need",
+    ),
+    _view("shared-components", [_MAP, _CHAIN], _STANDARD),
+    _view("bottlenecks", [_MAP, _CHAIN, _ASSESSMENTS], _STANDARD),
+    _view(
+        "layers",
+        [_MAP],
+        [
+            "user-visible.owm",
+            "capabilities.owm",
+            "infrastructure.owm",
+            "analysis.md",
+        ],
+    ),
+    _view("flows", [_MAP, _CHAIN], _STANDARD),
+    _view("movement", [_MAP, "evolve/map.agreed.owm", _ASSESSMENTS], ["map.owm"]),
+    _view("inertia", [_MAP, _ASSESSMENTS, _PLAYS], ["map.owm"]),
+    _view("evolution-mismatch", [_MAP, _PLAYS], _STANDARD),
+    _view("sourcing", [_MAP, _ASSESSMENTS, _CHAIN], ["map.owm"]),
+    _view("pipelines", [_MAP, _ASSESSMENTS, _RESOURCES], _STANDARD),
+    _view("forces", [_MAP, _ASSESSMENTS, _RESOURCES], _STANDARD),
+    _view("risk", [_MAP, _CHAIN, _ASSESSMENTS, _RESOURCES], _STANDARD),
+    _view("teams", [_MAP], _STANDARD),
+    _view(
+        "play-{slug}",
+        [_MAP, "strategy/plays/{slug}.md", _ASSESSMENTS],
+        ["map.owm"],
+        skill="plays",
+        per="play",
+    ),
+    _view("doctrine", [_MAP, _PLAYS, "decisions.md"], ["analysis.md"]),
+)
+
+
+def slugify(name: str) -> str:
+    """Lowercase, hyphen-separated slug used for per-instance views."""
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+def _is_glob(pattern: str) -> bool:
+    return any(c in pattern for c in "*?[")
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+
+class AtlasBuildIndex:
+    """Staleness index for the atlas of one project directory.
+
+    ``client_dir`` is the directory ``client:`` sources are read from.
+    """
+
+    def __init__(self, project_dir: Path, client_dir: Path) -> None:
+        self._dir = project_dir
+        self._client_dir = client_dir
+        self._path = project_dir / INDEX_PATH
+        data = read_json_object(self._path)
+        if data is None or data.get("version") != INDEX_VERSION:
+            data = {}
+        self._files: dict[str, dict] = data.get("files", {})
+        self._views: dict[str, dict[str, str]] = data.get("views", {})
+        self._dirty = False
+        # Expanded views, and the map they were expanded from, keyed on
+        # the strategy map's content hash and the play files present
+        self._expanded: tuple[_ExpansionKey, list[AtlasView]] | None = None
+        self._map: tuple[str, OwmMap] | None = None
+
+    # -- view expansion ----------------------------------------------------
+
+    def _strategy_map(self, digest: str) -> OwmMap | None:
+        """The parsed strategy map, parsed again only when *digest* changes."""
+        if not digest:
+            return None
+        if self._map is None or self._map[0] != digest:
+            self._map = (digest, load_owm(self._dir / STRATEGY_MAP))
+        return self._map[1]
+
+    def _instances(
+        self, per: str, plays: tuple[str, ...], m: OwmMap | None
+    ) -> list[str]:
+        if per == "play":
+            return list(plays)
+        if m is None:
+            return []
+        if per == "anchor":
+            nodes = m.anchors
+        else:
+            nodes = []
+            for a in m.anchors:
+                for node in m.depends_on[a]:
+                    if m.kinds[node] != "anchor" and node not in nodes:
+                        nodes.append(node)
+        return [slugify(m.names[i]) for i in nodes]
+
+    def views(self) -> list[AtlasView]:
+        """All concrete views for the project, per-instance views expanded.
+
+        The expansion is memoised until the strategy map's content or
+        the set of plays changes.
+        """
+        digest = (
+            self._hash(STRATEGY_MAP) if (self._dir / STRATEGY_MAP).is_file() else ""
+        )
+        plays = tuple(sorted(p.stem for p in self._dir.glob(_PLAYS)))
+        key = (digest, plays)
+        if self._expanded is not None and self._expanded[0] == key:
+            return list(self._expanded[1])
+
+        m = self._strategy_map(digest)
+        views: list[AtlasView] = []
+        for view in ATLAS_VIEWS:
+            if not view.per:
+                views.append(view)
+                continue
+            for slug in self._instances(view.per, plays, m):
+                views.append(
+                    view.model_copy(
+                        update={
+                            "name": view.name.format(slug=slug),
+                            "sources": [s.format(slug=slug) for s in view.sources],
+                            "outputs": [o.format(slug=slug) for o in view.outputs],
+                            "per": "",
+                        }
+                    )
+                )
+        self._expanded = (key, views)
+        return list(views)
+
+    def view(self, name: str) -> AtlasView | None:
+        return next((v for v in self.views() if v.name == name), None)
+
+    # -- hashing -----------------------------------------------------------
+
+    def _base(self, pattern: str) -> tuple[Path, str, str]:
+        """(directory, relative pattern, index prefix) of a source pattern."""
+        if pattern.startswith(CLIENT_PREFIX):
+            return self._client_dir, pattern.removeprefix(CLIENT_PREFIX), CLIENT_PREFIX
+        return self._dir, pattern, ""
+
+    def _resolve(self, rel: str) -> Path:
+        base, path, _ = self._base(rel)
+        return base / path
+
+    def _sources(self, view: AtlasView) -> tuple[list[str], list[str]]:
+        """Resolve a view's sources to (present paths, missing paths)."""
+        present: list[str] = []
+        missing: list[str] = []
+        for pattern in view.sources:
+            base, rel, prefix = self._base(pattern)
+            if _is_glob(rel):
+                present.extend(
+                    prefix + str(p.relative_to(base))
+                    for p in sorted(base.glob(rel))
+                    if p.is_file()
+                )
+            elif (base / rel).is_file():
+                present.append(pattern)
+            else:
+                missing.append(pattern)
+        return present, missing
+
+    def _hash(self, rel: str) -> str:
+        path = self._resolve(rel)
+        st = path.stat()
+        cached = self._files.get(rel)
+        if (
+            cached is not None
+            and cached["mtime_ns"] == st.st_mtime_ns
+            and cached["size"] == st.st_size
+        ):
+            return cached["sha256"]
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        self._files[rel] = {
+            "sha256": digest,
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+        }
+        self._dirty = True
+        return digest
+
+    # -- queries -----------------------------------------------------------
+
+    def status(self, view: AtlasView) -> AtlasViewStatus:
+        """Decide whether a view needs regenerating, with reasons."""
+        present, missing = self._sources(view)
+        if missing:
+            return AtlasViewStatus(
+                view=view.name,
+                skill=view.skill,
+                state="blocked",
+                reasons=[f"missing source {m}" for m in missing],
+            )
+
+        reasons = [
+            f"missing output {o}" for o in view.outputs if not (self._dir / o).is_file()
+        ]
+        recorded = self._views.get(view.name)
+        if recorded is not None:
+            for rel in present:
+                if rel not in recorded:
+                    reasons.append(f"new source {rel}")
+                elif recorded[rel] != self._hash(rel):
+                    reasons.append(f"changed source {rel}")
+            reasons.extend(
+                f"removed source {rel}" for rel in recorded if rel not in present
+            )
+        elif not reasons and view.outputs:
+            oldest = min((self._dir / o).stat().st_mtime_ns for o in view.outputs)
+            reasons.extend(
+                f"source newer than outputs {rel}"
+                for rel in present
+                if self._resolve(rel).stat().st_mtime_ns > oldest
+            )
+
+        return AtlasViewStatus(
+            view=view.name,
+            skill=view.skill,
+            state="stale" if reasons else "fresh",
+            reasons=reasons,
+            indexed=recorded is not None,
+        )
+
+    def status_all(self) -> list[AtlasViewStatus]:
+        """Status of every view, saving any newly computed source hashes."""
+        result = [self.status(v) for v in self.views()]
+        self.save()
+        return result
+
+    def record(self, view: AtlasView) -> AtlasViewStatus:
+        """Mark a view as freshly built from its current sources."""
+        present, _ = self._sources(view)
+        self._views[view.name] = {rel: self._hash(rel) for rel in present}
+        self._dirty = True
+        self.save()
+        return self.status(view)
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        write_json_object(
+            self._path,
+            {"version": INDEX_VERSION, "files": self._files, "views": self._views},
+        )
+        self._dirty = False
@@ -1,6 +1,8 @@
 """CLI command registration for the Wardley Mapping bounded context.
 
-Registers the tour command group.
+Registers the tour, map and atlas command groups. Their subcommands are
+generated from the request DTOs only when a group is used, so listing
+the practice commands does not import this context's models.
 """
 
 from __future__ import annotations
@@ -10,7 +12,7 @@ from typing import Any
 import click
 
 from bin.cli.introspect import generate_command
-from wardley_mapping.dtos import RegisterTourRequest
+from shared.cli import LazyGroup
 
 
 # ---------------------------------------------------------------------------
@@ -18,11 +20,58 @@ from wardley_mapping.dtos import RegisterTourRequest
 # ---------------------------------------------------------------------------
 
 
+def _echo_stop_errors(errors: list, indent: str = "  ") -> None:
+    for error in errors:
+        click.echo(f"{indent}stop {error.order}: {error.field}: {error.message}")
+
+
 def _format_tour_register(resp: Any) -> None:
     click.echo(
         f"Registered tour '{resp.name}' with {resp.stop_count} stops "
         f"for '{resp.client}/{resp.project_slug}'"
     )
+    if resp.errors:
+        click.echo(f"{len(resp.errors)} stop reference(s) do not resolve:")
+        _echo_stop_errors(resp.errors)
+
+
+def _format_tour_register_batch(resp: Any) -> None:
+    click.echo(
+        f"Registered {len(resp.tours)} tours for '{resp.client}/{resp.project_slug}'"
+    )
+    for tour in resp.tours:
+        click.echo(f"  {tour.name}: {tour.stop_count} stops")
+        _echo_stop_errors(tour.errors, indent="    ")
+
+
+def _format_tour_list(resp: Any) -> None:
+    if not resp.tours:
+        click.echo(f"No tours for '{resp.client}/{resp.project_slug}'")
+        return
+    for tour in resp.tours:
+        click.echo(f"{tour.name}: {tour.title} ({tour.stop_count} stops)")
+
+
+def _format_map_analyse(resp: Any) -> None:
+    click.echo(resp.analytics.model_dump_json(indent=2))
+
+
+def _format_atlas_status(resp: Any) -> None:
+    stale = [v for v in resp.views if v.state != "fresh"]
+    click.echo(
+        f"{len(resp.views) - len(stale)} of {len(resp.views)} atlas views fresh "
+        f"for '{resp.client}/{resp.project_slug}'"
+    )
+    for v in stale:
+        click.echo(f"  {v.state:8} {v.view} ({v.skill})")
+        for reason in v.reasons:
+            click.echo(f"           {reason}")
+
+
+def _format_atlas_record(resp: Any) -> None:
+    click.echo(f"Recorded atlas view '{resp.status.view}': {resp.status.state}")
+    for reason in resp.status.reasons:
+        click.echo(f"  {reason}")
 
 
 # ---------------------------------------------------------------------------
@@ -30,18 +79,77 @@ def _format_tour_register(resp: Any) -> None:
 # ---------------------------------------------------------------------------
 
 
-def register_commands(cli: click.Group) -> None:
-    """Register Wardley Mapping commands on the given CLI group."""
-
-    @cli.group()
-    def tour() -> None:
-        """Manage presentation tours."""
+def _tour_commands() -> list[click.Command]:
+    from wardley_mapping.dtos import (
+        ListToursRequest,
+        RegisterToursBatchRequest,
+        RegisterTourRequest,
+    )
 
-    tour.add_command(
+    return [
+        generate_command(
+            name="list",
+            request_model=ListToursRequest,
+            usecase_attr="list_tours_usecase",
+            format_output=_format_tour_list,
+        ),
         generate_command(
             name="register",
             request_model=RegisterTourRequest,
             usecase_attr="register_tour_usecase",
             format_output=_format_tour_register,
+        ),
+        generate_command(
+            name="register-batch",
+            request_model=RegisterToursBatchRequest,
+            usecase_attr="register_tours_batch_usecase",
+            format_output=_format_tour_register_batch,
+        ),
+    ]
+
+
+def _map_commands() -> list[click.Command]:
+    from wardley_mapping.dtos import AnalyseMapRequest
+
+    return [
+        generate_command(
+            name="analyse",
+            request_model=AnalyseMapRequest,
+            usecase_attr="analyse_map_usecase",
+            format_output=_format_map_analyse,
+        ),
+    ]
+
+
+def _atlas_commands() -> list[click.Command]:
+    from wardley_mapping.dtos import GetAtlasStatusRequest, RecordAtlasViewRequest
+
+    return [
+        generate_command(
+            name="status",
+            request_model=GetAtlasStatusRequest,
+            usecase_attr="get_atlas_status_usecase",
+            format_output=_format_atlas_status,
+        ),
+        generate_command(
+            name="record",
+            request_model=RecordAtlasViewRequest,
+            usecase_attr="record_atlas_view_usecase",
+            format_output=_format_atlas_record,
+        ),
+    ]
+
+
+def register_commands(cli: click.Group) -> None:
+    """Register Wardley Mapping commands on the given CLI group."""
+    cli.add_command(
+        LazyGroup("tour", _tour_commands, help="Manage presentation tours.")
+    )
+    cli.add_command(LazyGroup("map", _map_commands, help="Query Wardley maps."))
+    cli.add_command(
+        LazyGroup(
+            "atlas",
+            _atlas_commands,
+            help="Track which atlas views need regenerating.",
         )
     )
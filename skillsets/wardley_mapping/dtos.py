@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from pydantic import BaseModel, Field
 
-from wardley_mapping.types import TourStop
+from wardley_mapping.types import AtlasViewStatus, MapAnalytics, StopError, TourStop
 
 
 class RegisterTourRequest(BaseModel):
@@ -26,3 +26,119 @@ class RegisterTourResponse(BaseModel):
     project_slug: str
     name: str
     stop_count: int
+    errors: list[StopError] = []
+
+
+class TourSpec(BaseModel):
+    """One tour in a batch registration."""
+
+    name: str
+    title: str
+    stops: list[TourStop]
+
+
+class RegisterToursBatchRequest(BaseModel):
+    """Register or replace several presentation tours for a project at once."""
+
+    client: str = Field(description="Client slug.")
+    engagement: str = Field(description="Engagement slug.")
+    project_slug: str = Field(
+        description="Project slug.",
+        json_schema_extra={"cli_name": "project"},
+    )
+    tours: list[TourSpec] = Field(
+        description="JSON array of tours, each with name, title and stops."
+    )
+
+
+class RegisteredTour(BaseModel):
+    name: str
+    stop_count: int
+    errors: list[StopError] = []
+
+
+class RegisterToursBatchResponse(BaseModel):
+    client: str
+    project_slug: str
+    tours: list[RegisteredTour]
+
+
+class ListToursRequest(BaseModel):
+    """List a project's presentation tours."""
+
+    client: str = Field(description="Client slug.")
+    engagement: str = Field(description="Engagement slug.")
+    project_slug: str = Field(
+        description="Project slug.",
+        json_schema_extra={"cli_name": "project"},
+    )
+
+
+class ListedTour(BaseModel):
+    name: str
+    title: str
+    stop_count: int
+
+
+class ListToursResponse(BaseModel):
+    client: str
+    project_slug: str
+    tours: list[ListedTour]
+
+
+class AnalyseMapRequest(BaseModel):
+    """Compute graph analytics (fan-in, need traces, layers) for an OWM map."""
+
+    client: str = Field(description="Client slug.")
+    engagement: str = Field(description="Engagement slug.")
+    project_slug: str = Field(
+        description="Project slug.",
+        json_schema_extra={"cli_name": "project"},
+    )
+    map_path: str = Field(
+        default="strategy/map.agreed.owm",
+        description="OWM file relative to the project directory.",
+        json_schema_extra={"cli_name": "map"},
+    )
+
+
+class AnalyseMapResponse(BaseModel):
+    client: str
+    project_slug: str
+    map_path: str
+    analytics: MapAnalytics
+
+
+class GetAtlasStatusRequest(BaseModel):
+    """Report which atlas views are stale and why."""
+
+    client: str = Field(description="Client slug.")
+    engagement: str = Field(description="Engagement slug.")
+    project_slug: str = Field(
+        description="Project slug.",
+        json_schema_extra={"cli_name": "project"},
+    )
+
+
+class GetAtlasStatusResponse(BaseModel):
+    client: str
+    project_slug: str
+    views: list[AtlasViewStatus]
+
+
+class RecordAtlasViewRequest(BaseModel):
+    """Record an atlas view as regenerated from its current sources."""
+
+    client: str = Field(description="Client slug.")
+    engagement: str = Field(description="Engagement slug.")
+    project_slug: str = Field(
+        description="Project slug.",
+        json_schema_extra={"cli_name": "project"},
+    )
+    view: str = Field(description="Atlas view name (e.g. bottlenecks, need-{slug}).")
+
+
+class RecordAtlasViewResponse(BaseModel):
+    client: str
+    project_slug: str
+    status: AtlasViewStatus
@@ -2,17 +2,132 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
 from pathlib import Path
 
-from wardley_mapping.types import TourManifest
+from wardley_mapping.analytics import ANALYTICS_VERSION, analyse_map
+from wardley_mapping.atlas import AtlasBuildIndex
+from wardley_mapping.inventory import AtlasInventory
+from wardley_mapping.owm import parse_owm
+from wardley_mapping.types import (
+    AtlasViewStatus,
+    MapAnalytics,
+    StopError,
+    TourManifest,
+    TourStop,
+    TourSummary,
+)
 from bin.cli.infrastructure.json_store import read_json_object, write_json_object
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+# ---------------------------------------------------------------------------
+# Safe JSON writes
+# ---------------------------------------------------------------------------
+
+_held_locks = threading.local()
+
+
+@contextmanager
+def _directory_lock(directory: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on *directory* across processes.
+
+    The lock is taken on the directory itself, since the files in it
+    are replaced on every write, so no lock files are left behind.
+    Re-entrant within a thread. Without ``fcntl`` (Windows) this is a
+    no-op.
+    """
+    held: set[Path] = _held_locks.__dict__.setdefault("paths", set())
+    if fcntl is None or directory in held:
+        yield
+        return
+    directory.mkdir(parents=True, exist_ok=True)
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        held.add(directory)
+        try:
+            yield
+        finally:
+            held.discard(directory)
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def _fsync(path: Path) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _write_atomic(
+    path: Path, data: dict, *, fsync: bool = False, skip_unchanged: bool = False
+) -> bool:
+    """Write JSON through a temp file and rename, so readers never see half.
+
+    The temp file is written by ``write_json_object``, so the bytes are
+    those of every other JSON store in the workspace. With *fsync*, the
+    file and its directory entry are flushed to disk before returning.
+    With *skip_unchanged*, nothing is written when the file already
+    holds exactly these bytes, leaving its mtime alone. Returns whether
+    the file was written.
+    """
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        write_json_object(tmp, data)
+        if skip_unchanged:
+            try:
+                if path.read_bytes() == tmp.read_bytes():
+                    return False
+            except OSError:
+                pass
+        if fsync:
+            _fsync(tmp)
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    if fsync:
+        _fsync(path.parent)
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Tour manifests
+# ---------------------------------------------------------------------------
+
 
 class JsonTourManifestRepository:
-    """Tour manifest repository. One manifest.json per tour directory."""
+    """Tour manifest repository. One manifest.json per tour directory.
 
-    def __init__(self, workspace_root: Path) -> None:
+    Saves are atomic (temp file and rename) under an advisory lock on the
+    tour directory, so a crash or a concurrent agent never leaves a torn
+    file. ``fsync`` makes each save durable before it returns. With
+    ``skip_unchanged`` (the default), re-registering an identical tour
+    does not touch the file, so its mtime does not trigger re-renders.
+    """
+
+    def __init__(
+        self,
+        workspace_root: Path,
+        *,
+        fsync: bool = False,
+        skip_unchanged: bool = True,
+    ) -> None:
         self._root = workspace_root
+        self._fsync = fsync
+        self._skip_unchanged = skip_unchanged
 
     def _file(
         self, client: str, engagement: str, project_slug: str, tour_name: str
@@ -64,12 +179,522 @@ class JsonTourManifestRepository:
         return manifests
 
     def save(self, manifest: TourManifest) -> None:
-        write_json_object(
-            self._file(
-                manifest.client,
-                manifest.engagement,
-                manifest.project_slug,
-                manifest.name,
+        path = self._file(
+            manifest.client,
+            manifest.engagement,
+            manifest.project_slug,
+            manifest.name,
+        )
+        with _directory_lock(path.parent):
+            _write_atomic(
+                path,
+                manifest.model_dump(mode="json"),
+                fsync=self._fsync,
+                skip_unchanged=self._skip_unchanged,
+            )
+
+
+# (presentations dir mtime, catalog mtime, manifest (mtime, size) per tour)
+_CatalogStamp = tuple[int, int, dict[str, tuple[int, int]]]
+
+
+class CatalogTourManifestRepository(JsonTourManifestRepository):
+    """Tour manifests with a per-project catalog for cheap listing.
+
+    Manifests keep the JSON layout; alongside them,
+    ``presentations/catalog.json`` records each tour's name, title,
+    stop count and the hash, mtime and size of its manifest.
+    ``summaries`` reads the catalog and stats the manifests.
+    ``list_all`` loads a manifest only when its file no longer matches
+    the catalog entry, and otherwise serves the manifest it validated
+    last time.
+
+    The catalog is rebuilt from the manifests whenever it is missing
+    or the set of tour directories no longer matches it, so tours
+    added or removed behind its back are picked up; an entry whose
+    manifest was rewritten behind its back is refreshed from that
+    manifest. Within a process, a catalog is re-read and the directory
+    re-scanned only when the modification time of the presentations
+    directory, of the catalog or of one of its manifests has changed.
+    """
+
+    CATALOG_VERSION = 1
+
+    def __init__(
+        self,
+        workspace_root: Path,
+        *,
+        fsync: bool = False,
+        skip_unchanged: bool = True,
+    ) -> None:
+        super().__init__(workspace_root, fsync=fsync, skip_unchanged=skip_unchanged)
+        self._loaded: dict[Path, tuple[str, TourManifest]] = {}
+        # pres_dir -> (stamp, tour dirs, catalog) as last validated
+        self._catalogs: dict[
+            Path, tuple[_CatalogStamp, set[str], dict[str, TourSummary]]
+        ] = {}
+        self._lock = threading.Lock()
+
+    def _pres_dir(self, client: str, engagement: str, project_slug: str) -> Path:
+        return (
+            self._root
+            / client
+            / "engagements"
+            / engagement
+            / project_slug
+            / "presentations"
+        )
+
+    # -- catalog -----------------------------------------------------------
+
+    def _entry(self, manifest_path: Path) -> tuple[TourSummary, TourManifest] | None:
+        try:
+            raw = manifest_path.read_bytes()
+            st = manifest_path.stat()
+        except OSError:
+            return None
+        manifest = TourManifest.model_validate_json(raw)
+        digest = hashlib.sha256(raw).hexdigest()
+        with self._lock:
+            self._loaded[manifest_path] = (digest, manifest)
+        return (
+            TourSummary(
+                name=manifest.name,
+                title=manifest.title,
+                stop_count=len(manifest.stops),
+                sha256=digest,
+                mtime_ns=st.st_mtime_ns,
+                size=st.st_size,
             ),
-            manifest.model_dump(mode="json"),
+            manifest,
+        )
+
+    def _rebuild(self, pres_dir: Path, names: set[str]) -> dict[str, TourSummary]:
+        tours: dict[str, TourSummary] = {}
+        for name in sorted(names):
+            entry = self._entry(pres_dir / name / "manifest.json")
+            if entry is not None:
+                tours[name] = entry[0]
+        self._write_catalog(pres_dir, tours, names)
+        return tours
+
+    def _write_catalog(
+        self, pres_dir: Path, tours: dict[str, TourSummary], dirs: set[str]
+    ) -> None:
+        path = pres_dir / "catalog.json"
+        with _directory_lock(pres_dir):
+            _write_atomic(
+                path,
+                {
+                    "version": self.CATALOG_VERSION,
+                    "dirs": sorted(dirs),
+                    "tours": {n: s.model_dump(mode="json") for n, s in tours.items()},
+                },
+                fsync=self._fsync,
+                skip_unchanged=True,
+            )
+        self._remember(pres_dir, tours, dirs)
+
+    @staticmethod
+    def _manifests(pres_dir: Path, dirs: set[str]) -> dict[str, tuple[int, int]]:
+        """``(mtime_ns, size)`` of the manifest in each tour directory that has one."""
+        stats = {}
+        for name in dirs:
+            try:
+                st = (pres_dir / name / "manifest.json").stat()
+            except OSError:
+                continue
+            stats[name] = (st.st_mtime_ns, st.st_size)
+        return stats
+
+    def _stamp(self, pres_dir: Path, dirs: set[str]) -> _CatalogStamp | None:
+        try:
+            return (
+                pres_dir.stat().st_mtime_ns,
+                (pres_dir / "catalog.json").stat().st_mtime_ns,
+                self._manifests(pres_dir, dirs),
+            )
+        except OSError:
+            return None
+
+    def _remember(
+        self, pres_dir: Path, tours: dict[str, TourSummary], dirs: set[str]
+    ) -> None:
+        stamp = self._stamp(pres_dir, dirs)
+        with self._lock:
+            if stamp is None:
+                self._catalogs.pop(pres_dir, None)
+            else:
+                self._catalogs[pres_dir] = (stamp, set(dirs), dict(tours))
+
+    def _dirs(self, pres_dir: Path) -> set[str]:
+        with os.scandir(pres_dir) as it:
+            return {e.name for e in it if e.is_dir()}
+
+    def _catalog(self, pres_dir: Path) -> dict[str, TourSummary]:
+        with self._lock:
+            memo = self._catalogs.get(pres_dir)
+        # An unchanged directory mtime means the same tour dirs, so they
+        # need not be re-scanned to check their manifests.
+        if memo is not None and self._stamp(pres_dir, memo[1]) == memo[0]:
+            return dict(memo[2])
+        try:
+            names = self._dirs(pres_dir)
+        except OSError:
+            return {}
+        data = read_json_object(pres_dir / "catalog.json")
+        if (
+            data is None
+            or data.get("version") != self.CATALOG_VERSION
+            or set(data.get("dirs", ())) != names
+        ):
+            return self._rebuild(pres_dir, names)
+        tours = {
+            name: TourSummary.model_validate(entry)
+            for name, entry in data["tours"].items()
+        }
+        manifests = self._manifests(pres_dir, names)
+        stale = [
+            name
+            for name in sorted(names)
+            if manifests.get(name)
+            != ((tours[name].mtime_ns, tours[name].size) if name in tours else None)
+        ]
+        if not stale:
+            self._remember(pres_dir, tours, names)
+            return tours
+        for name in stale:
+            entry = self._entry(pres_dir / name / "manifest.json")
+            if entry is None:
+                tours.pop(name, None)
+            else:
+                tours[name] = entry[0]
+        self._write_catalog(pres_dir, tours, names)
+        return tours
+
+    # -- repository --------------------------------------------------------
+
+    def summaries(
+        self, client: str, engagement: str, project_slug: str
+    ) -> list[TourSummary]:
+        """List a project's tours from its catalog alone."""
+        catalog = self._catalog(self._pres_dir(client, engagement, project_slug))
+        return [catalog[name] for name in sorted(catalog)]
+
+    def list_all(
+        self, client: str, engagement: str, project_slug: str
+    ) -> list[TourManifest]:
+        """List all tour manifests, loading only those that changed."""
+        pres_dir = self._pres_dir(client, engagement, project_slug)
+        catalog = self._catalog(pres_dir)
+        manifests: list[TourManifest] = []
+        changed = False
+        for name in sorted(catalog):
+            summary = catalog[name]
+            path = pres_dir / name / "manifest.json"
+            try:
+                st = path.stat()
+            except OSError:
+                del catalog[name]
+                changed = True
+                continue
+            loaded = self._loaded.get(path)
+            if (
+                loaded is not None
+                and loaded[0] == summary.sha256
+                and (st.st_mtime_ns, st.st_size) == (summary.mtime_ns, summary.size)
+            ):
+                manifests.append(loaded[1])
+                continue
+            entry = self._entry(path)
+            if entry is None:
+                continue
+            if entry[0] != summary:
+                catalog[name] = entry[0]
+                changed = True
+            manifests.append(entry[1])
+        if changed:
+            self._write_catalog(pres_dir, catalog, self._dirs(pres_dir))
+        return manifests
+
+    def save(self, manifest: TourManifest) -> None:
+        pres_dir = self._pres_dir(
+            manifest.client, manifest.engagement, manifest.project_slug
+        )
+        # Hold the catalog lock so concurrent saves do not drop each other's entries
+        with _directory_lock(pres_dir):
+            catalog = self._catalog(pres_dir)
+            super().save(manifest)
+            entry = self._entry(pres_dir / manifest.name / "manifest.json")
+            if entry is not None:
+                catalog[manifest.name] = entry[0]
+            self._write_catalog(pres_dir, catalog, self._dirs(pres_dir))
+
+
+_STOP_FIELDS = ("order", "title", "atlas_source", "map_file", "analysis_file")
+
+
+class SqliteTourManifestRepository:
+    """Tour manifests for a whole workspace in one SQLite database.
+
+    Tours and their stops are rows indexed by client, engagement,
+    project and atlas source, so cross-project questions ("every tour
+    that visits atlas/risk/") are a single indexed query rather than
+    a walk over every ``manifest.json``. Each operation opens its own
+    connection, so one repository can be shared between threads.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tours (
+            client TEXT NOT NULL,
+            engagement TEXT NOT NULL,
+            project_slug TEXT NOT NULL,
+            name TEXT NOT NULL,
+            title TEXT NOT NULL,
+            PRIMARY KEY (client, engagement, project_slug, name)
+        );
+        CREATE TABLE IF NOT EXISTS stops (
+            client TEXT NOT NULL,
+            engagement TEXT NOT NULL,
+            project_slug TEXT NOT NULL,
+            tour_name TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            stop_order TEXT NOT NULL,
+            title TEXT NOT NULL,
+            atlas_source TEXT NOT NULL,
+            map_file TEXT NOT NULL,
+            analysis_file TEXT NOT NULL,
+            PRIMARY KEY (client, engagement, project_slug, tour_name, position),
+            FOREIGN KEY (client, engagement, project_slug, tour_name)
+                REFERENCES tours (client, engagement, project_slug, name)
+                ON DELETE CASCADE
+        );
+        CREATE INDEX IF NOT EXISTS stops_atlas_source ON stops (atlas_source);
+        CREATE INDEX IF NOT EXISTS tours_project
+            ON tours (client, engagement, project_slug);
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self._path = db_path
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.executescript(self.SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._path)
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+    def _load(self, conn: sqlite3.Connection, rows: list[tuple]) -> list[TourManifest]:
+        manifests = []
+        for client, engagement, project_slug, name, title in rows:
+            stops = conn.execute(
+                "SELECT stop_order, title, atlas_source, map_file, analysis_file"
+                " FROM stops WHERE client = ? AND engagement = ?"
+                " AND project_slug = ? AND tour_name = ? ORDER BY position",
+                (client, engagement, project_slug, name),
+            ).fetchall()
+            manifests.append(
+                TourManifest(
+                    name=name,
+                    client=client,
+                    engagement=engagement,
+                    project_slug=project_slug,
+                    title=title,
+                    stops=[TourStop(**dict(zip(_STOP_FIELDS, row))) for row in stops],
+                )
+            )
+        return manifests
+
+    def get(
+        self,
+        client: str,
+        engagement: str,
+        project_slug: str,
+        tour_name: str,
+    ) -> TourManifest | None:
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT client, engagement, project_slug, name, title FROM tours"
+                " WHERE client = ? AND engagement = ? AND project_slug = ?"
+                " AND name = ?",
+                (client, engagement, project_slug, tour_name),
+            ).fetchall()
+            found = self._load(conn, rows)
+        return found[0] if found else None
+
+    def list_all(
+        self, client: str, engagement: str, project_slug: str
+    ) -> list[TourManifest]:
+        """List all tour manifests for a project."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT client, engagement, project_slug, name, title FROM tours"
+                " WHERE client = ? AND engagement = ? AND project_slug = ?"
+                " ORDER BY name",
+                (client, engagement, project_slug),
+            ).fetchall()
+            return self._load(conn, rows)
+
+    def save(self, manifest: TourManifest) -> None:
+        key = (
+            manifest.client,
+            manifest.engagement,
+            manifest.project_slug,
+            manifest.name,
         )
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "DELETE FROM tours WHERE client = ? AND engagement = ?"
+                " AND project_slug = ? AND name = ?",
+                key,
+            )
+            conn.execute(
+                "INSERT INTO tours VALUES (?, ?, ?, ?, ?)", (*key, manifest.title)
+            )
+            conn.executemany(
+                "INSERT INTO stops VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        *key,
+                        position,
+                        stop.order,
+                        stop.title,
+                        stop.atlas_source,
+                        stop.map_file,
+                        stop.analysis_file,
+                    )
+                    for position, stop in enumerate(manifest.stops)
+                ],
+            )
+
+    def find_by_atlas_source(
+        self, atlas_source: str, client: str | None = None
+    ) -> list[TourManifest]:
+        """Every tour with a stop on an atlas view, across all projects.
+
+        ``atlas/risk`` and ``atlas/risk/`` name the same view.
+        """
+        base = atlas_source.rstrip("/")
+        query = (
+            "SELECT DISTINCT t.client, t.engagement, t.project_slug, t.name, t.title"
+            " FROM stops s JOIN tours t ON t.client = s.client"
+            " AND t.engagement = s.engagement AND t.project_slug = s.project_slug"
+            " AND t.name = s.tour_name WHERE s.atlas_source IN (?, ?)"
+        )
+        params: tuple = (base, f"{base}/")
+        if client is not None:
+            query += " AND s.client = ?"
+            params += (client,)
+        query += " ORDER BY t.client, t.engagement, t.project_slug, t.name"
+        with closing(self._connect()) as conn:
+            return self._load(conn, conn.execute(query, params).fetchall())
+
+    def import_workspace(self, workspace_root: Path) -> int:
+        """Copy every JSON tour manifest under a workspace; return the count."""
+        count = 0
+        for path in sorted(
+            workspace_root.glob("*/engagements/*/*/presentations/*/manifest.json")
+        ):
+            data = read_json_object(path)
+            if data is not None:
+                self.save(TourManifest.model_validate(data))
+                count += 1
+        return count
+
+
+class FileMapAnalytics:
+    """Map analytics computed from OWM files and cached beside each map.
+
+    ``strategy/map.agreed.owm`` caches to
+    ``strategy/map.agreed.analytics.json``. The cache is keyed on the
+    source bytes and the analytics engine version, so it is reused
+    until the map itself changes. A ``map_path`` that resolves outside
+    the project directory, or to anything but an ``.owm`` file, is
+    treated as missing so no sidecar is written elsewhere.
+    """
+
+    def __init__(self, workspace_root: Path) -> None:
+        self._root = workspace_root
+
+    def analyse(
+        self,
+        client: str,
+        engagement: str,
+        project_slug: str,
+        map_path: str,
+    ) -> MapAnalytics | None:
+        proj_dir = (
+            self._root / client / "engagements" / engagement / project_slug
+        ).resolve()
+        owm = (proj_dir / map_path).resolve()
+        if not owm.is_relative_to(proj_dir) or owm.suffix != ".owm":
+            return None
+        if not owm.is_file():
+            return None
+        source = owm.read_bytes()
+        digest = hashlib.sha256(ANALYTICS_VERSION.encode() + b"\0" + source).hexdigest()
+
+        sidecar = owm.with_name(f"{owm.name.removesuffix('.owm')}.analytics.json")
+        cached = read_json_object(sidecar)
+        if cached is not None and cached.get("source_hash") == digest:
+            return MapAnalytics.model_validate(cached)
+
+        result = analyse_map(parse_owm(source.decode("utf-8")), source_hash=digest)
+        write_json_object(sidecar, result.model_dump(mode="json"))
+        return result
+
+
+class FileAtlasIndex:
+    """Atlas build index stored in each project's ``atlas/.index.json``.
+
+    ``client:`` sources resolve against ``{workspace_root}/{client}``.
+    """
+
+    def __init__(self, workspace_root: Path) -> None:
+        self._root = workspace_root
+
+    def _index(
+        self, client: str, engagement: str, project_slug: str
+    ) -> AtlasBuildIndex:
+        return AtlasBuildIndex(
+            self._root / client / "engagements" / engagement / project_slug,
+            self._root / client,
+        )
+
+    def status(
+        self, client: str, engagement: str, project_slug: str
+    ) -> list[AtlasViewStatus]:
+        return self._index(client, engagement, project_slug).status_all()
+
+    def record(
+        self, client: str, engagement: str, project_slug: str, view: str
+    ) -> AtlasViewStatus | None:
+        index = self._index(client, engagement, project_slug)
+        found = index.view(view)
+        if found is None:
+            return None
+        return index.record(found)
+
+
+class FileTourStopChecker:
+    """Checks tour stops against a fresh scan of each project directory."""
+
+    def __init__(self, workspace_root: Path) -> None:
+        self._root = workspace_root
+
+    def check(self, manifests: list[TourManifest]) -> list[list[StopError]]:
+        inventories: dict[Path, AtlasInventory] = {}
+        result = []
+        for manifest in manifests:
+            project_dir = (
+                self._root
+                / manifest.client
+                / "engagements"
+                / manifest.engagement
+                / manifest.project_slug
+            )
+            if project_dir not in inventories:
+                inventories[project_dir] = AtlasInventory.scan(project_dir)
+            result.append(inventories[project_dir].check_all(manifest.stops))
+        return result
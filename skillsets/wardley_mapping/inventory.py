@@ -0,0 +1,83 @@
+"""Registration-time checks for tour stops.
+
+A tour stop names an atlas view directory plus the map and analysis
+files inside it. When a reference is wrong, the presenter falls back
+to the first SVG in the directory, or to nothing at all, so a broken
+tour is otherwise only noticed when someone reads the rendered site.
+
+``AtlasInventory`` answers every stop's questions from a single
+``ProjectTree`` scan, so one inventory can check all the stops of all
+the tours being registered for a project.
+"""
+
+from __future__ import annotations
+
+import difflib
+from pathlib import Path
+
+from wardley_mapping.tree import ProjectTree
+from wardley_mapping.types import StopError, TourStop
+
+
+class AtlasInventory:
+    """The atlas views of one project and the files each contains."""
+
+    def __init__(self, tree: ProjectTree) -> None:
+        self._tree = tree
+
+    @classmethod
+    def scan(cls, project_dir: Path) -> AtlasInventory:
+        return cls(ProjectTree(project_dir))
+
+    def views(self) -> list[str]:
+        """Project-relative paths of the atlas view directories."""
+        return [f"atlas/{name}" for name in self._tree.subdirs("atlas")]
+
+    def _has_map(self, view: str, map_file: str) -> bool:
+        if self._tree.is_file(f"{view}/{map_file}"):
+            return True
+        # SVGs are rendered from their OWM source when the site is built
+        stem, dot, ext = map_file.rpartition(".")
+        return (
+            bool(dot)
+            and ext == "svg"
+            and any(
+                self._tree.is_file(f"{view}/{stem}{suffix}")
+                for suffix in (".owm", ".agreed.owm")
+            )
+        )
+
+    def check(self, stop: TourStop) -> list[StopError]:
+        """Problems with the files a stop refers to; empty if none."""
+        if not stop.atlas_source:
+            return []  # section header
+
+        view = stop.atlas_source.rstrip("/")
+        if not self._tree.is_dir(view):
+            message = f"no atlas view at {stop.atlas_source}"
+            close = difflib.get_close_matches(view, self.views(), n=1)
+            if close:
+                message += f" (did you mean {close[0]}/?)"
+            return [StopError(order=stop.order, field="atlas_source", message=message)]
+
+        errors: list[StopError] = []
+        if not self._has_map(view, stop.map_file):
+            errors.append(
+                StopError(
+                    order=stop.order,
+                    field="map_file",
+                    message=f"{stop.map_file} not found in {view}/",
+                )
+            )
+        if not self._tree.is_file(f"{view}/{stop.analysis_file}"):
+            errors.append(
+                StopError(
+                    order=stop.order,
+                    field="analysis_file",
+                    message=f"{stop.analysis_file} not found in {view}/",
+                )
+            )
+        return errors
+
+    def check_all(self, stops: list[TourStop]) -> list[StopError]:
+        return [error for stop in stops for error in self.check(stop)]
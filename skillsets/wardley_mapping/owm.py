@@ -0,0 +1,504 @@
+"""OWM DSL parser and in-memory map graph.
+
+Parses the Online Wardley Maps DSL documented in
+``references/owm-dsl-reference.md`` into an ``OwmMap``:
+nodes carry integer ids, and dependencies are held as adjacency lists
+indexed by id. The tokenizer consumes lines lazily, so a map file is
+read in a single pass without loading it whole.
+
+The parser is lenient in the same way the renderer is: statements it
+does not understand are recorded as warnings rather than raised, and
+links to undeclared components are kept aside as unresolved.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+DEFAULT_EVOLVE_MATURITY = 0.85
+
+_NUMBER = r"-?\d+(?:\.\d+)?|-?\.\d+"
+_COORDS = re.compile(rf"\[\s*({_NUMBER})\s*(?:,\s*({_NUMBER})\s*)?\]")
+_LABEL = re.compile(rf"\blabel\s*\[\s*(?:{_NUMBER})\s*,\s*(?:{_NUMBER})\s*\]")
+_DECORATORS = re.compile(r"\(([a-z,\s]+)\)")
+_FLOW = re.compile(r"^(?P<a>.+?)\+(?:'(?P<label>[^']*)')?(?P<dir><>|>|<)(?P<b>.+)$")
+_EVOLVE = re.compile(rf"^(?P<names>.+?)\s+(?P<mat>{_NUMBER})(?P<rest>.*)$")
+_PAIR = re.compile(rf"\[\s*({_NUMBER})\s*,\s*({_NUMBER})\s*\]")
+_ANNOTATION = re.compile(r"^(?P<n>\d+)\s+(?P<coords>\[.*\])\s*(?P<text>.*)$")
+_URL = re.compile(r"\burl\s*\(([^)]*)\)")
+
+
+# ---------------------------------------------------------------------------
+# Tokenizer
+# ---------------------------------------------------------------------------
+
+
+def _strip_line_comment(line: str) -> str:
+    """Drop a ``//`` comment, leaving ``//`` inside URLs and brackets alone."""
+    depth = 0
+    for i, ch in enumerate(line):
+        if ch == "[":
+            depth += 1
+        elif ch == "]":
+            depth = max(depth - 1, 0)
+        elif (
+            ch == "/"
+            and depth == 0
+            and line.startswith("//", i)
+            and (i == 0 or line[i - 1] in " \t")
+        ):
+            return line[:i]
+    return line
+
+
+def iter_statements(lines: Iterable[str]) -> Iterator[tuple[int, str]]:
+    """Yield ``(line_number, statement)`` pairs with comments removed.
+
+    Handles ``//`` line comments, inline comments and ``/* ... */``
+    blocks spanning several lines. Blank statements are skipped.
+    """
+    in_block = False
+    for lineno, raw in enumerate(lines, start=1):
+        line = raw.rstrip("\n")
+        out: list[str] = []
+        while line:
+            if in_block:
+                end = line.find("*/")
+                if end < 0:
+                    line = ""
+                    break
+                line = line[end + 2 :]
+                in_block = False
+                continue
+            start = line.find("/*")
+            if start < 0:
+                out.append(line)
+                break
+            out.append(line[:start])
+            line = line[start + 2 :]
+            in_block = True
+        statement = _strip_line_comment("".join(out)).strip()
+        if statement:
+            yield lineno, statement
+
+
+# ---------------------------------------------------------------------------
+# Graph model
+# ---------------------------------------------------------------------------
+
+
+@dataclass(slots=True)
+class Flow:
+    """A flow link between two nodes (``A+>B`` and friends)."""
+
+    source: int
+    target: int
+    direction: str  # "forward", "reverse" or "both"
+    label: str = ""
+    context: str = ""
+
+
+@dataclass(slots=True)
+class Evolve:
+    """A movement arrow: node evolves to a maturity, optionally renamed."""
+
+    node: int
+    maturity: float
+    renamed_to: str = ""
+    decorators: tuple[str, ...] = ()
+
+
+@dataclass(slots=True)
+class Annotation:
+    """A numbered callout, anchored at one or more positions."""
+
+    number: int
+    positions: list[tuple[float, float]]
+    text: str
+
+
+@dataclass(slots=True)
+class Note:
+    """Free text placed on the map; ``emphasis`` for ``+``-prefixed notes."""
+
+    text: str
+    visibility: float
+    maturity: float
+    emphasis: bool = False
+
+
+@dataclass(slots=True)
+class OwmMap:
+    """A parsed Wardley map.
+
+    Node attributes live in parallel lists indexed by node id.
+    ``depends_on[i]`` lists the ids node ``i`` links to (``i->j``);
+    ``dependents[j]`` is the reverse adjacency. Pipelines map a parent
+    node id to its variant ids.
+    """
+
+    title: str = ""
+    style: str = ""
+    names: list[str] = field(default_factory=list)
+    kinds: list[str] = field(default_factory=list)
+    visibility: list[float | None] = field(default_factory=list)
+    maturity: list[float | None] = field(default_factory=list)
+    decorators: list[tuple[str, ...]] = field(default_factory=list)
+    inertia: list[bool] = field(default_factory=list)
+    depends_on: list[list[int]] = field(default_factory=list)
+    dependents: list[list[int]] = field(default_factory=list)
+    link_context: dict[tuple[int, int], str] = field(default_factory=dict)
+    flows: list[Flow] = field(default_factory=list)
+    evolves: list[Evolve] = field(default_factory=list)
+    pipelines: dict[int, list[int]] = field(default_factory=dict)
+    annotations: list[Annotation] = field(default_factory=list)
+    notes: list[Note] = field(default_factory=list)
+    forces: list[tuple[str, str, float, float]] = field(default_factory=list)
+    unresolved: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+    index: dict[str, int] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def id(self, name: str) -> int:
+        """Return the node id for a name; KeyError if undeclared."""
+        return self.index[name]
+
+    @property
+    def anchors(self) -> list[int]:
+        return [i for i, k in enumerate(self.kinds) if k == "anchor"]
+
+    def edges(self) -> Iterator[tuple[int, int]]:
+        """Yield every dependency as ``(source, target)``."""
+        for source, targets in enumerate(self.depends_on):
+            for target in targets:
+                yield source, target
+
+    def _add_node(
+        self,
+        name: str,
+        kind: str,
+        visibility: float | None,
+        maturity: float | None,
+    ) -> int:
+        if name in self.index:
+            node = self.index[name]
+            self.kinds[node] = kind
+            self.visibility[node] = visibility
+            self.maturity[node] = maturity
+            return node
+        node = len(self.names)
+        self.index[name] = node
+        self.names.append(name)
+        self.kinds.append(kind)
+        self.visibility.append(visibility)
+        self.maturity.append(maturity)
+        self.decorators.append(())
+        self.inertia.append(False)
+        self.depends_on.append([])
+        self.dependents.append([])
+        return node
+
+
+# ---------------------------------------------------------------------------
+# Parser
+# ---------------------------------------------------------------------------
+
+
+def _split_context(text: str) -> tuple[str, str]:
+    head, _, context = text.partition(";")
+    return head.strip(), context.strip()
+
+
+def _coords(text: str) -> tuple[float | None, float | None]:
+    m = _COORDS.search(text)
+    if m is None:
+        return None, None
+    first = float(m.group(1))
+    if m.group(2) is None:
+        return None, first
+    return first, float(m.group(2))
+
+
+def _decorators(text: str) -> tuple[str, ...]:
+    m = _DECORATORS.search(text)
+    if m is None:
+        return ()
+    return tuple(d.strip() for d in m.group(1).split(",") if d.strip())
+
+
+class _Parser:
+    """Single-pass statement consumer building an OwmMap."""
+
+    def __init__(self) -> None:
+        self.map = OwmMap()
+        self._links: list[tuple[int, str, str, str]] = []
+        self._flows: list[tuple[int, str, str, str, str, str]] = []
+        self._evolves: list[tuple[int, str, float, str, tuple[str, ...]]] = []
+        self._strategies: list[tuple[int, str, str]] = []
+        self._pipelines: list[tuple[str, list[int]]] = []
+        # Pipeline body state: None, "expect-brace" or "open"
+        self._pipeline_state: str | None = None
+
+    def feed(self, lineno: int, stmt: str) -> None:
+        if self._pipeline_state is not None and self._consume_pipeline(lineno, stmt):
+            return
+        keyword, _, rest = stmt.partition(" ")
+        rest = rest.strip()
+        handler = getattr(self, f"_kw_{keyword}", None)
+        if handler is not None and not self._looks_like_link(keyword, rest):
+            handler(lineno, rest)
+            return
+        if self._link(lineno, stmt):
+            return
+        self.map.warnings.append(f"line {lineno}: unrecognised statement: {stmt}")
+
+    @staticmethod
+    def _looks_like_link(keyword: str, rest: str) -> bool:
+        """A link whose source name starts with a keyword, e.g. ``market x->y``."""
+        if keyword in ("evolve", "evolution", "note", "annotation", "title"):
+            return False
+        head, _ = _split_context(rest)
+        return "[" not in head and ("->" in head or _FLOW.match(head) is not None)
+
+    # -- metadata ----------------------------------------------------------
+
+    def _kw_title(self, lineno: int, rest: str) -> None:
+        self.map.title = rest
+
+    def _kw_style(self, lineno: int, rest: str) -> None:
+        self.map.style = rest
+
+    def _kw_size(self, lineno: int, rest: str) -> None:
+        pass
+
+    def _kw_evolution(self, lineno: int, rest: str) -> None:
+        pass
+
+    def _kw_annotations(self, lineno: int, rest: str) -> None:
+        pass
+
+    def _kw_url(self, lineno: int, rest: str) -> None:
+        pass
+
+    # -- nodes -------------------------------------------------------------
+
+    def _node(self, lineno: int, kind: str, rest: str) -> int | None:
+        bracket = rest.find("[")
+        if bracket < 0:
+            self.map.warnings.append(f"line {lineno}: {kind} without position")
+            return None
+        name = rest[:bracket].strip()
+        tail = _LABEL.sub("", rest[bracket:])
+        visibility, maturity = _coords(tail)
+        node = self.map._add_node(name, kind, visibility, maturity)
+        decorators = _decorators(tail)
+        if decorators:
+            self.map.decorators[node] = decorators
+        if re.search(r"\binertia\b", tail):
+            self.map.inertia[node] = True
+        return node
+
+    def _kw_anchor(self, lineno: int, rest: str) -> None:
+        self._node(lineno, "anchor", rest)
+
+    def _kw_component(self, lineno: int, rest: str) -> None:
+        self._node(lineno, "component", rest)
+
+    def _kw_market(self, lineno: int, rest: str) -> None:
+        self._node(lineno, "market", rest)
+
+    def _kw_ecosystem(self, lineno: int, rest: str) -> None:
+        self._node(lineno, "ecosystem", rest)
+
+    def _kw_submap(self, lineno: int, rest: str) -> None:
+        self._node(lineno, "submap", _URL.sub("", rest))
+
+    def _strategy(self, lineno: int, strategy: str, rest: str) -> None:
+        self._strategies.append((lineno, strategy, rest))
+
+    def _kw_build(self, lineno: int, rest: str) -> None:
+        self._strategy(lineno, "build", rest)
+
+    def _kw_buy(self, lineno: int, rest: str) -> None:
+        self._strategy(lineno, "buy", rest)
+
+    def _kw_outsource(self, lineno: int, rest: str) -> None:
+        self._strategy(lineno, "outsource", rest)
+
+    # -- pipelines ---------------------------------------------------------
+
+    def _kw_pipeline(self, lineno: int, rest: str) -> None:
+        opens = rest.endswith("{")
+        name = rest.removesuffix("{").split("[", 1)[0].strip()
+        self._pipelines.append((name, []))
+        self._pipeline_state = "open" if opens else "expect-brace"
+
+    def _consume_pipeline(self, lineno: int, stmt: str) -> bool:
+        """Handle a statement inside (or just after) a pipeline header."""
+        if self._pipeline_state == "expect-brace":
+            if stmt == "{":
+                self._pipeline_state = "open"
+                return True
+            self._pipeline_state = None
+            return False
+        if stmt == "}":
+            self._pipeline_state = None
+            return True
+        if stmt.startswith("component "):
+            child = self._node(lineno, "component", stmt.removeprefix("component "))
+            if child is not None:
+                self._pipelines[-1][1].append(child)
+            return True
+        return False
+
+    # -- movement, notes, annotations, forces --------------------------------
+
+    def _kw_evolve(self, lineno: int, rest: str) -> None:
+        m = _EVOLVE.match(_LABEL.sub("", rest).strip())
+        if m is None:
+            names, maturity, tail = rest, DEFAULT_EVOLVE_MATURITY, ""
+        else:
+            names, maturity, tail = m["names"], float(m["mat"]), m["rest"]
+        source, _, renamed = names.partition("->")
+        self._evolves.append(
+            (lineno, source.strip(), maturity, renamed.strip(), _decorators(tail))
+        )
+
+    def _kw_note(self, lineno: int, rest: str) -> None:
+        bracket = rest.rfind("[")
+        if bracket < 0:
+            self.map.warnings.append(f"line {lineno}: note without position")
+            return
+        text = rest[:bracket].strip()
+        visibility, maturity = _coords(rest[bracket:])
+        emphasis = text.startswith("+")
+        self.map.notes.append(
+            Note(
+                text=text.removeprefix("+").strip(),
+                visibility=visibility or 0.0,
+                maturity=maturity or 0.0,
+                emphasis=emphasis,
+            )
+        )
+
+    def _kw_annotation(self, lineno: int, rest: str) -> None:
+        m = _ANNOTATION.match(rest)
+        if m is None:
+            self.map.warnings.append(f"line {lineno}: malformed annotation")
+            return
+        positions = [(float(a), float(b)) for a, b in _PAIR.findall(m["coords"])]
+        self.map.annotations.append(
+            Annotation(number=int(m["n"]), positions=positions, text=m["text"].strip())
+        )
+
+    def _force(self, lineno: int, kind: str, rest: str) -> None:
+        bracket = rest.find("[")
+        visibility, maturity = _coords(rest)
+        if bracket < 0 or visibility is None or maturity is None:
+            self.map.warnings.append(f"line {lineno}: {kind} without position")
+            return
+        self.map.forces.append((kind, rest[:bracket].strip(), visibility, maturity))
+
+    def _kw_accelerator(self, lineno: int, rest: str) -> None:
+        self._force(lineno, "accelerator", rest)
+
+    def _kw_deaccelerator(self, lineno: int, rest: str) -> None:
+        self._force(lineno, "deaccelerator", rest)
+
+    def _kw_pioneers(self, lineno: int, rest: str) -> None:
+        pass
+
+    def _kw_settlers(self, lineno: int, rest: str) -> None:
+        pass
+
+    def _kw_townplanners(self, lineno: int, rest: str) -> None:
+        pass
+
+    # -- links ---------------------------------------------------------------
+
+    def _link(self, lineno: int, stmt: str) -> bool:
+        head, context = _split_context(stmt)
+        flow = _FLOW.match(head)
+        if flow is not None and "->" not in head:
+            direction = {">": "forward", "<": "reverse", "<>": "both"}[flow["dir"]]
+            self._flows.append(
+                (
+                    lineno,
+                    flow["a"].strip(),
+                    flow["b"].strip(),
+                    direction,
+                    flow["label"] or "",
+                    context,
+                )
+            )
+            return True
+        if "->" in head:
+            source, _, target = head.partition("->")
+            self._links.append((lineno, source.strip(), target.strip(), context))
+            return True
+        return False
+
+    # -- resolution ----------------------------------------------------------
+
+    def finish(self) -> OwmMap:
+        """Resolve forward references once every node is declared."""
+        m = self.map
+        for name, children in self._pipelines:
+            parent = m.index.get(name)
+            if parent is None:
+                m.unresolved.append(f"pipeline {name}")
+                continue
+            m.pipelines[parent] = children
+            for child in children:
+                if m.visibility[child] is None:
+                    m.visibility[child] = m.visibility[parent]
+        for lineno, source, target, context in self._links:
+            a, b = m.index.get(source), m.index.get(target)
+            if a is None or b is None:
+                m.unresolved.append(f"line {lineno}: {source}->{target}")
+                continue
+            if b not in m.depends_on[a]:
+                m.depends_on[a].append(b)
+                m.dependents[b].append(a)
+            if context:
+                m.link_context[(a, b)] = context
+        for lineno, source, target, direction, label, context in self._flows:
+            a, b = m.index.get(source), m.index.get(target)
+            if a is None or b is None:
+                m.unresolved.append(f"line {lineno}: flow {source}->{target}")
+                continue
+            m.flows.append(Flow(a, b, direction, label, context))
+        for lineno, source, maturity, renamed, decorators in self._evolves:
+            node = m.index.get(source)
+            if node is None:
+                m.unresolved.append(f"line {lineno}: evolve {source}")
+                continue
+            m.evolves.append(Evolve(node, maturity, renamed, decorators))
+        for lineno, strategy, name in self._strategies:
+            node = m.index.get(name)
+            if node is None:
+                m.unresolved.append(f"line {lineno}: {strategy} {name}")
+                continue
+            if strategy not in m.decorators[node]:
+                m.decorators[node] = (*m.decorators[node], strategy)
+        return m
+
+
+def parse_owm(source: str | Iterable[str]) -> OwmMap:
+    """Parse OWM text (or an iterable of lines) into an OwmMap."""
+    lines = source.splitlines() if isinstance(source, str) else source
+    parser = _Parser()
+    for lineno, stmt in iter_statements(lines):
+        parser.feed(lineno, stmt)
+    return parser.finish()
+
+
+def load_owm(path: Path) -> OwmMap:
+    """Parse an OWM file, streaming it line by line."""
+    with path.open(encoding="utf-8") as f:
+        return parse_owm(f)
@@ -7,8 +7,10 @@ the skillset internals.
 
 from __future__ import annotations
 
+import logging
 import re
-import subprocess
+import threading
+from collections.abc import Iterator, Sequence
 from pathlib import Path
 
 from practice.content import (
@@ -22,7 +24,26 @@ from practice.content import (
     ProjectSection,
 )
 from practice.entities import Project
-from wardley_mapping.types import TourManifest, TourManifestRepository
+from shared.pages import BodyLoader, LazyContentPage, load_section
+from wardley_mapping.rendering import (
+    BatchRenderer,
+    OwmRenderCache,
+    RenderPool,
+    RenderReport,
+    ScriptRenderer,
+    file_digest,
+    svg_path_for,
+)
+from wardley_mapping.tree import ProjectTree
+from wardley_mapping.types import TourManifest, TourManifestRepository, TourStop
+
+# Trailing letters mark a sub-stop: "2a" and "2b" belong under "2".
+_ORDER_SUFFIX = re.compile(r"[a-z]+$")
+
+# (atlas path, map file, analysis file) -> (figures, analysis markdown)
+_StopContent = dict[tuple[str, str, str], tuple[list[Figure], str]]
+
+_log = logging.getLogger(__name__)
 
 
 def _atlas_category(name: str) -> str:
@@ -51,20 +72,6 @@ def _title_case(slug: str) -> str:
     return " ".join(w.capitalize() for w in slug.split("-"))
 
 
-def _read_md(path: Path) -> str:
-    """Read a markdown file and return its text, or empty string."""
-    if path.is_file():
-        return path.read_text()
-    return ""
-
-
-def _read_svg(path: Path) -> str:
-    """Read an SVG file and return its content, or empty string."""
-    if path.is_file():
-        return path.read_text()
-    return ""
-
-
 def _extract_second_paragraph(text: str) -> str:
     """Extract the second paragraph from markdown text."""
     paragraphs: list[str] = []
@@ -81,6 +88,11 @@ def _extract_second_paragraph(text: str) -> str:
     return paragraphs[1] if len(paragraphs) > 1 else ""
 
 
+def _tree_body(tree: ProjectTree, *rels: str) -> BodyLoader:
+    """Loader joining the markdown files *rels* with horizontal rules."""
+    return lambda: "\n\n---\n\n".join(tree.read_text(rel) for rel in rels)
+
+
 class WardleyProjectPresenter:
     """Assembles Wardley Mapping workspace artifacts into structured content."""
 
@@ -89,15 +101,43 @@ class WardleyProjectPresenter:
         workspace_root: Path,
         ensure_owm_script: Path,
         tours: TourManifestRepository,
+        render_cache: OwmRenderCache | None = None,
+        render_workers: int | None = None,
+        owm_batch_command: Sequence[str] | None = None,
     ) -> None:
         self._ws_root = workspace_root
         self._ensure_owm = ensure_owm_script
         self._tours = tours
+        self._render_cache = render_cache or OwmRenderCache(
+            workspace_root / ".cache" / "owm",
+            renderer_version=file_digest(ensure_owm_script),
+        )
+        # One pool for every project this presenter presents, so renders
+        # stay bounded however many projects present_all runs at once.
+        self._render_pool = RenderPool(max_workers=render_workers)
+        self._owm_batch_command = owm_batch_command
+        self._owm_batch: BatchRenderer | None = None
+        self._owm_batch_lock = threading.Lock()
 
     def present(
         self,
         project: Project,
     ) -> ProjectContribution:
+        contribution, sections = self.stream(project)
+        return contribution.model_copy(
+            update={"sections": [load_section(s) for s in sections]}
+        )
+
+    def stream(
+        self, project: Project
+    ) -> tuple[ProjectContribution, Iterator[ProjectSection]]:
+        """The contribution without its sections, and a generator of them.
+
+        Sections are assembled only as the generator is consumed, and
+        their pages are ``LazyContentPage`` loaders, so a renderer that
+        loads each page as it writes it holds one page's markdown and
+        one section's figures at a time.
+        """
         proj_dir = (
             self._ws_root
             / project.client
@@ -106,96 +146,168 @@ class WardleyProjectPresenter:
             / project.slug
         )
 
-        self._ensure_owm_svgs(proj_dir)
+        tree = ProjectTree(proj_dir)
+        self._ensure_owm_svgs(tree)
+
+        has_strategy = tree.is_file("strategy/map.agreed.owm")
+        has_evolve = tree.is_file("evolve/map.agreed.owm")
+        hero = self._select_hero(tree, has_strategy, has_evolve)
 
+        contribution = ProjectContribution(
+            slug=project.slug,
+            title=project.slug,
+            skillset=project.skillset,
+            status=project.status.value,
+            hero_figure=hero,
+            overview_md="",
+            sections=[],
+        )
+        return contribution, self._iter_sections(project, tree)
+
+    def _iter_sections(
+        self, project: Project, tree: ProjectTree
+    ) -> Iterator[ProjectSection]:
         tours = self._tours.list_all(project.client, project.engagement, project.slug)
 
-        has_brief = (proj_dir / "brief.agreed.md").is_file()
-        has_needs = (proj_dir / "needs" / "needs.agreed.md").is_file()
-        has_chain = (proj_dir / "chain" / "supply-chain.agreed.md").is_file()
-        has_evolve = (proj_dir / "evolve" / "map.agreed.owm").is_file()
-        has_strategy = (proj_dir / "strategy" / "map.agreed.owm").is_file()
-        has_atlas = (proj_dir / "atlas").is_dir()
+        has_brief = tree.is_file("brief.agreed.md")
+        has_needs = tree.is_file("needs/needs.agreed.md")
+        has_chain = tree.is_file("chain/supply-chain.agreed.md")
+        has_evolve = tree.is_file("evolve/map.agreed.owm")
+        has_strategy = tree.is_file("strategy/map.agreed.owm")
+        has_atlas = tree.is_dir("atlas")
         has_presentations = bool(tours)
-        has_decisions = (proj_dir / "decisions.md").is_file()
+        has_decisions = tree.is_file("decisions.md")
         has_analysis = any(
             [has_brief, has_needs, has_chain, has_evolve, has_strategy, has_decisions]
         )
 
-        sections: list[ProjectSection] = []
-
         if has_presentations:
-            sections.append(self._build_presentations_section(proj_dir, tours))
+            yield self._build_presentations_section(tree, tours)
 
         if has_atlas:
-            sections.append(self._build_atlas_section(proj_dir))
+            yield self._build_atlas_section(tree)
 
         if has_analysis:
-            sections.append(
-                self._build_analysis_section(
-                    proj_dir,
-                    has_brief,
-                    has_needs,
-                    has_chain,
-                    has_evolve,
-                    has_strategy,
-                    has_decisions,
-                )
+            yield self._build_analysis_section(
+                tree,
+                has_brief,
+                has_needs,
+                has_chain,
+                has_evolve,
+                has_strategy,
+                has_decisions,
             )
 
-        hero = self._select_hero(proj_dir, has_strategy, has_evolve)
-
-        return ProjectContribution(
-            slug=project.slug,
-            title=project.slug,
-            skillset=project.skillset,
-            status=project.status.value,
-            hero_figure=hero,
-            overview_md="",
-            sections=sections,
-        )
-
     # -- OWM rendering -----------------------------------------------------
 
-    def _ensure_owm_svgs(self, project_dir: Path) -> None:
-        """Shell out to ensure-owm.sh for all OWM files in the project."""
-        for owm in project_dir.rglob("*.owm"):
-            svg = owm.with_suffix(".svg")
-            if not svg.exists() or owm.stat().st_mtime > svg.stat().st_mtime:
-                print(f"    Rendering {owm} -> SVG")
-                subprocess.run([str(self._ensure_owm), str(owm)], capture_output=True)
+    def _ensure_owm_svgs(self, tree: ProjectTree) -> RenderReport:
+        """Render every OWM file in the project whose source is not cached.
+
+        Freshness is decided by content hash, not mtime, so checkouts
+        that reset modification times do not force a re-render. Stale
+        files render concurrently; failures are logged, not dropped.
+        Progress goes to this module's logger, one record per line,
+        so projects presented concurrently do not interleave output.
+        SVGs that appear are registered on the tree snapshot.
+        """
+        cache = self._render_cache
+        hits = 0
+        stale: dict[Path, str] = {}
+        for rel in tree.walk_files(".owm"):
+            owm = tree.path(rel)
+            key = cache.key(owm.read_bytes())
+            if cache.restore(key, svg_path_for(owm)):
+                hits += 1
+                tree.add_file(svg_path_for(Path(rel)).as_posix())
+            else:
+                _log.info("Rendering %s -> SVG", owm)
+                stale[owm] = key
+
+        report = self._render_stale(list(stale))
+        for outcome in report.outcomes:
+            svg = svg_path_for(outcome.source)
+            if outcome.ok and svg.is_file():
+                cache.store(stale[outcome.source], svg)
+                tree.add_file(svg.relative_to(tree.root).as_posix())
+            elif not outcome.ok:
+                _log.warning("Failed to render %s: %s", outcome.source, outcome.error)
+
+        if hits or stale:
+            _log.info(
+                "%s: OWM render cache: %d hit(s), %d miss(es)",
+                tree.root.name,
+                hits,
+                len(stale),
+            )
+        return report
+
+    def _render_stale(self, sources: list[Path]) -> RenderReport:
+        """Render through the batch renderer, or per file if unavailable.
+
+        The batch process is started on first use and kept for the
+        lifetime of the presenter, so every project of a client
+        streams through one renderer, even when projects are
+        presented concurrently. If it dies or hangs mid-run, the
+        sources it did not finish render per file instead.
+        """
+        if not sources:
+            return RenderReport()
+        with self._owm_batch_lock:
+            if self._owm_batch is not None and not self._owm_batch.alive:
+                self._owm_batch = None
+            if self._owm_batch is None and self._owm_batch_command:
+                self._owm_batch = BatchRenderer.start(self._owm_batch_command)
+                if self._owm_batch is None:
+                    _log.warning("OWM batch renderer unavailable, rendering per file")
+                    self._owm_batch_command = None
+            batch = self._owm_batch
+        script = ScriptRenderer(self._ensure_owm)
+        if batch is None:
+            return self._render_pool.run(sources, script)
+        outcomes, remaining = batch.run(sources)
+        if remaining:
+            _log.warning(
+                "OWM batch renderer stopped, rendering %d file(s) per file",
+                len(remaining),
+            )
+            outcomes += self._render_pool.run(remaining, script).outcomes
+        return RenderReport(outcomes=outcomes)
 
     # -- Hero figure selection ---------------------------------------------
 
     def _select_hero(
-        self, proj_dir: Path, has_strategy: bool, has_evolve: bool
+        self, tree: ProjectTree, has_strategy: bool, has_evolve: bool
     ) -> Figure | None:
-        if has_strategy and (proj_dir / "strategy" / "map.svg").is_file():
+        if has_strategy and tree.is_file("strategy/map.svg"):
             return Figure(
                 caption="Strategy map",
-                svg_content=_read_svg(proj_dir / "strategy" / "map.svg"),
+                svg_content=tree.read_svg("strategy/map.svg"),
             )
-        if has_evolve and (proj_dir / "evolve" / "map.svg").is_file():
+        if has_evolve and tree.is_file("evolve/map.svg"):
             return Figure(
                 caption="Evolution map",
-                svg_content=_read_svg(proj_dir / "evolve" / "map.svg"),
+                svg_content=tree.read_svg("evolve/map.svg"),
             )
-        if (proj_dir / "landscape.svg").is_file():
+        if tree.is_file("landscape.svg"):
             return Figure(
                 caption="Landscape sketch (approximate)",
-                svg_content=_read_svg(proj_dir / "landscape.svg"),
+                svg_content=tree.read_svg("landscape.svg"),
             )
         return None
 
     # -- Presentations section ---------------------------------------------
 
     def _build_presentations_section(
-        self, proj_dir: Path, tours: list[TourManifest]
+        self, tree: ProjectTree, tours: list[TourManifest]
     ) -> ProjectSection:
+        # Tours for different audiences revisit the same atlas views
+        stop_content: _StopContent = {}
         narrative_pages: list[NarrativePage] = []
         for manifest in tours:
-            tour_dir = proj_dir / "presentations" / manifest.name
-            narrative_pages.append(self._assemble_tour(proj_dir, tour_dir, manifest))
+            tour_dir = f"presentations/{manifest.name}"
+            narrative_pages.append(
+                self._assemble_tour(tree, tour_dir, manifest, stop_content)
+            )
 
         return ProjectSection(
             label="Presentations",
@@ -206,10 +318,13 @@ class WardleyProjectPresenter:
 
     def _assemble_tour(
         self,
-        proj_dir: Path,
-        tour_dir: Path,
+        tree: ProjectTree,
+        tour_dir: str,
         manifest: TourManifest,
+        stop_content: _StopContent | None = None,
     ) -> NarrativePage:
+        if stop_content is None:
+            stop_content = {}
         if not manifest.stops:
             return NarrativePage(
                 title=manifest.title,
@@ -224,7 +339,7 @@ class WardleyProjectPresenter:
         current_base = None
         current_stops: list = []
         for stop in manifest.stops:
-            base = re.sub(r"[a-z]+$", "", stop.order)
+            base = _ORDER_SUFFIX.sub("", stop.order)
             if base != current_base:
                 if current_stops:
                     raw_groups.append({"base": current_base, "stops": current_stops})
@@ -236,11 +351,11 @@ class WardleyProjectPresenter:
             raw_groups.append({"base": current_base, "stops": current_stops})
 
         # Transition files
-        trans_dir = tour_dir / "transitions"
-        trans_files = sorted(trans_dir.glob("*.md")) if trans_dir.is_dir() else []
+        trans_dir = f"{tour_dir}/transitions"
+        trans_files = [f"{trans_dir}/{name}" for name in tree.files(trans_dir, ".md")]
 
         # Opening
-        opening_md = _read_md(tour_dir / "opening.md")
+        opening_md = tree.read_text(f"{tour_dir}/opening.md")
 
         # Description from opening
         description = _extract_second_paragraph(opening_md) if opening_md else ""
@@ -250,8 +365,7 @@ class WardleyProjectPresenter:
         for gi, group in enumerate(raw_groups):
             stops: list[NarrativeStop] = []
             for stop in group["stops"]:
-                has_suffix = bool(re.search(r"[a-z]$", stop.order))
-                level = "h3" if has_suffix else "h2"
+                level = "h3" if _ORDER_SUFFIX.search(stop.order) else "h2"
 
                 if not stop.atlas_source:
                     stops.append(
@@ -265,9 +379,7 @@ class WardleyProjectPresenter:
                     )
                     continue
 
-                atlas_path = proj_dir / stop.atlas_source.rstrip("/")
-                figures = self._collect_stop_figures(atlas_path, stop.map_file)
-                analysis_md = _read_md(atlas_path / stop.analysis_file)
+                figures, analysis_md = self._stop_content(tree, stop, stop_content)
 
                 stops.append(
                     NarrativeStop(
@@ -280,8 +392,8 @@ class WardleyProjectPresenter:
                 )
 
             transition_md = ""
-            if gi < len(trans_files) and trans_files[gi].is_file():
-                transition_md = trans_files[gi].read_text()
+            if gi < len(trans_files):
+                transition_md = tree.read_text(trans_files[gi])
 
             groups.append(NarrativeGroup(stops=stops, transition_md=transition_md))
 
@@ -293,29 +405,42 @@ class WardleyProjectPresenter:
             groups=groups,
         )
 
-    def _collect_stop_figures(self, atlas_path: Path, map_file: str) -> list[Figure]:
-        svg_path = atlas_path / map_file
-        if svg_path.is_file():
-            return [Figure(caption="", svg_content=_read_svg(svg_path))]
+    def _stop_content(
+        self, tree: ProjectTree, stop: TourStop, memo: _StopContent
+    ) -> tuple[list[Figure], str]:
+        """Figures and analysis for a stop, assembled once per atlas view."""
+        atlas_path = stop.atlas_source.rstrip("/")
+        key = (atlas_path, stop.map_file, stop.analysis_file)
+        if key not in memo:
+            memo[key] = (
+                self._collect_stop_figures(tree, atlas_path, stop.map_file),
+                tree.read_text(f"{atlas_path}/{stop.analysis_file}"),
+            )
+        figures, analysis_md = memo[key]
+        return list(figures), analysis_md
+
+    def _collect_stop_figures(
+        self, tree: ProjectTree, atlas_path: str, map_file: str
+    ) -> list[Figure]:
+        svg_path = f"{atlas_path}/{map_file}"
+        if tree.is_file(svg_path):
+            return [Figure(caption="", svg_content=tree.read_svg(svg_path))]
 
         # Fallback: first SVG in directory
-        for svg_file in sorted(atlas_path.glob("*.svg")):
-            return [Figure(caption="", svg_content=_read_svg(svg_file))]
+        for name in tree.files(atlas_path, ".svg"):
+            svg_file = f"{atlas_path}/{name}"
+            return [Figure(caption="", svg_content=tree.read_svg(svg_file))]
 
         return []
 
     # -- Atlas section -----------------------------------------------------
 
-    def _build_atlas_section(self, proj_dir: Path) -> ProjectSection:
-        atlas_dir = proj_dir / "atlas"
-
-        views: list[str] = []
-        for view_dir in sorted(atlas_dir.iterdir()):
-            if not view_dir.is_dir():
-                continue
-            if not (view_dir / "analysis.md").is_file():
-                continue
-            views.append(view_dir.name)
+    def _build_atlas_section(self, tree: ProjectTree) -> ProjectSection:
+        views = [
+            name
+            for name in tree.subdirs("atlas")
+            if tree.is_file(f"atlas/{name}/analysis.md")
+        ]
 
         # Build category groups
         cat_order = ["structural", "connectivity", "strategic", "dynamic"]
@@ -328,14 +453,12 @@ class WardleyProjectPresenter:
         cat_pages: dict[str, list[ContentPage]] = {c: [] for c in cat_order}
 
         for v in views:
-            view_dir = atlas_dir / v
-            figures = self._collect_atlas_figures(view_dir)
-            analysis_md = _read_md(view_dir / "analysis.md")
-
-            page = ContentPage(
+            view_dir = f"atlas/{v}"
+            figures = self._collect_atlas_figures(tree, view_dir)
+            page = LazyContentPage(
                 title=_title_case(v),
                 slug=v,
-                body_md=analysis_md,
+                loader=_tree_body(tree, f"{view_dir}/analysis.md"),
                 figures=figures,
             )
             cat = _atlas_category(v)
@@ -361,24 +484,27 @@ class WardleyProjectPresenter:
             groups=groups,
         )
 
-    def _collect_atlas_figures(self, view_dir: Path) -> list[Figure]:
-        svgs = sorted(view_dir.glob("*.svg"))
+    def _collect_atlas_figures(self, tree: ProjectTree, view_dir: str) -> list[Figure]:
+        svgs = tree.files(view_dir, ".svg")
         if len(svgs) > 1:
             return [
-                Figure(caption=_title_case(svg.stem), svg_content=_read_svg(svg))
-                for svg in svgs
+                Figure(
+                    caption=_title_case(name.removesuffix(".svg")),
+                    svg_content=tree.read_svg(f"{view_dir}/{name}"),
+                )
+                for name in svgs
             ]
-        if (view_dir / "map.svg").is_file():
-            return [Figure(caption="", svg_content=_read_svg(view_dir / "map.svg"))]
         if svgs:
-            return [Figure(caption="", svg_content=_read_svg(svgs[0]))]
+            return [
+                Figure(caption="", svg_content=tree.read_svg(f"{view_dir}/{svgs[0]}"))
+            ]
         return []
 
     # -- Analysis section --------------------------------------------------
 
     def _build_analysis_section(
         self,
-        proj_dir: Path,
+        tree: ProjectTree,
         has_brief: bool,
         has_needs: bool,
         has_chain: bool,
@@ -389,39 +515,39 @@ class WardleyProjectPresenter:
         pages: list[ContentPage] = []
 
         if has_strategy:
-            pages.append(self._build_strategy_page(proj_dir / "strategy"))
+            pages.append(self._build_strategy_page(tree))
         if has_evolve:
-            pages.append(self._build_evolve_page(proj_dir / "evolve"))
+            pages.append(self._build_evolve_page(tree))
         if has_chain:
             pages.append(
-                ContentPage(
+                LazyContentPage(
                     title="Supply Chain",
                     slug="supply-chain",
-                    body_md=_read_md(proj_dir / "chain" / "supply-chain.agreed.md"),
+                    loader=_tree_body(tree, "chain/supply-chain.agreed.md"),
                 )
             )
         if has_needs:
             pages.append(
-                ContentPage(
+                LazyContentPage(
                     title="User Needs",
                     slug="needs",
-                    body_md=_read_md(proj_dir / "needs" / "needs.agreed.md"),
+                    loader=_tree_body(tree, "needs/needs.agreed.md"),
                 )
             )
         if has_brief:
             pages.append(
-                ContentPage(
+                LazyContentPage(
                     title="Project Brief",
                     slug="brief",
-                    body_md=_read_md(proj_dir / "brief.agreed.md"),
+                    loader=_tree_body(tree, "brief.agreed.md"),
                 )
             )
         if has_decisions:
             pages.append(
-                ContentPage(
+                LazyContentPage(
                     title="Decisions",
                     slug="decisions",
-                    body_md=_read_md(proj_dir / "decisions.md"),
+                    loader=_tree_body(tree, "decisions.md"),
                 )
             )
 
@@ -432,44 +558,45 @@ class WardleyProjectPresenter:
             pages=pages,
         )
 
-    def _build_strategy_page(self, strategy_dir: Path) -> ContentPage:
+    def _build_strategy_page(self, tree: ProjectTree) -> ContentPage:
         figures: list[Figure] = []
-        svg_path = strategy_dir / "map.svg"
-        if svg_path.is_file():
+        if tree.is_file("strategy/map.svg"):
             figures.append(
-                Figure(caption="Strategy map", svg_content=_read_svg(svg_path))
+                Figure(
+                    caption="Strategy map",
+                    svg_content=tree.read_svg("strategy/map.svg"),
+                )
             )
 
-        body_parts: list[str] = []
-        plays_dir = strategy_dir / "plays"
-        if plays_dir.is_dir():
-            for f in sorted(plays_dir.glob("*.md")):
-                body_parts.append(f.read_text())
-
-        return ContentPage(
+        return LazyContentPage(
             title="Strategy",
             slug="strategy",
-            body_md="\n\n---\n\n".join(body_parts),
+            loader=_tree_body(
+                tree,
+                *(f"strategy/plays/{n}" for n in tree.files("strategy/plays", ".md")),
+            ),
             figures=figures,
         )
 
-    def _build_evolve_page(self, evolve_dir: Path) -> ContentPage:
+    def _build_evolve_page(self, tree: ProjectTree) -> ContentPage:
         figures: list[Figure] = []
-        svg_path = evolve_dir / "map.svg"
-        if svg_path.is_file():
+        if tree.is_file("evolve/map.svg"):
             figures.append(
-                Figure(caption="Evolution map", svg_content=_read_svg(svg_path))
+                Figure(
+                    caption="Evolution map",
+                    svg_content=tree.read_svg("evolve/map.svg"),
+                )
             )
 
-        body_parts: list[str] = []
-        assessments_dir = evolve_dir / "assessments"
-        if assessments_dir.is_dir():
-            for f in sorted(assessments_dir.glob("*.md")):
-                body_parts.append(f.read_text())
-
-        return ContentPage(
+        return LazyContentPage(
             title="Evolution Map",
             slug="map",
-            body_md="\n\n---\n\n".join(body_parts),
+            loader=_tree_body(
+                tree,
+                *(
+                    f"evolve/assessments/{n}"
+                    for n in tree.files("evolve/assessments", ".md")
+                ),
+            ),
             figures=figures,
         )
@@ -0,0 +1,353 @@
+"""OWM to SVG rendering support.
+
+Rendering shells out to Node via ``ensure-owm.sh``, which is by far
+the most expensive part of presenting a Wardley project. This module
+keeps that cost proportional to what actually changed, and spreads
+the remaining renders over a bounded worker pool.
+
+Batch protocol
+--------------
+A batch renderer is a long-lived process that renders many files
+without paying interpreter start-up for each. It speaks a line-framed
+protocol over stdin/stdout:
+
+- on start-up it writes ``ready``;
+- for each request it reads one absolute ``.owm`` path and writes the
+  SVG next to it (see ``svg_path_for``);
+- it replies ``ok`` or ``error <message>`` on a single line;
+- it exits when stdin is closed.
+
+A renderer that stops replying within ``reply_timeout`` is killed;
+the file it was rendering and every file after it are handed back to
+the caller to render some other way.
+
+Nothing here depends on Wardley types: any presenter that turns
+source files into SVGs can use ``RenderPool`` with its own renderer.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import queue
+import subprocess
+import threading
+import time
+import weakref
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from pydantic import BaseModel
+
+
+def svg_path_for(owm: Path) -> Path:
+    """Path of the SVG that ensure-owm.sh writes for an OWM file.
+
+    Agreed maps drop the ``.agreed`` marker: ``map.agreed.owm`` renders
+    to ``map.svg``.
+    """
+    name = owm.name.removesuffix(".owm").removesuffix(".agreed")
+    return owm.with_name(f"{name}.svg")
+
+
+def file_digest(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file, or empty string if missing."""
+    if not path.is_file():
+        return ""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+class OwmRenderCache:
+    """Content-addressed store of rendered SVGs.
+
+    Entries are keyed on the OWM source bytes, the renderer version and
+    the render style. A map is rendered once per distinct input no
+    matter how often a checkout resets file modification times.
+    Safe to share between threads presenting different projects.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        renderer_version: str = "",
+        style: str = "",
+    ) -> None:
+        self._dir = cache_dir
+        self._renderer_version = renderer_version
+        self._style = style
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def key(self, source: bytes) -> str:
+        """Cache key for an OWM source under this renderer and style."""
+        digest = hashlib.sha256()
+        digest.update(self._renderer_version.encode())
+        digest.update(b"\0")
+        digest.update(self._style.encode())
+        digest.update(b"\0")
+        digest.update(source)
+        return digest.hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self._dir / key[:2] / f"{key}.svg"
+
+    def restore(self, key: str, svg: Path) -> bool:
+        """Materialise the cached SVG for *key* at *svg*.
+
+        Returns False (and counts a miss) when nothing is cached. An
+        SVG that already matches the cache is left untouched so its
+        mtime does not churn.
+        """
+        entry = self._entry(key)
+        if not entry.is_file():
+            with self._lock:
+                self.misses += 1
+            return False
+        with self._lock:
+            self.hits += 1
+        content = entry.read_bytes()
+        if svg.is_file() and svg.read_bytes() == content:
+            return True
+        svg.write_bytes(content)
+        return True
+
+    def store(self, key: str, svg: Path) -> None:
+        """Record a freshly rendered SVG under *key*."""
+        entry = self._entry(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        tmp = entry.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(svg.read_bytes())
+        tmp.replace(entry)
+
+
+# ---------------------------------------------------------------------------
+# Render pool
+# ---------------------------------------------------------------------------
+
+
+class RenderError(Exception):
+    """A single source file failed to render."""
+
+
+class RenderOutcome(BaseModel):
+    """Timing and result for one rendered source file."""
+
+    source: Path
+    seconds: float
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return not self.error
+
+
+class RenderReport(BaseModel):
+    """Per-file outcomes of a render run, in submission order."""
+
+    outcomes: list[RenderOutcome] = []
+
+    @property
+    def failures(self) -> list[RenderOutcome]:
+        return [o for o in self.outcomes if not o.ok]
+
+    @property
+    def seconds(self) -> float:
+        return sum(o.seconds for o in self.outcomes)
+
+
+Renderer = Callable[[Path], None]
+
+
+class ScriptRenderer:
+    """Render one file by invoking a script with its path.
+
+    Raises RenderError carrying the script's stderr when it exits
+    non-zero, so failures are reported rather than swallowed.
+    """
+
+    def __init__(self, script: Path) -> None:
+        self._script = script
+
+    def __call__(self, source: Path) -> None:
+        result = subprocess.run(
+            [str(self._script), str(source)],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            detail = result.stderr.strip() or result.stdout.strip()
+            raise RenderError(f"exit {result.returncode}: {detail}")
+
+
+class RenderPool:
+    """Dispatch renders to a bounded pool of worker threads.
+
+    Workers spend their time waiting on subprocesses, so threads give
+    real parallelism. ``max_workers`` defaults to the CPU count and
+    bounds renders across every ``run`` in progress, so projects
+    presented concurrently through one pool share its workers rather
+    than each starting as many renderers as there are CPUs.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._slots = threading.BoundedSemaphore(self._max_workers)
+
+    def run(self, sources: Sequence[Path], render: Renderer) -> RenderReport:
+        if not sources:
+            return RenderReport()
+        workers = min(self._max_workers, len(sources))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(lambda s: self._render(render, s), sources))
+        return RenderReport(outcomes=outcomes)
+
+    def _render(self, render: Renderer, source: Path) -> RenderOutcome:
+        with self._slots:
+            return _timed(render, source)
+
+
+def _timed(render: Renderer, source: Path) -> RenderOutcome:
+    start = time.perf_counter()
+    error = ""
+    try:
+        render(source)
+    except (RenderError, OSError) as exc:
+        error = str(exc) or type(exc).__name__
+    return _outcome(source, start, error)
+
+
+def _outcome(source: Path, start: float, error: str = "") -> RenderOutcome:
+    return RenderOutcome(
+        source=source, seconds=time.perf_counter() - start, error=error
+    )
+
+
+class BatchRendererDied(RenderError):
+    """The batch process exited or stopped replying mid-stream."""
+
+
+class BatchRenderer:
+    """Stream renders through one long-lived renderer process.
+
+    Speaks the batch protocol described in the module docstring.
+    The process renders one file at a time, so ``run`` feeds it a list
+    in order rather than fanning out over a RenderPool. Replies are
+    read on a background thread, which keeps the timeouts portable
+    (``select`` on a pipe is POSIX-only).
+    """
+
+    def __init__(self, process: subprocess.Popen, reply_timeout: float = 60.0) -> None:
+        self._proc = process
+        self._reply_timeout = reply_timeout
+        self._lock = threading.Lock()
+        self._replies: queue.Queue[str | None] = queue.Queue()
+        threading.Thread(
+            target=_read_replies, args=(process, self._replies), daemon=True
+        ).start()
+        weakref.finalize(self, _terminate, process)
+
+    @classmethod
+    def start(
+        cls,
+        command: Sequence[str],
+        timeout: float = 10.0,
+        reply_timeout: float = 60.0,
+    ) -> BatchRenderer | None:
+        """Launch the renderer, or return None if batch mode is unavailable."""
+        try:
+            proc = subprocess.Popen(
+                list(command),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+            )
+        except OSError:
+            return None
+        batch = cls(proc, reply_timeout)
+        try:
+            ready = batch._reply(timeout)
+        except BatchRendererDied:
+            return None
+        if ready != "ready":
+            _terminate(proc)
+            return None
+        return batch
+
+    def __call__(self, source: Path) -> None:
+        with self._lock:
+            try:
+                self._proc.stdin.write(f"{source.resolve()}\n")
+                self._proc.stdin.flush()
+            except (OSError, ValueError) as exc:
+                _terminate(self._proc)
+                raise BatchRendererDied(f"batch renderer unavailable: {exc}") from exc
+            reply = self._reply(self._reply_timeout)
+        if reply == "ok":
+            return
+        if not reply:
+            _terminate(self._proc)
+            raise BatchRendererDied("batch renderer exited")
+        raise RenderError(reply.removeprefix("error").strip())
+
+    def run(self, sources: Sequence[Path]) -> tuple[list[RenderOutcome], list[Path]]:
+        """Render *sources* in order until done or the process dies.
+
+        Returns the outcomes so far and the sources left unrendered:
+        the one the process died on and every one after it.
+        """
+        outcomes: list[RenderOutcome] = []
+        for i, source in enumerate(sources):
+            start = time.perf_counter()
+            try:
+                self(source)
+            except BatchRendererDied:
+                return outcomes, list(sources[i:])
+            except RenderError as exc:
+                outcomes.append(_outcome(source, start, str(exc)))
+            else:
+                outcomes.append(_outcome(source, start))
+        return outcomes, []
+
+    def _reply(self, timeout: float) -> str:
+        try:
+            line = self._replies.get(timeout=timeout)
+        except queue.Empty:
+            # A hung renderer will not notice stdin closing either
+            self._proc.kill()
+            self._proc.wait()
+            raise BatchRendererDied(
+                f"batch renderer did not reply within {timeout:g}s"
+            ) from None
+        return "" if line is None else line.strip()
+
+    @property
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+
+    def close(self) -> None:
+        """Ask the renderer to exit, killing it if it does not."""
+        _terminate(self._proc)
+
+
+def _read_replies(proc: subprocess.Popen, replies: queue.Queue[str | None]) -> None:
+    try:
+        for line in proc.stdout:
+            replies.put(line)
+    except (OSError, ValueError):
+        pass
+    replies.put(None)
+
+
+def _terminate(proc: subprocess.Popen) -> None:
+    if proc.poll() is not None:
+        return
+    try:
+        proc.stdin.close()
+        proc.wait(timeout=5)
+    except (OSError, subprocess.TimeoutExpired):
+        proc.kill()
+        proc.wait()
@@ -39,17 +39,20 @@ if [[ -z "$CLIENT" || -z "$ENGAGEMENT" || -z "$PROJECT" ]]; then
   exit 1
 fi
 
-CLI="uv run --project $REPO_DIR practice"
-
-CMD=($CLI decision record \
-  --client "$CLIENT" --engagement "$ENGAGEMENT" --project "$PROJECT" \
-  --title "Stage 5: Strategy map agreed" \
+# Both commands run in one practice process. Each is written as its
+# argument count followed by its arguments, all NUL-terminated, so
+# field values need no quoting and may even be empty.
+record=(decision record
+  --client "$CLIENT" --engagement "$ENGAGEMENT" --project "$PROJECT"
+  --title "Stage 5: Strategy map agreed"
   --field "Agreed=Strategy-annotated Wardley Map signed off")
 for f in "${FIELDS[@]}"; do
-  CMD+=(--field "$f")
+  record+=(--field "$f")
 done
-"${CMD[@]}"
 
 # Terminal interactive gate — transition to implementation
-$CLI project update-status \
-  --client "$CLIENT" --engagement "$ENGAGEMENT" --project "$PROJECT" --status implementation
+advance=(project update-status
+  --client "$CLIENT" --engagement "$ENGAGEMENT" --project "$PROJECT" --status implementation)
+
+printf '%s\0' "${#record[@]}" "${record[@]}" "${#advance[@]}" "${advance[@]}" \
+  | uv run --project "$REPO_DIR" practice run-batch -0
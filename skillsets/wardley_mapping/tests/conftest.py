@@ -9,7 +9,11 @@ import pytest
 
 from bin.cli.config import Config
 from practice.entities import Project, ProjectStatus
-from wardley_mapping.infrastructure import JsonTourManifestRepository
+from wardley_mapping.infrastructure import (
+    CatalogTourManifestRepository,
+    JsonTourManifestRepository,
+    SqliteTourManifestRepository,
+)
 from wardley_mapping.types import TourManifest, TourStop
 
 _REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent.parent.parent.parent
@@ -34,10 +38,14 @@ def tmp_config(tmp_path):
     )
 
 
-@pytest.fixture(params=["json"])
+@pytest.fixture(params=["json", "catalog", "sqlite"])
 def tour_repo(request, tmp_config):
     if request.param == "json":
         return JsonTourManifestRepository(tmp_config.workspace_root)
+    if request.param == "catalog":
+        return CatalogTourManifestRepository(tmp_config.workspace_root)
+    if request.param == "sqlite":
+        return SqliteTourManifestRepository(tmp_config.workspace_root / "tours.sqlite3")
 
 
 # ---------------------------------------------------------------------------
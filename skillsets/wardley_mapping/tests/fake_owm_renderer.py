@@ -0,0 +1,40 @@
+"""Fake batch OWM renderer speaking the protocol in wardley_mapping.rendering.
+
+Writes a fixed SVG for every requested file. Sources whose text
+contains ``FAIL`` get an error reply; ``CRASH`` makes the process exit
+mid-stream and ``HANG`` makes it stop replying. Every request path is
+appended to the log file given as the first argument, if any.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+SVG = '<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"/>'
+
+
+def main() -> None:
+    log = Path(sys.argv[1]) if len(sys.argv) > 1 else None
+    print("ready", flush=True)
+    for line in sys.stdin:
+        owm = Path(line.strip())
+        if log is not None:
+            with log.open("a") as f:
+                f.write(f"{owm}\n")
+        text = owm.read_text()
+        if "CRASH" in text:
+            sys.exit(1)
+        if "HANG" in text:
+            time.sleep(60)
+        if "FAIL" in text:
+            print("error unknown component on line 1", flush=True)
+            continue
+        name = owm.name.removesuffix(".owm").removesuffix(".agreed")
+        owm.with_name(f"{name}.svg").write_text(SVG)
+        print("ok", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Map analytics tests.
+
+Bitset transitive closure and the atlas metrics derived from it.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from wardley_mapping.analytics import analyse_map, transitive_closure
+from wardley_mapping.owm import parse_owm
+
+# Two anchors, two needs sharing a platform and its hosting
+MAP = """
+title Freight
+anchor Shipper [0.95, 0.40]
+anchor Driver [0.94, 0.70]
+component Tracking [0.85, 0.50]
+component Dispatch [0.83, 0.60]
+component Platform [0.60, 0.45]
+component Routing [0.55, 0.30]
+component Hosting [0.20, 0.90]
+component GPS [0.47, 0.85]
+Shipper->Tracking
+Driver->Dispatch
+Driver->Tracking
+Tracking->Platform
+Tracking->GPS
+Dispatch->Platform
+Dispatch->Routing
+Platform->Hosting
+Routing->Hosting
+"""
+
+
+@pytest.fixture
+def analytics():
+    return analyse_map(parse_owm(MAP), source_hash="abc")
+
+
+def _metrics(analytics, name):
+    return next(c for c in analytics.components if c.name == name)
+
+
+class TestTransitiveClosure:
+    def test_chain(self):
+        reach = transitive_closure([[1], [2], []])
+        assert reach == [0b110, 0b100, 0]
+
+    def test_diamond(self):
+        reach = transitive_closure([[1, 2], [3], [3], []])
+        assert reach[0] == 0b1110
+
+    def test_cycle_converges(self):
+        reach = transitive_closure([[1], [2], [0]])
+        assert reach == [0b111, 0b111, 0b111]
+
+    def test_deep_chain_no_recursion_limit(self):
+        n = 5000
+        reach = transitive_closure([[i + 1] for i in range(n - 1)] + [[]])
+        assert reach[0].bit_count() == n - 1
+
+
+class TestFanInFanOut:
+    def test_direct_and_transitive(self, analytics):
+        hosting = _metrics(analytics, "Hosting")
+        assert hosting.fan_in == 2
+        assert hosting.transitive_fan_in == 6  # everything but GPS
+        assert hosting.fan_out == 0
+
+    def test_ranked_by_transitive_fan_in(self, analytics):
+        assert analytics.components[0].name == "Hosting"
+
+    def test_depth(self, analytics):
+        assert _metrics(analytics, "Shipper").depth == 3
+        assert _metrics(analytics, "Hosting").depth == 0
+
+
+class TestAnchorsAndNeeds:
+    def test_anchor_reach(self, analytics):
+        assert set(analytics.anchor_reach["Shipper"]) == {
+            "Tracking",
+            "Platform",
+            "GPS",
+            "Hosting",
+        }
+
+    def test_needs_are_anchor_dependencies(self, analytics):
+        assert [t.need for t in analytics.need_traces] == ["Tracking", "Dispatch"]
+
+    def test_need_trace(self, analytics):
+        dispatch = next(t for t in analytics.need_traces if t.need == "Dispatch")
+        assert dispatch.anchors == ["Driver"]
+        assert set(dispatch.components) == {"Platform", "Routing", "Hosting"}
+        assert dispatch.depth == 2
+        assert dispatch.width == 2
+        assert dispatch.shared_with == ["Tracking"]
+
+    def test_shared_components(self, analytics):
+        shared = {s.name: s for s in analytics.shared_components}
+        assert set(shared) == {"Platform", "Hosting"}
+        assert shared["Platform"].needs == ["Tracking", "Dispatch"]
+        assert shared["Platform"].anchors == ["Shipper", "Driver"]
+
+
+class TestLayers:
+    def test_partition(self, analytics):
+        layers = {layer.name: layer for layer in analytics.layers}
+        assert set(layers["user-visible"].components) == {
+            "Shipper",
+            "Driver",
+            "Tracking",
+            "Dispatch",
+        }
+        assert set(layers["capabilities"].components) == {
+            "Platform",
+            "Routing",
+            "GPS",
+        }
+        assert layers["infrastructure"].components == ["Hosting"]
+
+    def test_maturity_range(self, analytics):
+        infra = next(la for la in analytics.layers if la.name == "infrastructure")
+        assert (infra.maturity_min, infra.maturity_max) == (0.90, 0.90)
+
+    def test_near_boundary(self, analytics):
+        caps = next(la for la in analytics.layers if la.name == "capabilities")
+        assert caps.near_boundary == ["GPS"]
+
+    def test_cross_layer_edges(self, analytics):
+        assert analytics.cross_layer_edges == {
+            "user-visible->capabilities": 4,
+            "capabilities->infrastructure": 2,
+        }
+
+
+class TestWarnings:
+    def test_unresolved_links_surface(self):
+        result = analyse_map(parse_owm("component A [0.5, 0.5]\nA->Ghost"))
+        assert result.warnings == ["unresolved line 2: A->Ghost"]
+
+    def test_json_round_trip(self, analytics):
+        restored = type(analytics).model_validate_json(analytics.model_dump_json())
+        assert restored == analytics
@@ -0,0 +1,40 @@
+"""SVG asset store tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from wardley_mapping.assets import SvgAssetStore
+
+SVG = "<svg xmlns='http://www.w3.org/2000/svg'><rect/></svg>"
+
+
+def _svg(tmp_path: Path, name: str, text: str = SVG) -> Path:
+    path = tmp_path / name
+    path.write_text(text)
+    return path
+
+
+class TestSvgAssetStore:
+    def test_each_file_read_once(self, tmp_path):
+        store = SvgAssetStore()
+        svg = _svg(tmp_path, "map.svg")
+        first = store.load(svg)
+        assert store.load(svg) is first
+        assert store.reads == 1
+
+    def test_identical_files_share_one_asset(self, tmp_path):
+        store = SvgAssetStore()
+        a = store.load(_svg(tmp_path, "a.svg"))
+        b = store.load(_svg(tmp_path, "b.svg"))
+        assert a is b
+        assert len(store) == 1
+        assert store.size == len(SVG)
+
+    def test_distinct_contents_kept_apart(self, tmp_path):
+        store = SvgAssetStore()
+        a = _svg(tmp_path, "a.svg")
+        b = _svg(tmp_path, "b.svg", SVG.replace("rect", "circle"))
+        assert store.load(a) != store.load(b)
+        assert store.digest(a) != store.digest(b)
+        assert len(store) == 2
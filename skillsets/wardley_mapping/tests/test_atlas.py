@@ -0,0 +1,222 @@
+"""Atlas build index tests.
+
+View expansion, content-hash staleness with reasons, the mtime
+fallback for views built before the index, and hash caching.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from wardley_mapping.atlas import ATLAS_VIEWS, INDEX_PATH, AtlasBuildIndex, slugify
+
+MAP = """\
+anchor Shipper [0.95, 0.4]
+anchor Driver [0.94, 0.7]
+component Track Parcels [0.85, 0.5]
+component Dispatch [0.8, 0.6]
+component Hosting [0.2, 0.9]
+Shipper->Track Parcels
+Driver->Dispatch
+Track Parcels->Hosting
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    project = tmp_path / "acme" / "engagements" / "strat-1" / "maps-1"
+    files = {
+        "brief.agreed.md": "brief",
+        "strategy/map.agreed.owm": MAP,
+        "chain/supply-chain.agreed.md": "chain",
+        "strategy/plays/open-platform.md": "play",
+    }
+    for rel, text in files.items():
+        path = project / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    return project
+
+
+def _index(project):
+    """The index of a project in ``{client}/engagements/{engagement}/``."""
+    return AtlasBuildIndex(project, project.parents[2])
+
+
+def _build(project, view_name):
+    """Write a view's outputs the way its skill would, then record it."""
+    index = _index(project)
+    view = index.view(view_name)
+    for rel in view.outputs:
+        out = project / rel
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text("generated")
+    return index.record(view)
+
+
+def _status(project, view_name):
+    index = _index(project)
+    return index.status(index.view(view_name))
+
+
+class TestViews:
+    def test_seventeen_atlas_skills_declared(self):
+        assert len({v.skill for v in ATLAS_VIEWS}) == 17
+
+    def test_declared_skills_exist(self):
+        skills = os.path.join(os.path.dirname(__file__), "..", "skills")
+        for view in ATLAS_VIEWS:
+            assert os.path.isfile(os.path.join(skills, view.skill, "SKILL.md"))
+
+    def test_per_instance_views_expanded(self, project):
+        names = [v.name for v in _index(project).views()]
+        assert "anchor-shipper" in names
+        assert "anchor-driver" in names
+        assert "need-track-parcels" in names
+        assert "need-dispatch" in names
+        assert "play-open-platform" in names
+        assert not any("{slug}" in n for n in names)
+
+    def test_map_parsed_once_per_index(self, project, monkeypatch):
+        from wardley_mapping import atlas
+
+        parses = []
+        original = atlas.load_owm
+        monkeypatch.setattr(
+            atlas, "load_owm", lambda path: parses.append(path) or original(path)
+        )
+        index = _index(project)
+        index.views()
+        index.view("anchor-shipper")
+        index.status_all()
+        assert len(parses) == 1
+
+        (project / "strategy/map.agreed.owm").write_text(
+            MAP + "anchor Carrier [0.96, 0.6]\n"
+        )
+        assert index.view("anchor-carrier") is not None
+        assert len(parses) == 2
+
+    def test_new_play_expands(self, project):
+        index = _index(project)
+        assert index.view("play-lock-in") is None
+        (project / "strategy/plays/lock-in.md").write_text("play")
+        assert index.view("play-lock-in") is not None
+
+    def test_play_view_depends_on_its_play(self, project):
+        view = _index(project).view("play-open-platform")
+        assert "strategy/plays/open-platform.md" in view.sources
+
+    def test_slugify(self):
+        assert slugify("Track Parcels (v2)") == "track-parcels-v2"
+
+
+class TestStatus:
+    def test_missing_outputs_stale(self, project):
+        status = _status(project, "overview")
+        assert status.state == "stale"
+        assert "missing output atlas/overview/map.owm" in status.reasons
+
+    def test_missing_source_blocked(self, project):
+        status = _status(project, "doctrine")
+        assert status.state == "blocked"
+        assert status.reasons == ["missing source decisions.md"]
+
+    def test_recorded_view_fresh(self, project):
+        status = _build(project, "overview")
+        assert status.state == "fresh"
+        assert status.indexed
+
+    def test_changed_source_reported(self, project):
+        _build(project, "overview")
+        (project / "brief.agreed.md").write_text("revised brief")
+        status = _status(project, "overview")
+        assert status.state == "stale"
+        assert status.reasons == ["changed source brief.agreed.md"]
+
+    def test_touch_without_change_stays_fresh(self, project):
+        _build(project, "overview")
+        os.utime(project / "brief.agreed.md", (1e10, 1e10))
+        assert _status(project, "overview").state == "fresh"
+
+    def test_glob_source_added_and_removed(self, project):
+        _build(project, "bottlenecks")
+        added = project / "evolve" / "assessments" / "hosting.md"
+        added.parent.mkdir(parents=True)
+        added.write_text("assessment")
+        assert _status(project, "bottlenecks").reasons == [
+            "new source evolve/assessments/hosting.md"
+        ]
+        _build(project, "bottlenecks")
+        added.unlink()
+        assert _status(project, "bottlenecks").reasons == [
+            "removed source evolve/assessments/hosting.md"
+        ]
+
+    def test_client_research_resolved_against_client(self, project):
+        status = _status(project, "pipelines")
+        assert status.state == "blocked"
+        assert status.reasons == ["missing source client:resources/index.md"]
+
+        (project / "resources").mkdir()
+        (project / "resources" / "index.md").write_text("not here")
+        assert _status(project, "pipelines").state == "blocked"
+
+        research = project.parents[2] / "resources" / "index.md"
+        research.parent.mkdir()
+        research.write_text("research")
+        assert _status(project, "pipelines").state == "stale"
+        assert _build(project, "pipelines").state == "fresh"
+
+        research.write_text("revised research")
+        assert _status(project, "pipelines").reasons == [
+            "changed source client:resources/index.md"
+        ]
+
+    def test_unrelated_view_unaffected(self, project):
+        _build(project, "teams")
+        (project / "brief.agreed.md").write_text("revised brief")
+        assert _status(project, "teams").state == "fresh"
+
+
+class TestUnindexedFallback:
+    def test_outputs_newer_than_sources_fresh(self, project):
+        for rel in ("atlas/teams/map.owm", "atlas/teams/analysis.md"):
+            (project / rel).parent.mkdir(parents=True, exist_ok=True)
+            (project / rel).write_text("legacy")
+        os.utime(project / "strategy/map.agreed.owm", (1, 1))
+        status = _status(project, "teams")
+        assert status.state == "fresh"
+        assert not status.indexed
+
+    def test_source_newer_than_outputs_stale(self, project):
+        for rel in ("atlas/teams/map.owm", "atlas/teams/analysis.md"):
+            (project / rel).parent.mkdir(parents=True, exist_ok=True)
+            (project / rel).write_text("legacy")
+            os.utime(project / rel, (1, 1))
+        status = _status(project, "teams")
+        assert status.reasons == ["source newer than outputs strategy/map.agreed.owm"]
+
+
+class TestHashCache:
+    def test_record_persists_index(self, project):
+        _build(project, "teams")
+        data = json.loads((project / INDEX_PATH).read_text())
+        assert list(data["views"]["teams"]) == ["strategy/map.agreed.owm"]
+
+    def test_unchanged_files_not_reread(self, project, monkeypatch):
+        _build(project, "teams")
+        index = _index(project)
+        reads = []
+        original = type(project).read_bytes
+
+        def counting(self):
+            reads.append(self.name)
+            return original(self)
+
+        monkeypatch.setattr(type(project), "read_bytes", counting)
+        index.status(index.view("teams"))
+        assert "map.agreed.owm" not in reads
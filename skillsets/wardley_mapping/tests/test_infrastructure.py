@@ -1,15 +1,28 @@
 """Wardley Mapping JSON infrastructure tests.
 
 Path conventions, format, and resilience for tour manifests.
+Atomic, locked and change-only writes for JSON tour manifests.
+Catalog maintenance for the catalog-backed tour repository.
+Cross-project queries and import for the SQLite tour repository.
+Sidecar caching for map analytics.
 """
 
 from __future__ import annotations
 
 import json
+import os
+import threading
+from pathlib import Path
 
-from wardley_mapping.infrastructure import JsonTourManifestRepository
+from wardley_mapping.infrastructure import (
+    CatalogTourManifestRepository,
+    FileAtlasIndex,
+    FileMapAnalytics,
+    JsonTourManifestRepository,
+    SqliteTourManifestRepository,
+)
 
-from .conftest import make_tour
+from .conftest import make_tour, make_tour_stop
 
 ENGAGEMENT = "strat-1"
 
@@ -67,3 +80,356 @@ class TestMissingFileResilience:
             / "manifest.json"
         )
         assert path.exists()
+
+
+class TestTourCatalog:
+    def _pres_dir(self, tmp_config):
+        return (
+            tmp_config.workspace_root
+            / "holloway-group"
+            / "engagements"
+            / ENGAGEMENT
+            / "maps-1"
+            / "presentations"
+        )
+
+    def _count_manifest_reads(self, monkeypatch):
+        reads = []
+        original = Path.read_bytes
+
+        def counting(self):
+            if self.name == "manifest.json":
+                reads.append(self.parent.name)
+            return original(self)
+
+        monkeypatch.setattr(Path, "read_bytes", counting)
+        return reads
+
+    def test_save_writes_catalog(self, tmp_config):
+        repo = CatalogTourManifestRepository(tmp_config.workspace_root)
+        repo.save(make_tour(name="investor", title="Investor Tour"))
+        data = json.loads((self._pres_dir(tmp_config) / "catalog.json").read_text())
+        assert data["tours"]["investor"]["title"] == "Investor Tour"
+        assert data["tours"]["investor"]["stop_count"] == 1
+
+    def test_summaries_read_only_catalog(self, tmp_config, monkeypatch):
+        CatalogTourManifestRepository(tmp_config.workspace_root).save(make_tour())
+        reads = self._count_manifest_reads(monkeypatch)
+        repo = CatalogTourManifestRepository(tmp_config.workspace_root)
+        summaries = repo.summaries("holloway-group", ENGAGEMENT, "maps-1")
+        assert [s.name for s in summaries] == ["investor"]
+        assert reads == []
+
+    def test_unchanged_manifests_not_reloaded(self, tmp_config, monkeypatch):
+        repo = CatalogTourManifestRepository(tmp_config.workspace_root)
+        repo.save(make_tour(name="investor"))
+        repo.save(make_tour(name="technical"))
+        reads = self._count_manifest_reads(monkeypatch)
+        for _ in range(3):
+            assert len(repo.list_all("holloway-group", ENGAGEMENT, "maps-1")) == 2
+        assert reads == []
+
+    def test_edited_manifest_reloaded(self, tmp_config):
+        repo = CatalogTourManifestRepository(tmp_config.workspace_root)
+        repo.save(make_tour(title="Investor Tour"))
+        repo.list_all("holloway-group", ENGAGEMENT, "maps-1")
+        JsonTourManifestRepository(tmp_config.workspace_root).save(
+            make_tour(title="Revised Tour")
+        )
+        tours = repo.list_all("holloway-group", ENGAGEMENT, "maps-1")
+        assert tours[0].title == "Revised Tour"
+        summaries = repo.summaries("holloway-group", ENGAGEMENT, "maps-1")
+        assert summaries[0].title == "Revised Tour"
+
+    def test_manifest_edited_behind_remembered_catalog(self, tmp_config):
+        repo = CatalogTourManifestRepository(tmp_config.workspace_root)
+        repo.save(make_tour(title="Investor Tour"))
+        repo.summaries("holloway-group", ENGAGEMENT, "maps-1")
+        JsonTourManifestRepository(tmp_config.workspace_root).save(
+            make_tour(title="Revised Tour")
+        )
+        summaries = repo.summaries("holloway-group", ENGAGEMENT, "maps-1")
+        assert summaries[0].title == "Revised Tour"
+        data = json.loads((self._pres_dir(tmp_config) / "catalog.json").read_text())
+        assert data["tours"]["investor"]["title"] == "Revised Tour"
+
+    def test_manifest_removed_behind_remembered_catalog(self, tmp_config):
+        repo = CatalogTourManifestRepository(tmp_config.workspace_root)
+        repo.save(make_tour())
+        repo.summaries("holloway-group", ENGAGEMENT, "maps-1")
+        _manifest_path(tmp_config).unlink()
+        assert repo.summaries("holloway-group", ENGAGEMENT, "maps-1") == []
+
+    def test_tour_added_behind_catalog(self, tmp_config):
+        repo = CatalogTourManifestRepository(tmp_config.workspace_root)
+        repo.save(make_tour(name="investor"))
+        JsonTourManifestRepository(tmp_config.workspace_root).save(
+            make_tour(name="technical")
+        )
+        names = {t.name for t in repo.list_all("holloway-group", ENGAGEMENT, "maps-1")}
+        assert names == {"investor", "technical"}
+
+    def test_unchanged_catalog_not_rescanned(self, tmp_config, monkeypatch):
+        repo = CatalogTourManifestRepository(tmp_config.workspace_root)
+        repo.save(make_tour())
+        scans = []
+        original = os.scandir
+
+        def counting(path):
+            scans.append(path)
+            return original(path)
+
+        monkeypatch.setattr(os, "scandir", counting)
+        for _ in range(3):
+            repo.summaries("holloway-group", ENGAGEMENT, "maps-1")
+        assert scans == []
+
+    def test_tour_dir_without_manifest_ignored(self, tmp_config, monkeypatch):
+        repo = CatalogTourManifestRepository(tmp_config.workspace_root)
+        repo.save(make_tour())
+        (self._pres_dir(tmp_config) / "draft").mkdir()
+        repo.summaries("holloway-group", ENGAGEMENT, "maps-1")
+        reads = self._count_manifest_reads(monkeypatch)
+        summaries = repo.summaries("holloway-group", ENGAGEMENT, "maps-1")
+        assert [s.name for s in summaries] == ["investor"]
+        assert reads == []
+
+
+def _manifest_path(tmp_config, name: str = "investor") -> Path:
+    return (
+        tmp_config.workspace_root
+        / "holloway-group"
+        / "engagements"
+        / ENGAGEMENT
+        / "maps-1"
+        / "presentations"
+        / name
+        / "manifest.json"
+    )
+
+
+class TestSafeJsonWrites:
+    def test_identical_save_leaves_file_alone(self, tmp_config):
+        repo = JsonTourManifestRepository(tmp_config.workspace_root)
+        repo.save(make_tour())
+        path = _manifest_path(tmp_config)
+        os.utime(path, ns=(1, 1))
+        repo.save(make_tour())
+        assert path.stat().st_mtime_ns == 1
+
+    def test_changed_save_rewrites(self, tmp_config):
+        repo = JsonTourManifestRepository(tmp_config.workspace_root)
+        repo.save(make_tour())
+        path = _manifest_path(tmp_config)
+        os.utime(path, ns=(1, 1))
+        repo.save(make_tour(title="Revised"))
+        assert path.stat().st_mtime_ns != 1
+        assert json.loads(path.read_text())["title"] == "Revised"
+
+    def test_always_rewrite_when_not_skipping(self, tmp_config):
+        repo = JsonTourManifestRepository(
+            tmp_config.workspace_root, skip_unchanged=False
+        )
+        repo.save(make_tour())
+        path = _manifest_path(tmp_config)
+        os.utime(path, ns=(1, 1))
+        repo.save(make_tour())
+        assert path.stat().st_mtime_ns != 1
+
+    def test_fsync_flushes_file_and_directory(self, tmp_config, monkeypatch):
+        synced = []
+        real_fsync = os.fsync
+        monkeypatch.setattr(os, "fsync", lambda fd: synced.append(fd) or real_fsync(fd))
+        JsonTourManifestRepository(tmp_config.workspace_root, fsync=True).save(
+            make_tour()
+        )
+        assert len(synced) == 2
+
+    def test_no_temp_files_left(self, tmp_config):
+        repo = CatalogTourManifestRepository(tmp_config.workspace_root)
+        repo.save(make_tour())
+        repo.save(make_tour(title="Revised"))
+        pres_dir = _manifest_path(tmp_config).parent.parent
+        assert not list(pres_dir.rglob("*.tmp"))
+
+    def test_no_lock_files_left(self, tmp_config):
+        repo = CatalogTourManifestRepository(tmp_config.workspace_root)
+        repo.save(make_tour())
+        pres_dir = _manifest_path(tmp_config).parent.parent
+        assert sorted(p.name for p in pres_dir.rglob("*")) == [
+            "catalog.json",
+            "investor",
+            "manifest.json",
+        ]
+
+    def test_concurrent_saves_never_torn(self, tmp_config):
+        repo = JsonTourManifestRepository(tmp_config.workspace_root)
+        repo.save(make_tour())
+        errors = []
+
+        def writer(i):
+            for j in range(20):
+                repo.save(make_tour(title=f"Writer {i} pass {j}" + "x" * 2000))
+
+        def reader():
+            for _ in range(100):
+                # A torn file fails to decode or validate; both are ValueErrors
+                try:
+                    repo.get("holloway-group", ENGAGEMENT, "maps-1", "investor")
+                except (OSError, ValueError) as exc:
+                    errors.append(exc)
+
+        threads = [threading.Thread(target=writer, args=(i,)) for i in range(4)]
+        threads.append(threading.Thread(target=reader))
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert errors == []
+
+    def test_concurrent_agents_keep_every_catalog_entry(self, tmp_config):
+        names = [f"tour-{i}" for i in range(8)]
+
+        def agent(name):
+            CatalogTourManifestRepository(tmp_config.workspace_root).save(
+                make_tour(name=name)
+            )
+
+        threads = [threading.Thread(target=agent, args=(n,)) for n in names]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        pres_dir = _manifest_path(tmp_config).parent.parent
+        catalog = json.loads((pres_dir / "catalog.json").read_text())
+        assert sorted(catalog["tours"]) == names
+
+
+class TestSqliteTours:
+    def _repo(self, tmp_config):
+        return SqliteTourManifestRepository(tmp_config.workspace_root / "tours.sqlite3")
+
+    def test_find_by_atlas_source_across_projects(self, tmp_config):
+        repo = self._repo(tmp_config)
+        risk = make_tour_stop(order="2", title="Risk", atlas_source="atlas/risk/")
+        repo.save(make_tour(project_slug="maps-1", stops=[make_tour_stop(), risk]))
+        repo.save(make_tour(project_slug="maps-2", stops=[risk]))
+        repo.save(make_tour(project_slug="maps-3", stops=[make_tour_stop()]))
+        found = repo.find_by_atlas_source("atlas/risk")
+        assert [t.project_slug for t in found] == ["maps-1", "maps-2"]
+
+    def test_find_by_atlas_source_client_filter(self, tmp_config):
+        repo = self._repo(tmp_config)
+        repo.save(make_tour(client="holloway-group"))
+        repo.save(make_tour(client="acme-corp"))
+        found = repo.find_by_atlas_source("atlas/overview/", client="acme-corp")
+        assert [t.client for t in found] == ["acme-corp"]
+
+    def test_replace_drops_old_stops(self, tmp_config):
+        repo = self._repo(tmp_config)
+        repo.save(make_tour(stops=[make_tour_stop(atlas_source="atlas/risk/")]))
+        repo.save(make_tour(stops=[make_tour_stop()]))
+        assert repo.find_by_atlas_source("atlas/risk/") == []
+
+    def test_persists_across_instances(self, tmp_config):
+        self._repo(tmp_config).save(make_tour())
+        got = self._repo(tmp_config).get(
+            "holloway-group", ENGAGEMENT, "maps-1", "investor"
+        )
+        assert got == make_tour()
+
+    def test_import_workspace(self, tmp_config):
+        json_repo = JsonTourManifestRepository(tmp_config.workspace_root)
+        json_repo.save(make_tour(name="investor"))
+        json_repo.save(make_tour(name="technical", project_slug="maps-2"))
+        repo = self._repo(tmp_config)
+        assert repo.import_workspace(tmp_config.workspace_root) == 2
+        assert len(repo.list_all("holloway-group", ENGAGEMENT, "maps-2")) == 1
+
+
+class TestMapAnalyticsCache:
+    MAP = "anchor User [0.9, 0.5]\ncomponent Api [0.6, 0.5]\nUser->Api\n"
+
+    def _map(self, tmp_config, text=MAP):
+        owm = (
+            tmp_config.workspace_root
+            / "holloway-group"
+            / "engagements"
+            / ENGAGEMENT
+            / "maps-1"
+            / "strategy"
+            / "map.agreed.owm"
+        )
+        owm.parent.mkdir(parents=True, exist_ok=True)
+        owm.write_text(text)
+        return owm
+
+    def _analyse(self, tmp_config):
+        return FileMapAnalytics(tmp_config.workspace_root).analyse(
+            "holloway-group", ENGAGEMENT, "maps-1", "strategy/map.agreed.owm"
+        )
+
+    def test_missing_map_is_none(self, tmp_config):
+        assert self._analyse(tmp_config) is None
+
+    def test_sidecar_written_beside_map(self, tmp_config):
+        owm = self._map(tmp_config)
+        result = self._analyse(tmp_config)
+        sidecar = owm.with_name("map.agreed.analytics.json")
+        data = json.loads(sidecar.read_text(encoding="utf-8"))
+        assert data["source_hash"] == result.source_hash
+
+    def test_unchanged_map_served_from_sidecar(self, tmp_config):
+        owm = self._map(tmp_config)
+        first = self._analyse(tmp_config)
+        sidecar = owm.with_name("map.agreed.analytics.json")
+        mtime = sidecar.stat().st_mtime_ns
+        assert self._analyse(tmp_config) == first
+        assert sidecar.stat().st_mtime_ns == mtime
+
+    def test_map_outside_project_is_none(self, tmp_config):
+        other = self._map(tmp_config)
+        other = other.parents[2] / "maps-2" / "strategy" / "map.agreed.owm"
+        other.parent.mkdir(parents=True)
+        other.write_text(self.MAP)
+        analytics = FileMapAnalytics(tmp_config.workspace_root)
+        for map_path in ("../maps-2/strategy/map.agreed.owm", str(other)):
+            assert (
+                analytics.analyse("holloway-group", ENGAGEMENT, "maps-1", map_path)
+                is None
+            )
+        assert not other.with_name("map.agreed.analytics.json").exists()
+
+    def test_non_owm_file_is_none(self, tmp_config):
+        owm = self._map(tmp_config)
+        owm.with_name("notes.md").write_text("# Notes\n")
+        result = FileMapAnalytics(tmp_config.workspace_root).analyse(
+            "holloway-group", ENGAGEMENT, "maps-1", "strategy/notes.md"
+        )
+        assert result is None
+
+    def test_edited_map_recomputed(self, tmp_config):
+        self._map(tmp_config)
+        first = self._analyse(tmp_config)
+        self._map(tmp_config, self.MAP + "component Db [0.3, 0.8]\nApi->Db\n")
+        second = self._analyse(tmp_config)
+        assert second.source_hash != first.source_hash
+        assert "Db" in [c.name for c in second.components]
+
+
+class TestFileAtlasIndex:
+    def test_client_research_read_from_client_dir(self, tmp_config):
+        client = tmp_config.workspace_root / "holloway-group"
+        owm = client / "engagements" / ENGAGEMENT / "maps-1" / "strategy"
+        owm.mkdir(parents=True)
+        (owm / "map.agreed.owm").write_text("anchor User [0.9, 0.5]\n")
+        index = FileAtlasIndex(tmp_config.workspace_root)
+
+        def pipelines():
+            views = index.status("holloway-group", ENGAGEMENT, "maps-1")
+            return next(v for v in views if v.view == "pipelines")
+
+        assert pipelines().state == "blocked"
+        (client / "resources").mkdir(parents=True)
+        (client / "resources" / "index.md").write_text("# Research\n")
+        assert pipelines().state == "stale"
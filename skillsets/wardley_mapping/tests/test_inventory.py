@@ -0,0 +1,107 @@
+"""Tour stop reference checks."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from wardley_mapping.infrastructure import FileTourStopChecker
+from wardley_mapping.inventory import AtlasInventory
+from wardley_mapping.types import TourManifest, TourStop
+
+PROJECT = "holloway-group/engagements/strat-1/maps-1"
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / PROJECT
+    for rel in (
+        "atlas/overview/analysis.md",
+        "atlas/overview/map.svg",
+        "atlas/risk/analysis.md",
+        "atlas/risk/map.owm",
+        "atlas/layers/analysis.md",
+        "atlas/layers/capabilities.svg",
+    ):
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel)
+    return root
+
+
+def _stop(atlas_source: str, **kw) -> TourStop:
+    return TourStop(order="1", title="Stop", atlas_source=atlas_source, **kw)
+
+
+class TestAtlasInventory:
+    def test_valid_stop(self, project):
+        inventory = AtlasInventory.scan(project)
+        assert inventory.check(_stop("atlas/overview/")) == []
+        assert inventory.check(_stop("atlas/overview")) == []
+
+    def test_header_stop_not_checked(self, project):
+        assert AtlasInventory.scan(project).check(_stop("")) == []
+
+    def test_unrendered_map_accepted(self, project):
+        assert AtlasInventory.scan(project).check(_stop("atlas/risk/")) == []
+
+    def test_missing_view_suggests_close_match(self, project):
+        [error] = AtlasInventory.scan(project).check(_stop("atlas/overveiw/"))
+        assert error.field == "atlas_source"
+        assert "atlas/overview/" in error.message
+
+    def test_missing_map_and_analysis(self, project):
+        errors = AtlasInventory.scan(project).check(
+            _stop("atlas/layers/", analysis_file="notes.md")
+        )
+        assert [e.field for e in errors] == ["map_file", "analysis_file"]
+
+    def test_named_map_file(self, project):
+        stop = _stop("atlas/layers/", map_file="capabilities.svg")
+        assert AtlasInventory.scan(project).check(stop) == []
+
+
+class TestFileTourStopChecker:
+    def test_errors_per_manifest(self, project, tmp_path):
+        manifests = [
+            TourManifest(
+                name=name,
+                client="holloway-group",
+                engagement="strat-1",
+                project_slug="maps-1",
+                title=name,
+                stops=[_stop(source)],
+            )
+            for name, source in (
+                ("investor", "atlas/overview/"),
+                ("executive", "atlas/bottlenecks/"),
+            )
+        ]
+        errors = FileTourStopChecker(tmp_path).check(manifests)
+        assert errors[0] == []
+        assert [e.field for e in errors[1]] == ["atlas_source"]
+
+    def test_project_scanned_once(self, project, tmp_path, monkeypatch):
+        scans = []
+        real_scandir = os.scandir
+
+        def counting_scandir(path):
+            scans.append(path)
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+        manifests = [
+            TourManifest(
+                name=f"tour-{i}",
+                client="holloway-group",
+                engagement="strat-1",
+                project_slug="maps-1",
+                title="Tour",
+                stops=[_stop("atlas/overview/"), _stop("atlas/risk/")],
+            )
+            for i in range(5)
+        ]
+        FileTourStopChecker(tmp_path).check(manifests)
+        # project root, atlas/ and its three views
+        assert len(scans) == 5
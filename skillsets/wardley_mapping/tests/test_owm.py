@@ -0,0 +1,289 @@
+"""OWM parser tests.
+
+Tokenizer comment handling, node and link parsing, and the integer-id
+graph model against the DSL reference.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from wardley_mapping.owm import (
+    DEFAULT_EVOLVE_MATURITY,
+    iter_statements,
+    load_owm,
+    parse_owm,
+)
+
+_REFERENCE = (
+    Path(__file__).resolve().parent.parent / "references" / "owm-dsl-reference.md"
+)
+
+
+def _complete_example() -> str:
+    text = _REFERENCE.read_text()
+    section = text.split("## Complete Example", 1)[1]
+    return section.split("```owm", 1)[1].split("```", 1)[0]
+
+
+# ---------------------------------------------------------------------------
+# Tokenizer
+# ---------------------------------------------------------------------------
+
+
+class TestIterStatements:
+    def test_line_and_inline_comments(self):
+        stmts = list(
+            iter_statements(
+                ["// header", "component A [0.5, 0.5]  // inline", "", "A->B"]
+            )
+        )
+        assert stmts == [(2, "component A [0.5, 0.5]"), (4, "A->B")]
+
+    def test_block_comment_spans_lines(self):
+        lines = ["anchor U [0.9, 0.5] /* start", "still comment", "end */ U->A"]
+        assert list(iter_statements(lines)) == [(1, "anchor U [0.9, 0.5]"), (3, "U->A")]
+
+    def test_url_is_not_a_comment(self):
+        stmts = list(iter_statements(["url d [https://example.com/#clone:x]"]))
+        assert stmts == [(1, "url d [https://example.com/#clone:x]")]
+
+    def test_consumes_lazily(self):
+        def lines():
+            yield "title T"
+            raise AssertionError("read past first statement")
+
+        assert next(iter_statements(lines())) == (1, "title T")
+
+
+# ---------------------------------------------------------------------------
+# Nodes
+# ---------------------------------------------------------------------------
+
+
+class TestNodes:
+    def test_anchor_and_component(self):
+        m = parse_owm("anchor Customer [0.95, 0.58]\ncomponent Cup [0.7, 0.4]")
+        assert m.names == ["Customer", "Cup"]
+        assert m.kinds == ["anchor", "component"]
+        assert m.visibility == [0.95, 0.7]
+        assert m.maturity == [0.58, 0.4]
+        assert m.anchors == [0]
+
+    def test_decorators_label_and_inertia(self):
+        m = parse_owm(
+            "component Fuel Depot [0.55, 0.5] label [-100, 4]"
+            " (market, outsource) inertia"
+        )
+        node = m.id("Fuel Depot")
+        assert m.decorators[node] == ("market", "outsource")
+        assert m.inertia[node] is True
+        assert m.visibility[node] == 0.55
+
+    def test_standalone_market_and_ecosystem(self):
+        m = parse_owm(
+            "market Fuel Market [0.35, 0.85] inertia\necosystem Partners [0.3, 0.75]"
+        )
+        assert m.kinds == ["market", "ecosystem"]
+        assert m.inertia[m.id("Fuel Market")] is True
+
+    def test_standalone_execution_strategy(self):
+        m = parse_owm("buy Payments\ncomponent Payments [0.4, 0.7]")
+        assert m.decorators[m.id("Payments")] == ("buy",)
+
+    def test_names_with_hyphens_and_parentheses(self):
+        m = parse_owm(
+            "component Sub-component [0.3, 0.3]\n"
+            "component Product (+rental) [0.4, 0.6]\n"
+            "Sub-component->Product (+rental)"
+        )
+        assert m.depends_on[m.id("Sub-component")] == [m.id("Product (+rental)")]
+
+    def test_submap(self):
+        m = parse_owm("submap Detail Area [0.82, 0.28] url(detail)")
+        assert m.names == ["Detail Area"]
+        assert m.kinds == ["submap"]
+
+
+# ---------------------------------------------------------------------------
+# Links
+# ---------------------------------------------------------------------------
+
+
+class TestLinks:
+    def test_dependency_adjacency(self):
+        m = parse_owm(
+            "anchor U [0.9, 0.5]\ncomponent A [0.6, 0.5]\ncomponent B [0.3, 0.5]\n"
+            "U->A\nA->B\nU->B"
+        )
+        u, a, b = m.id("U"), m.id("A"), m.id("B")
+        assert m.depends_on[u] == [a, b]
+        assert m.dependents[b] == [a, u]
+        assert sorted(m.edges()) == [(u, a), (u, b), (a, b)]
+
+    def test_link_before_declaration(self):
+        m = parse_owm("A->B\ncomponent A [0.6, 0.5]\ncomponent B [0.3, 0.5]")
+        assert m.depends_on[m.id("A")] == [m.id("B")]
+        assert m.unresolved == []
+
+    def test_link_context(self):
+        m = parse_owm(
+            "component A [0.6, 0.5]\ncomponent B [0.3, 0.5]\nA->B; limited by"
+        )
+        assert m.link_context[(m.id("A"), m.id("B"))] == "limited by"
+
+    def test_duplicate_link_collapsed(self):
+        m = parse_owm("component A [0.6, 0.5]\ncomponent B [0.3, 0.5]\nA->B\nA->B")
+        assert m.depends_on[m.id("A")] == [m.id("B")]
+
+    def test_unresolved_link_recorded(self):
+        m = parse_owm("component A [0.6, 0.5]\nA->Ghost")
+        assert m.depends_on[0] == []
+        assert m.unresolved == ["line 2: A->Ghost"]
+
+    def test_link_from_keyword_named_component(self):
+        m = parse_owm(
+            "component market data [0.6, 0.5]\ncomponent feed [0.3, 0.5]\n"
+            "market data->feed"
+        )
+        assert m.depends_on[m.id("market data")] == [m.id("feed")]
+
+    @pytest.mark.parametrize(
+        "line, direction, label",
+        [
+            ("A+>B", "forward", ""),
+            ("A+<B", "reverse", ""),
+            ("A+<>B", "both", ""),
+            ("A+'data'>B", "forward", "data"),
+            ("A+'money'<B", "reverse", "money"),
+            ("A+'info'<>B", "both", "info"),
+        ],
+    )
+    def test_flows(self, line, direction, label):
+        m = parse_owm(f"component A [0.6, 0.5]\ncomponent B [0.3, 0.5]\n{line}")
+        assert len(m.flows) == 1
+        flow = m.flows[0]
+        assert (flow.source, flow.target) == (m.id("A"), m.id("B"))
+        assert (flow.direction, flow.label) == (direction, label)
+        assert m.depends_on[m.id("A")] == []
+
+
+# ---------------------------------------------------------------------------
+# Movement, pipelines, annotations
+# ---------------------------------------------------------------------------
+
+
+class TestEvolve:
+    def test_simple(self):
+        m = parse_owm("component A [0.5, 0.3]\nevolve A 0.72")
+        assert m.evolves[0].node == m.id("A")
+        assert m.evolves[0].maturity == 0.72
+
+    def test_rename_decorators_and_label(self):
+        m = parse_owm(
+            "component Old [0.5, 0.3]\n"
+            "evolve Old->New 0.78 (market, buy) label [5, -20]"
+        )
+        ev = m.evolves[0]
+        assert (ev.renamed_to, ev.maturity) == ("New", 0.78)
+        assert ev.decorators == ("market", "buy")
+
+    def test_default_maturity(self):
+        m = parse_owm("component A [0.5, 0.3]\nevolve A")
+        assert m.evolves[0].maturity == DEFAULT_EVOLVE_MATURITY
+
+
+class TestPipelines:
+    def test_children_inherit_visibility(self):
+        m = parse_owm(
+            "component Power [0.4, 0.5]\n"
+            "pipeline Power\n{\n"
+            "  component Coal [0.18]\n"
+            "  component Solar [0.72]\n"
+            "}\n"
+            "Power->Solar"
+        )
+        parent = m.id("Power")
+        children = m.pipelines[parent]
+        assert [m.names[c] for c in children] == ["Coal", "Solar"]
+        assert m.visibility[m.id("Solar")] == 0.4
+        assert m.maturity[m.id("Solar")] == 0.72
+        assert m.depends_on[parent] == [m.id("Solar")]
+
+    def test_brace_on_header_line(self):
+        m = parse_owm("component P [0.4, 0.5]\npipeline P {\ncomponent V [0.2]\n}")
+        assert len(m.pipelines[m.id("P")]) == 1
+
+
+class TestAnnotationsAndNotes:
+    def test_single_and_multi_position(self):
+        m = parse_owm(
+            "annotation 1 [0.68, 0.28] Key insight\n"
+            "annotation 2 [[0.70, 0.27],[0.56, 0.52]] Relationship\n"
+            "annotations [0.90, 0.03]"
+        )
+        assert [a.number for a in m.annotations] == [1, 2]
+        assert m.annotations[1].positions == [(0.70, 0.27), (0.56, 0.52)]
+        assert m.annotations[0].text == "Key insight"
+
+    def test_note_emphasis(self):
+        m = parse_owm("note +Highlighted note [0.88, 0.08]")
+        assert m.notes[0].text == "Highlighted note"
+        assert m.notes[0].emphasis is True
+
+    def test_forces(self):
+        m = parse_owm("accelerator Market Force [0.78, 0.65]")
+        assert m.forces == [("accelerator", "Market Force", 0.78, 0.65)]
+
+
+class TestMetadataAndLeniency:
+    def test_metadata_does_not_warn(self):
+        m = parse_owm(
+            "title My Map\nstyle wardley\nsize [800, 600]\n"
+            "evolution Genesis->Custom->Product->Commodity\n"
+            "pioneers [0.90, 0.00, 0.75, 0.25]"
+        )
+        assert (m.title, m.style) == ("My Map", "wardley")
+        assert m.warnings == []
+        assert m.unresolved == []
+
+    def test_unknown_statement_warns(self):
+        m = parse_owm("frobnicate everything")
+        assert m.warnings == ["line 1: unrecognised statement: frobnicate everything"]
+
+
+# ---------------------------------------------------------------------------
+# Reference example and scale
+# ---------------------------------------------------------------------------
+
+
+class TestReferenceExample:
+    def test_complete_example_parses_cleanly(self):
+        m = parse_owm(_complete_example())
+        assert m.title == "Lair Canteen"
+        assert len(m) == 9
+        assert len(m.anchors) == 2
+        assert m.warnings == []
+        assert m.unresolved == []
+        hot_broth = m.id("Hot Broth")
+        assert [m.names[i] for i in m.depends_on[hot_broth]] == [
+            "Seawater",
+            "Volcanic Cauldron",
+        ]
+
+    def test_load_owm_streams_file(self, tmp_path):
+        path = tmp_path / "map.agreed.owm"
+        path.write_text(_complete_example())
+        assert load_owm(path).names == parse_owm(_complete_example()).names
+
+
+class TestLargeMap:
+    def test_five_hundred_components(self):
+        lines = ["anchor User [0.95, 0.5]"]
+        lines += [f"component C{i} [{0.9 - i / 600:.3f}, 0.5]" for i in range(500)]
+        lines += ["User->C0"] + [f"C{i}->C{i + 1}" for i in range(499)]
+        m = parse_owm(lines)
+        assert len(m) == 501
+        assert m.depends_on[m.id("C498")] == [m.id("C499")]
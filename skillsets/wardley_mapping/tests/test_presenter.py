@@ -6,7 +6,11 @@ entities without involving any rendering infrastructure.
 
 from __future__ import annotations
 
+import logging
 import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
 
@@ -16,8 +20,12 @@ from practice.content import ProjectContribution
 from practice.entities import Project, ProjectStatus
 from wardley_mapping.infrastructure import JsonTourManifestRepository
 from wardley_mapping.presenter import WardleyProjectPresenter
+from wardley_mapping.rendering import OwmRenderCache, svg_path_for
+from wardley_mapping.tree import ProjectTree
 from wardley_mapping.types import TourManifest, TourStop
 
+FAKE_RENDERER = Path(__file__).parent / "fake_owm_renderer.py"
+
 CLIENT = "test-corp"
 SLUG = "maps-1"
 
@@ -275,6 +283,16 @@ class TestFullWorkspace:
         assert len(strategy_page.figures) == 1
         assert strategy_page.figures[0].caption == "Strategy map"
 
+    def test_repeated_svgs_share_one_string(self, full_workspace):
+        """Hero, strategy page and tour stops reuse the loaded SVG assets."""
+        presenter = _make_presenter(full_workspace)
+        contrib = presenter.present(_make_project())
+        strategy_page = contrib.sections[2].pages[0]
+        assert contrib.hero_figure.svg_content is strategy_page.figures[0].svg_content
+        overview_page = contrib.sections[1].groups[0].pages[0]
+        tour_stop = contrib.sections[0].narratives[0].groups[0].stops[0]
+        assert tour_stop.figures[0].svg_content is overview_page.figures[0].svg_content
+
 
 # ---------------------------------------------------------------------------
 # Minimal workspace — just a brief
@@ -420,3 +438,299 @@ class TestTourStopGrouping:
 
         # Header stop has is_header=True
         assert tour.groups[1].stops[0].is_header is True
+
+
+# ---------------------------------------------------------------------------
+# Tour stop memoisation
+# ---------------------------------------------------------------------------
+
+AUDIENCES = ("investor", "executive", "competitive", "technical", "operations", "onb")
+SHARED_VIEWS = ("overview", "bottlenecks", "risk")
+
+
+@pytest.fixture
+def six_tours(tmp_path):
+    """Six audience tours of ten stops each over three shared atlas views."""
+    proj = tmp_path / CLIENT / "engagements" / "strat-1" / SLUG
+    _write(proj / "brief.agreed.md", "# Brief\n\nScope.")
+    for view in SHARED_VIEWS:
+        _write(proj / "atlas" / view / "map.svg", MINIMAL_SVG)
+        _write(proj / "atlas" / view / "analysis.md", f"# {view}\n\n" + "x" * 20_000)
+    for name in AUDIENCES:
+        _write_tour_manifest(
+            proj,
+            TourManifest(
+                name=name,
+                client=CLIENT,
+                engagement="strat-1",
+                project_slug=SLUG,
+                title=f"{name} tour",
+                stops=[
+                    TourStop(
+                        order=f"{i // 2 + 1}{'ab'[i % 2]}",
+                        title=f"Stop {i}",
+                        atlas_source=f"atlas/{SHARED_VIEWS[i % 3]}/",
+                    )
+                    for i in range(10)
+                ],
+            ),
+        )
+    return tmp_path
+
+
+def _count_analysis_reads(monkeypatch) -> list[str]:
+    reads: list[str] = []
+    read_text = ProjectTree.read_text
+
+    def counting(self, rel):
+        if rel.endswith("analysis.md"):
+            reads.append(rel)
+        return read_text(self, rel)
+
+    monkeypatch.setattr(ProjectTree, "read_text", counting)
+    return reads
+
+
+class TestTourStopMemoisation:
+    def test_shared_views_read_once_per_render(self, six_tours, monkeypatch):
+        presenter = _make_presenter(six_tours)
+        tree = ProjectTree(six_tours / CLIENT / "engagements" / "strat-1" / SLUG)
+        manifests = presenter._tours.list_all(CLIENT, "strat-1", SLUG)
+        reads = _count_analysis_reads(monkeypatch)
+        tours = presenter._build_presentations_section(tree, manifests).narratives
+        stops = [stop for tour in tours for g in tour.groups for stop in g.stops]
+        assert len(tours) == 6
+        assert len(stops) == 60
+        assert sorted(reads) == sorted(f"atlas/{v}/analysis.md" for v in SHARED_VIEWS)
+
+    def test_memoised_stops_keep_their_own_figure_lists(self, six_tours):
+        contrib = _make_presenter(six_tours).present(_make_project())
+        first, second = contrib.sections[0].narratives[:2]
+        a = first.groups[0].stops[0]
+        b = second.groups[0].stops[0]
+        assert a.figures is not b.figures
+        assert a.figures[0].svg_content is b.figures[0].svg_content
+        assert a.analysis_md is b.analysis_md
+
+    def test_benchmark_sixty_stops(self, six_tours):
+        """Memoised stops cost well under a tenth of resolving each one."""
+        presenter = _make_presenter(six_tours)
+        tree = ProjectTree(six_tours / CLIENT / "engagements" / "strat-1" / SLUG)
+        stops = [
+            stop
+            for m in presenter._tours.list_all(CLIENT, "strat-1", SLUG)
+            for stop in m.stops
+        ]
+        assert len(stops) == 60
+
+        def per_stop():
+            for stop in stops:
+                presenter._stop_content(tree, stop, {})
+
+        def memoised():
+            memo = {}
+            for stop in stops:
+                presenter._stop_content(tree, stop, memo)
+
+        # Interleave runs so both variants see the same machine load
+        best = {per_stop: float("inf"), memoised: float("inf")}
+        for _ in range(15):
+            for fn in best:
+                start = time.perf_counter()
+                fn()
+                best[fn] = min(best[fn], time.perf_counter() - start)
+        assert best[memoised] < 0.1 * best[per_stop]
+
+
+# ---------------------------------------------------------------------------
+# OWM render cache
+# ---------------------------------------------------------------------------
+
+
+def _counting_script(tmp_path: Path) -> tuple[Path, Path]:
+    """Create an OWM render script that logs each call and writes an SVG."""
+    log = tmp_path / "render.log"
+    rendered = tmp_path / "rendered.svg"
+    rendered.write_text(MINIMAL_SVG)
+    script = tmp_path / "counting-owm.sh"
+    script.write_text(
+        "#!/bin/sh\n"
+        f'echo "$1" >> "{log}"\n'
+        'out="${1%.owm}"\n'
+        f'cp "{rendered}" "${{out%.agreed}}.svg"\n'
+    )
+    script.chmod(0o755)
+    return script, log
+
+
+def _render_calls(log: Path) -> int:
+    return len(log.read_text().splitlines()) if log.is_file() else 0
+
+
+class TestOwmRenderCache:
+    """Unchanged maps are never re-rendered, whatever their mtimes."""
+
+    def _presenter(
+        self, ws_root: Path, script: Path, **kwargs
+    ) -> WardleyProjectPresenter:
+        return WardleyProjectPresenter(
+            workspace_root=ws_root,
+            ensure_owm_script=script,
+            tours=JsonTourManifestRepository(ws_root),
+            **kwargs,
+        )
+
+    def test_first_render_misses(self, tmp_path):
+        proj = tmp_path / CLIENT / "engagements" / "strat-1" / SLUG
+        _write(proj / "strategy" / "map.agreed.owm", "title A")
+        script, log = _counting_script(tmp_path)
+
+        self._presenter(tmp_path, script).present(_make_project())
+        assert _render_calls(log) == 1
+        assert (proj / "strategy" / "map.svg").is_file()
+
+    def test_touched_source_is_cache_hit(self, tmp_path):
+        proj = tmp_path / CLIENT / "engagements" / "strat-1" / SLUG
+        owm = proj / "strategy" / "map.agreed.owm"
+        _write(owm, "title A")
+        script, log = _counting_script(tmp_path)
+        self._presenter(tmp_path, script).present(_make_project())
+
+        # Simulate a fresh checkout: SVG gone, OWM mtime bumped
+        svg = proj / "strategy" / "map.svg"
+        svg.unlink()
+        os.utime(owm, None)
+        self._presenter(tmp_path, script).present(_make_project())
+
+        assert _render_calls(log) == 1
+        assert svg.read_text() == MINIMAL_SVG
+
+    def test_changed_source_re_renders(self, tmp_path):
+        proj = tmp_path / CLIENT / "engagements" / "strat-1" / SLUG
+        owm = proj / "strategy" / "map.agreed.owm"
+        _write(owm, "title A")
+        script, log = _counting_script(tmp_path)
+        self._presenter(tmp_path, script).present(_make_project())
+
+        owm.write_text("title B")
+        self._presenter(tmp_path, script).present(_make_project())
+        assert _render_calls(log) == 2
+
+    def test_hit_miss_counters_reported(self, tmp_path, caplog):
+        proj = tmp_path / CLIENT / "engagements" / "strat-1" / SLUG
+        _write(proj / "strategy" / "map.agreed.owm", "title A")
+        script, _ = _counting_script(tmp_path)
+        presenter = self._presenter(tmp_path, script)
+
+        caplog.set_level(logging.INFO, logger="wardley_mapping.presenter")
+        presenter.present(_make_project())
+        presenter.present(_make_project())
+        out = caplog.text
+        assert f"{SLUG}: OWM render cache: 0 hit(s), 1 miss(es)" in out
+        assert "OWM render cache: 1 hit(s), 0 miss(es)" in out
+
+    def test_render_failure_reported(self, tmp_path, caplog):
+        proj = tmp_path / CLIENT / "engagements" / "strat-1" / SLUG
+        _write(proj / "strategy" / "map.agreed.owm", "title A")
+        script = tmp_path / "failing-owm.sh"
+        script.write_text("#!/bin/sh\necho 'bad DSL' >&2\nexit 1\n")
+        script.chmod(0o755)
+
+        self._presenter(tmp_path, script).present(_make_project())
+        assert "bad DSL" in caplog.text
+
+    def test_failed_render_not_cached(self, tmp_path):
+        proj = tmp_path / CLIENT / "engagements" / "strat-1" / SLUG
+        _write(proj / "strategy" / "map.agreed.owm", "title A")
+        _write(proj / "strategy" / "map.svg", MINIMAL_SVG)
+        script = tmp_path / "failing-owm.sh"
+        script.write_text("#!/bin/sh\nexit 1\n")
+        script.chmod(0o755)
+        cache = OwmRenderCache(tmp_path / "cache")
+        presenter = self._presenter(tmp_path, script, render_cache=cache)
+
+        presenter.present(_make_project())
+        presenter.present(_make_project())
+        assert cache.hits == 0
+
+
+class TestOwmBatchRendering:
+    """A long-lived batch renderer replaces per-file script calls."""
+
+    def _workspace(self, tmp_path: Path) -> Path:
+        proj = tmp_path / CLIENT / "engagements" / "strat-1" / SLUG
+        _write(proj / "strategy" / "map.agreed.owm", "title S")
+        for view in ("overview", "risk", "layers"):
+            _write(proj / "atlas" / view / "map.owm", f"title {view}")
+        return proj
+
+    def test_all_maps_stream_through_batch(self, tmp_path):
+        proj = self._workspace(tmp_path)
+        script, script_log = _counting_script(tmp_path)
+        batch_log = tmp_path / "batch.log"
+        presenter = WardleyProjectPresenter(
+            workspace_root=tmp_path,
+            ensure_owm_script=script,
+            tours=JsonTourManifestRepository(tmp_path),
+            owm_batch_command=[sys.executable, str(FAKE_RENDERER), str(batch_log)],
+        )
+
+        presenter.present(_make_project())
+        assert _render_calls(script_log) == 0
+        assert len(batch_log.read_text().splitlines()) == 4
+        assert (proj / "strategy" / "map.svg").is_file()
+        assert (proj / "atlas" / "risk" / "map.svg").is_file()
+
+    def test_falls_back_to_script(self, tmp_path):
+        self._workspace(tmp_path)
+        script, script_log = _counting_script(tmp_path)
+        presenter = WardleyProjectPresenter(
+            workspace_root=tmp_path,
+            ensure_owm_script=script,
+            tours=JsonTourManifestRepository(tmp_path),
+            owm_batch_command=[str(tmp_path / "missing-batch.sh")],
+        )
+
+        presenter.present(_make_project())
+        assert _render_calls(script_log) == 4
+
+    def test_crash_mid_run_renders_rest_per_file(self, tmp_path):
+        proj = self._workspace(tmp_path)
+        _write(proj / "atlas" / "risk" / "map.owm", "title CRASH")
+        script, script_log = _counting_script(tmp_path)
+        batch_log = tmp_path / "batch.log"
+        presenter = WardleyProjectPresenter(
+            workspace_root=tmp_path,
+            ensure_owm_script=script,
+            tours=JsonTourManifestRepository(tmp_path),
+            owm_batch_command=[sys.executable, str(FAKE_RENDERER), str(batch_log)],
+        )
+
+        presenter.present(_make_project())
+        batch_calls = len(batch_log.read_text().splitlines())
+        # The crashing map and everything after it go to the script
+        assert batch_calls + _render_calls(script_log) == 5
+        assert all(svg_path_for(owm).is_file() for owm in proj.rglob("*.owm"))
+
+    def test_concurrent_projects_share_one_renderer(self, tmp_path):
+        slugs = [f"maps-{i}" for i in range(4)]
+        for slug in slugs:
+            proj = tmp_path / CLIENT / "engagements" / "strat-1" / slug
+            _write(proj / "strategy" / "map.agreed.owm", f"title {slug}")
+        starts = tmp_path / "starts.log"
+        batch_log = tmp_path / "batch.log"
+        command = (
+            f"echo start >> {starts}; exec {sys.executable} {FAKE_RENDERER} {batch_log}"
+        )
+        script, _ = _counting_script(tmp_path)
+        presenter = WardleyProjectPresenter(
+            workspace_root=tmp_path,
+            ensure_owm_script=script,
+            tours=JsonTourManifestRepository(tmp_path),
+            owm_batch_command=["sh", "-c", command],
+        )
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda s: presenter.present(_make_project(slug=s)), slugs))
+        assert len(starts.read_text().splitlines()) == 1
+        assert len(batch_log.read_text().splitlines()) == 4
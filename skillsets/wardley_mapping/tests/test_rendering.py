@@ -0,0 +1,257 @@
+"""OWM rendering support tests.
+
+Content-addressed render cache: keying, restore and store semantics.
+Render pool: bounded concurrency, failure collection, timing report.
+Batch renderer: line protocol against a fake renderer, start-up fallback.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from wardley_mapping.rendering import (
+    BatchRenderer,
+    BatchRendererDied,
+    OwmRenderCache,
+    RenderError,
+    RenderPool,
+    ScriptRenderer,
+    file_digest,
+    svg_path_for,
+)
+
+FAKE_RENDERER = Path(__file__).parent / "fake_owm_renderer.py"
+
+SVG = b"<svg xmlns='http://www.w3.org/2000/svg'/>"
+
+
+class TestCacheKey:
+    def test_same_source_same_key(self, tmp_path):
+        cache = OwmRenderCache(tmp_path)
+        assert cache.key(b"title A") == cache.key(b"title A")
+
+    def test_source_changes_key(self, tmp_path):
+        cache = OwmRenderCache(tmp_path)
+        assert cache.key(b"title A") != cache.key(b"title B")
+
+    def test_renderer_version_changes_key(self, tmp_path):
+        a = OwmRenderCache(tmp_path, renderer_version="1")
+        b = OwmRenderCache(tmp_path, renderer_version="2")
+        assert a.key(b"title A") != b.key(b"title A")
+
+    def test_style_changes_key(self, tmp_path):
+        a = OwmRenderCache(tmp_path, style="wardley")
+        b = OwmRenderCache(tmp_path, style="dark")
+        assert a.key(b"title A") != b.key(b"title A")
+
+
+class TestRestoreAndStore:
+    def test_miss_counted(self, tmp_path):
+        cache = OwmRenderCache(tmp_path / "cache")
+        assert cache.restore(cache.key(b"x"), tmp_path / "map.svg") is False
+        assert (cache.hits, cache.misses) == (0, 1)
+
+    def test_store_then_restore(self, tmp_path):
+        cache = OwmRenderCache(tmp_path / "cache")
+        rendered = tmp_path / "a" / "map.svg"
+        rendered.parent.mkdir()
+        rendered.write_bytes(SVG)
+        key = cache.key(b"x")
+        cache.store(key, rendered)
+
+        target = tmp_path / "map.svg"
+        assert cache.restore(key, target) is True
+        assert target.read_bytes() == SVG
+        assert (cache.hits, cache.misses) == (1, 0)
+
+    def test_matching_svg_not_rewritten(self, tmp_path):
+        cache = OwmRenderCache(tmp_path / "cache")
+        svg = tmp_path / "map.svg"
+        svg.write_bytes(SVG)
+        key = cache.key(b"x")
+        cache.store(key, svg)
+        os.utime(svg, (0, 0))
+
+        cache.restore(key, svg)
+        assert svg.stat().st_mtime == 0
+
+
+class TestFileDigest:
+    def test_missing_file_is_empty(self, tmp_path):
+        assert file_digest(tmp_path / "nope.sh") == ""
+
+    def test_digest_tracks_content(self, tmp_path):
+        f = tmp_path / "ensure-owm.sh"
+        f.write_text("v1")
+        first = file_digest(f)
+        f.write_text("v2")
+        assert file_digest(f) != first
+
+
+class TestSvgPathFor:
+    def test_agreed_marker_dropped(self, tmp_path):
+        assert svg_path_for(tmp_path / "map.agreed.owm") == tmp_path / "map.svg"
+
+    def test_plain_owm(self, tmp_path):
+        assert svg_path_for(tmp_path / "risk.owm") == tmp_path / "risk.svg"
+
+
+class TestRenderPool:
+    def test_empty_run(self):
+        report = RenderPool().run([], lambda p: None)
+        assert report.outcomes == []
+
+    def test_outcomes_in_submission_order(self, tmp_path):
+        sources = [tmp_path / f"{i}.owm" for i in range(8)]
+        report = RenderPool(max_workers=4).run(sources, lambda p: None)
+        assert [o.source for o in report.outcomes] == sources
+        assert all(o.ok for o in report.outcomes)
+
+    def test_concurrency_bounded(self, tmp_path):
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def render(_: Path) -> None:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+
+        sources = [tmp_path / f"{i}.owm" for i in range(10)]
+        RenderPool(max_workers=3).run(sources, render)
+        assert 1 < peak <= 3
+
+    def test_concurrent_runs_share_the_bound(self, tmp_path):
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def render(_: Path) -> None:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+
+        pool = RenderPool(max_workers=3)
+        projects = [[tmp_path / f"p{p}-{i}.owm" for i in range(6)] for p in range(4)]
+        threads = [
+            threading.Thread(target=pool.run, args=(sources, render))
+            for sources in projects
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert 1 < peak <= 3
+
+    def test_failures_collected(self, tmp_path):
+        def render(source: Path) -> None:
+            if source.stem == "bad":
+                raise RenderError("syntax error on line 3")
+
+        report = RenderPool().run([tmp_path / "ok.owm", tmp_path / "bad.owm"], render)
+        assert [o.source.stem for o in report.failures] == ["bad"]
+        assert "line 3" in report.failures[0].error
+
+    def test_timings_recorded(self, tmp_path):
+        report = RenderPool().run([tmp_path / "a.owm"], lambda p: time.sleep(0.01))
+        assert report.outcomes[0].seconds >= 0.01
+        assert report.seconds >= 0.01
+
+
+class TestScriptRenderer:
+    def _script(self, tmp_path: Path, body: str) -> Path:
+        script = tmp_path / "render.sh"
+        script.write_text(f"#!/bin/sh\n{body}\n")
+        script.chmod(0o755)
+        return script
+
+    def test_success(self, tmp_path):
+        ScriptRenderer(self._script(tmp_path, "true"))(tmp_path / "a.owm")
+
+    def test_stderr_surfaced_on_failure(self, tmp_path):
+        script = self._script(tmp_path, "echo 'npx not found' >&2; exit 127")
+        report = RenderPool().run([tmp_path / "a.owm"], ScriptRenderer(script))
+        assert "npx not found" in report.failures[0].error
+        assert "127" in report.failures[0].error
+
+
+class TestBatchRenderer:
+    @pytest.fixture
+    def renderer(self):
+        batch = BatchRenderer.start([sys.executable, str(FAKE_RENDERER)])
+        assert batch is not None
+        yield batch
+        batch.close()
+
+    def _owm(self, tmp_path: Path, name: str, text: str) -> Path:
+        owm = tmp_path / name
+        owm.write_text(text)
+        return owm
+
+    def test_renders_many_files_in_one_process(self, tmp_path, renderer):
+        sources = [self._owm(tmp_path, f"m{i}.owm", "title M") for i in range(5)]
+        outcomes, remaining = renderer.run(sources)
+        assert all(o.ok for o in outcomes) and remaining == []
+        assert all(svg_path_for(s).is_file() for s in sources)
+        assert renderer.alive
+
+    def test_error_reply_is_render_error(self, tmp_path, renderer):
+        owm = self._owm(tmp_path, "bad.owm", "FAIL")
+        with pytest.raises(RenderError, match="unknown component"):
+            renderer(owm)
+        # The process survives a per-file error
+        renderer(self._owm(tmp_path, "good.owm", "title G"))
+
+    def test_crash_is_render_error(self, tmp_path, renderer):
+        with pytest.raises(BatchRendererDied, match="exited"):
+            renderer(self._owm(tmp_path, "boom.owm", "CRASH"))
+        assert not renderer.alive
+
+    def test_hung_renderer_times_out(self, tmp_path):
+        batch = BatchRenderer.start(
+            [sys.executable, str(FAKE_RENDERER)], reply_timeout=0.5
+        )
+        assert batch is not None
+        start = time.perf_counter()
+        with pytest.raises(BatchRendererDied, match="did not reply within 0.5s"):
+            batch(self._owm(tmp_path, "stuck.owm", "HANG"))
+        assert time.perf_counter() - start < 5
+        assert not batch.alive
+
+    def test_run_renders_in_order(self, tmp_path, renderer):
+        sources = [self._owm(tmp_path, f"m{i}.owm", "title M") for i in range(3)]
+        sources.insert(1, self._owm(tmp_path, "bad.owm", "FAIL"))
+        outcomes, remaining = renderer.run(sources)
+        assert [o.source for o in outcomes] == sources
+        assert [o.ok for o in outcomes] == [True, False, True, True]
+        assert remaining == []
+
+    def test_run_hands_back_unrendered_after_crash(self, tmp_path, renderer):
+        sources = [
+            self._owm(tmp_path, "a.owm", "title A"),
+            self._owm(tmp_path, "boom.owm", "CRASH"),
+            self._owm(tmp_path, "c.owm", "title C"),
+        ]
+        outcomes, remaining = renderer.run(sources)
+        assert [o.source for o in outcomes] == sources[:1]
+        assert remaining == sources[1:]
+
+    def test_missing_command_unavailable(self, tmp_path):
+        assert BatchRenderer.start([str(tmp_path / "no-such-renderer")]) is None
+
+    def test_no_handshake_unavailable(self):
+        assert BatchRenderer.start([sys.executable, "-c", "pass"]) is None
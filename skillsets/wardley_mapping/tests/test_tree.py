@@ -0,0 +1,96 @@
+"""Project tree snapshot tests."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from wardley_mapping.tree import ProjectTree
+
+
+@pytest.fixture
+def project(tmp_path):
+    for rel in (
+        "brief.agreed.md",
+        "strategy/map.agreed.owm",
+        "strategy/plays/b.md",
+        "strategy/plays/a.md",
+        "atlas/overview/analysis.md",
+        "atlas/overview/map.svg",
+        "atlas/layers/capabilities.svg",
+    ):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel)
+    return tmp_path
+
+
+class TestQueries:
+    def test_is_file_and_is_dir(self, project):
+        tree = ProjectTree(project)
+        assert tree.is_file("brief.agreed.md")
+        assert tree.is_file("strategy/map.agreed.owm")
+        assert not tree.is_file("strategy")
+        assert tree.is_dir("strategy/plays")
+        assert not tree.is_dir("brief.agreed.md")
+        assert not tree.is_file("needs/needs.agreed.md")
+
+    def test_paths_normalised(self, project):
+        tree = ProjectTree(project)
+        assert tree.is_dir("atlas/overview/")
+        assert tree.is_file("atlas/./overview/map.svg")
+        assert tree.is_dir("")
+
+    def test_listings_sorted(self, project):
+        tree = ProjectTree(project)
+        assert tree.subdirs("atlas") == ["layers", "overview"]
+        assert tree.files("strategy/plays", ".md") == ["a.md", "b.md"]
+        assert tree.files("missing") == []
+
+    def test_walk_files(self, project):
+        tree = ProjectTree(project)
+        assert tree.walk_files(".svg") == [
+            "atlas/layers/capabilities.svg",
+            "atlas/overview/map.svg",
+        ]
+
+    def test_read_text(self, project):
+        tree = ProjectTree(project)
+        assert tree.read_text("strategy/plays/a.md") == "strategy/plays/a.md"
+        assert tree.read_text("decisions.md") == ""
+
+    def test_missing_root_is_empty(self, tmp_path):
+        tree = ProjectTree(tmp_path / "nope")
+        assert tree.walk_files() == []
+        assert not tree.is_dir("")
+
+
+class TestSnapshot:
+    def test_one_scandir_per_directory(self, project, monkeypatch):
+        calls = []
+        real = os.scandir
+
+        def counting(path):
+            calls.append(path)
+            return real(path)
+
+        monkeypatch.setattr(os, "scandir", counting)
+        tree = ProjectTree(project)
+        for _ in range(3):
+            tree.is_file("strategy/map.agreed.owm")
+            tree.files("atlas/overview", ".svg")
+        assert len(calls) == 6  # root, strategy, plays, atlas, overview, layers
+
+    def test_later_files_invisible_until_added(self, project):
+        tree = ProjectTree(project)
+        (project / "strategy" / "map.svg").write_text("<svg/>")
+        assert not tree.is_file("strategy/map.svg")
+        tree.add_file("strategy/map.svg")
+        assert tree.is_file("strategy/map.svg")
+
+    def test_add_file_creates_parents(self, project):
+        tree = ProjectTree(project)
+        tree.add_file("evolve/deep/map.svg")
+        assert tree.is_dir("evolve/deep")
+        assert tree.subdirs("evolve") == ["deep"]
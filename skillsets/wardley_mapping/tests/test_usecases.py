@@ -12,9 +12,18 @@ from bin.cli.dtos import (
     RecordDecisionRequest,
     RegisterProjectRequest,
 )
-from practice.exceptions import NotFoundError
-from wardley_mapping.dtos import RegisterTourRequest
+from practice.exceptions import DuplicateError, NotFoundError
+from wardley_mapping.dtos import (
+    AnalyseMapRequest,
+    GetAtlasStatusRequest,
+    ListToursRequest,
+    RecordAtlasViewRequest,
+    RegisterToursBatchRequest,
+    RegisterTourRequest,
+    TourSpec,
+)
 from wardley_mapping.types import TourStop
+from wardley_mapping.usecases import RegisterTourUseCase
 
 CLIENT = "holloway-group"
 ENGAGEMENT = "strat-1"
@@ -113,6 +122,53 @@ class TestRegisterTour:
         assert len(got.stops) == 2
         assert got.stops[1].atlas_source == "atlas/risk/"
 
+    def test_unresolved_stops_reported(self, project):
+        view = (
+            project.config.workspace_root
+            / CLIENT
+            / "engagements"
+            / ENGAGEMENT
+            / "maps-1"
+            / "atlas"
+            / "overview"
+        )
+        view.mkdir(parents=True)
+        (view / "map.owm").write_text("title Overview\n")
+        (view / "analysis.md").write_text("# Overview\n")
+
+        resp = project.register_tour_usecase.execute(
+            RegisterTourRequest(
+                client=CLIENT,
+                engagement=ENGAGEMENT,
+                project_slug="maps-1",
+                name="investor",
+                title="Investor Briefing",
+                stops=[
+                    TourStop(
+                        order="1", title="Overview", atlas_source="atlas/overview/"
+                    ),
+                    TourStop(order="2", title="Moats", atlas_source="atlas/moats/"),
+                ],
+            )
+        )
+        assert [(e.order, e.field) for e in resp.errors] == [("2", "atlas_source")]
+        assert project.tours.get(CLIENT, ENGAGEMENT, "maps-1", "investor") is not None
+
+    def test_stop_checker_optional(self, project):
+        usecase = RegisterTourUseCase(projects=project.projects, tours=project.tours)
+        resp = usecase.execute(
+            RegisterTourRequest(
+                client=CLIENT,
+                engagement=ENGAGEMENT,
+                project_slug="maps-1",
+                name="investor",
+                title="Investor Briefing",
+                stops=[TourStop(order="1", title="Moats", atlas_source="atlas/moats/")],
+            )
+        )
+        assert resp.errors == []
+        assert project.tours.get(CLIENT, ENGAGEMENT, "maps-1", "investor") is not None
+
     def test_nonexistent_project_rejected(self, workspace):
         with pytest.raises(NotFoundError, match="not found"):
             workspace.register_tour_usecase.execute(
@@ -133,6 +189,127 @@ class TestRegisterTour:
             )
 
 
+# ---------------------------------------------------------------------------
+# RegisterToursBatch
+# ---------------------------------------------------------------------------
+
+
+def _spec(name: str, *sources: str) -> TourSpec:
+    return TourSpec(
+        name=name,
+        title=f"{name.title()} Tour",
+        stops=[
+            TourStop(order=str(i), title=src, atlas_source=src)
+            for i, src in enumerate(sources, start=1)
+        ],
+    )
+
+
+class TestRegisterToursBatch:
+    """Register every audience tour of a project in one call."""
+
+    def test_registers_all_tours(self, project):
+        resp = project.register_tours_batch_usecase.execute(
+            RegisterToursBatchRequest(
+                client=CLIENT,
+                engagement=ENGAGEMENT,
+                project_slug="maps-1",
+                tours=[
+                    _spec("investor", "atlas/overview/", "atlas/bottlenecks/"),
+                    _spec("executive", "atlas/overview/", "atlas/risk/"),
+                    _spec("technical", "atlas/layers/"),
+                ],
+            )
+        )
+        assert [(t.name, t.stop_count) for t in resp.tours] == [
+            ("investor", 2),
+            ("executive", 2),
+            ("technical", 1),
+        ]
+        got = project.tours.get(CLIENT, ENGAGEMENT, "maps-1", "executive")
+        assert got is not None
+        assert got.stops[1].atlas_source == "atlas/risk/"
+
+    def test_duplicate_tour_names_write_nothing(self, project):
+        with pytest.raises(DuplicateError, match="investor"):
+            project.register_tours_batch_usecase.execute(
+                RegisterToursBatchRequest(
+                    client=CLIENT,
+                    engagement=ENGAGEMENT,
+                    project_slug="maps-1",
+                    tours=[
+                        _spec("executive", "atlas/overview/"),
+                        _spec("investor", "atlas/overview/"),
+                        _spec("investor", "atlas/risk/"),
+                    ],
+                )
+            )
+        assert project.tours.get(CLIENT, ENGAGEMENT, "maps-1", "executive") is None
+
+    def test_duplicate_stop_orders_rejected(self, project):
+        spec = _spec("investor", "atlas/overview/", "atlas/risk/")
+        spec.stops[1].order = "1"
+        with pytest.raises(DuplicateError, match="stop orders"):
+            project.register_tours_batch_usecase.execute(
+                RegisterToursBatchRequest(
+                    client=CLIENT,
+                    engagement=ENGAGEMENT,
+                    project_slug="maps-1",
+                    tours=[spec],
+                )
+            )
+
+    def test_nonexistent_project_rejected(self, workspace):
+        with pytest.raises(NotFoundError, match="not found"):
+            workspace.register_tours_batch_usecase.execute(
+                RegisterToursBatchRequest(
+                    client=CLIENT,
+                    engagement=ENGAGEMENT,
+                    project_slug="phantom-1",
+                    tours=[_spec("investor", "atlas/overview/")],
+                )
+            )
+
+
+# ---------------------------------------------------------------------------
+# ListTours
+# ---------------------------------------------------------------------------
+
+
+class TestListTours:
+    """List a project's tours from the tour catalog."""
+
+    def test_lists_registered_tours(self, project):
+        project.register_tours_batch_usecase.execute(
+            RegisterToursBatchRequest(
+                client=CLIENT,
+                engagement=ENGAGEMENT,
+                project_slug="maps-1",
+                tours=[
+                    _spec("technical", "atlas/layers/"),
+                    _spec("investor", "atlas/overview/", "atlas/risk/"),
+                ],
+            )
+        )
+        resp = project.list_tours_usecase.execute(
+            ListToursRequest(
+                client=CLIENT, engagement=ENGAGEMENT, project_slug="maps-1"
+            )
+        )
+        assert [(t.name, t.title, t.stop_count) for t in resp.tours] == [
+            ("investor", "Investor Tour", 2),
+            ("technical", "Technical Tour", 1),
+        ]
+
+    def test_nonexistent_project_rejected(self, workspace):
+        with pytest.raises(NotFoundError, match="not found"):
+            workspace.list_tours_usecase.execute(
+                ListToursRequest(
+                    client=CLIENT, engagement=ENGAGEMENT, project_slug="phantom-1"
+                )
+            )
+
+
 # ---------------------------------------------------------------------------
 # GetProjectProgress (WM pipeline specifics)
 # ---------------------------------------------------------------------------
@@ -234,3 +411,108 @@ class TestGetProjectProgress:
                     client=CLIENT, engagement=ENGAGEMENT, project_slug="phantom-1"
                 )
             )
+
+
+# ---------------------------------------------------------------------------
+# AnalyseMap
+# ---------------------------------------------------------------------------
+
+
+class TestAnalyseMap:
+    """Serve precomputed graph analytics for an agreed map."""
+
+    def _write_map(self, workspace_root):
+        owm = (
+            workspace_root
+            / CLIENT
+            / "engagements"
+            / ENGAGEMENT
+            / "maps-1"
+            / "strategy"
+            / "map.agreed.owm"
+        )
+        owm.parent.mkdir(parents=True, exist_ok=True)
+        owm.write_text(
+            "anchor Shipper [0.95, 0.4]\n"
+            "component Tracking [0.8, 0.5]\n"
+            "component Hosting [0.2, 0.9]\n"
+            "Shipper->Tracking\n"
+            "Tracking->Hosting\n"
+        )
+
+    def test_returns_analytics(self, project, tmp_config):
+        self._write_map(tmp_config.workspace_root)
+        resp = project.analyse_map_usecase.execute(
+            AnalyseMapRequest(
+                client=CLIENT, engagement=ENGAGEMENT, project_slug="maps-1"
+            )
+        )
+        assert resp.map_path == "strategy/map.agreed.owm"
+        assert resp.analytics.components[0].name == "Hosting"
+        assert [t.need for t in resp.analytics.need_traces] == ["Tracking"]
+
+    def test_missing_map_rejected(self, project):
+        with pytest.raises(NotFoundError, match="not found"):
+            project.analyse_map_usecase.execute(
+                AnalyseMapRequest(
+                    client=CLIENT, engagement=ENGAGEMENT, project_slug="maps-1"
+                )
+            )
+
+    def test_nonexistent_project_rejected(self, workspace):
+        with pytest.raises(NotFoundError, match="not found"):
+            workspace.analyse_map_usecase.execute(
+                AnalyseMapRequest(
+                    client=CLIENT, engagement=ENGAGEMENT, project_slug="phantom-1"
+                )
+            )
+
+
+# ---------------------------------------------------------------------------
+# Atlas status
+# ---------------------------------------------------------------------------
+
+
+class TestAtlasStatus:
+    """Report and record atlas view staleness from the build index."""
+
+    def _project_dir(self, workspace_root):
+        return workspace_root / CLIENT / "engagements" / ENGAGEMENT / "maps-1"
+
+    def test_reports_every_view(self, project):
+        resp = project.get_atlas_status_usecase.execute(
+            GetAtlasStatusRequest(
+                client=CLIENT, engagement=ENGAGEMENT, project_slug="maps-1"
+            )
+        )
+        assert {v.view for v in resp.views} >= {"overview", "bottlenecks", "teams"}
+        assert all(v.state != "fresh" for v in resp.views)
+
+    def test_record_marks_view_fresh(self, project, tmp_config):
+        project_dir = self._project_dir(tmp_config.workspace_root)
+        (project_dir / "strategy").mkdir(parents=True)
+        (project_dir / "strategy" / "map.agreed.owm").write_text("title T\n")
+        (project_dir / "atlas" / "teams").mkdir(parents=True)
+        for name in ("map.owm", "analysis.md"):
+            (project_dir / "atlas" / "teams" / name).write_text("generated")
+
+        resp = project.record_atlas_view_usecase.execute(
+            RecordAtlasViewRequest(
+                client=CLIENT,
+                engagement=ENGAGEMENT,
+                project_slug="maps-1",
+                view="teams",
+            )
+        )
+        assert resp.status.state == "fresh"
+
+    def test_unknown_view_rejected(self, project):
+        with pytest.raises(NotFoundError, match="not found"):
+            project.record_atlas_view_usecase.execute(
+                RecordAtlasViewRequest(
+                    client=CLIENT,
+                    engagement=ENGAGEMENT,
+                    project_slug="maps-1",
+                    view="phantom",
+                )
+            )
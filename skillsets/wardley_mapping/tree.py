@@ -0,0 +1,128 @@
+"""In-memory snapshot of a project directory.
+
+Presenting a project asks the same questions of the filesystem many
+times over: does this gate file exist, which atlas views have an
+analysis, which SVGs sit next to it. ``ProjectTree`` answers all of
+them from one ``os.scandir`` walk, so the cost is one directory read
+per directory instead of one stat per question — which matters on
+network filesystems.
+
+Paths are project-relative POSIX strings (``"atlas/overview"``).
+"""
+
+from __future__ import annotations
+
+import os
+import posixpath
+from pathlib import Path
+
+from wardley_mapping.assets import SvgAssetStore
+
+
+def _norm(rel: str) -> str:
+    rel = posixpath.normpath(rel.strip("/") or ".")
+    return "" if rel == "." else rel
+
+
+class ProjectTree:
+    """Snapshot of the files and directories under a project root.
+
+    Directory listings are captured once at construction. Files created
+    afterwards (rendered SVGs, for instance) must be registered with
+    ``add_file`` to be visible. SVGs read through ``read_svg`` are held
+    in ``assets``, one copy per distinct content.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.assets = SvgAssetStore()
+        # directory -> {child name: is_dir}
+        self._dirs: dict[str, dict[str, bool]] = {}
+        if root.is_dir():
+            self._scan()
+
+    def _scan(self) -> None:
+        pending = [""]
+        while pending:
+            rel = pending.pop()
+            children: dict[str, bool] = {}
+            try:
+                with os.scandir(self.root / rel if rel else self.root) as it:
+                    for entry in it:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            continue
+                        children[entry.name] = is_dir
+                        if is_dir:
+                            pending.append(f"{rel}/{entry.name}" if rel else entry.name)
+            except OSError:
+                pass
+            self._dirs[rel] = children
+
+    # -- queries -----------------------------------------------------------
+
+    def path(self, rel: str) -> Path:
+        """Absolute path of a project-relative path."""
+        rel = _norm(rel)
+        return self.root / rel if rel else self.root
+
+    def is_dir(self, rel: str) -> bool:
+        return _norm(rel) in self._dirs
+
+    def is_file(self, rel: str) -> bool:
+        parent, _, name = _norm(rel).rpartition("/")
+        return self._dirs.get(parent, {}).get(name) is False
+
+    def subdirs(self, rel: str = "") -> list[str]:
+        """Sorted names of the directories directly under *rel*."""
+        children = self._dirs.get(_norm(rel), {})
+        return sorted(name for name, is_dir in children.items() if is_dir)
+
+    def files(self, rel: str = "", suffix: str = "") -> list[str]:
+        """Sorted names of the files directly under *rel* ending in *suffix*."""
+        children = self._dirs.get(_norm(rel), {})
+        return sorted(
+            name
+            for name, is_dir in children.items()
+            if not is_dir and name.endswith(suffix)
+        )
+
+    def walk_files(self, suffix: str = "") -> list[str]:
+        """Sorted project-relative paths of every file ending in *suffix*."""
+        return sorted(
+            f"{rel}/{name}" if rel else name
+            for rel, children in self._dirs.items()
+            for name, is_dir in children.items()
+            if not is_dir and name.endswith(suffix)
+        )
+
+    def read_text(self, rel: str) -> str:
+        """Read a file known to the snapshot, or return empty string."""
+        if not self.is_file(rel):
+            return ""
+        return self.path(rel).read_text()
+
+    def read_svg(self, rel: str) -> str:
+        """Read an SVG through the asset store, or return empty string."""
+        if not self.is_file(rel):
+            return ""
+        return self.assets.load(self.path(rel))
+
+    # -- updates -----------------------------------------------------------
+
+    def add_file(self, rel: str) -> None:
+        """Record a file created after the snapshot was taken."""
+        parent, _, name = _norm(rel).rpartition("/")
+        if parent not in self._dirs:
+            self._add_dir(parent)
+        self._dirs[parent][name] = False
+
+    def _add_dir(self, rel: str) -> None:
+        if rel in self._dirs:
+            return
+        parent, _, name = rel.rpartition("/")
+        if rel:
+            self._add_dir(parent)
+            self._dirs[parent][name] = True
+        self._dirs[rel] = {}
@@ -21,6 +21,18 @@ class TourStop(BaseModel):
     analysis_file: str = "analysis.md"
 
 
+class StopError(BaseModel):
+    """A tour stop reference that does not resolve to a project file.
+
+    ``field`` is the stop field at fault: ``atlas_source``, ``map_file``
+    or ``analysis_file``.
+    """
+
+    order: str
+    field: str
+    message: str
+
+
 class TourManifest(BaseModel):
     """A complete tour definition for a specific audience."""
 
@@ -32,6 +44,115 @@ class TourManifest(BaseModel):
     stops: list[TourStop]
 
 
+class TourSummary(BaseModel):
+    """Catalog entry for a tour: enough to list it without loading it.
+
+    ``sha256``, ``mtime_ns`` and ``size`` describe the manifest file the
+    entry was taken from, so a changed manifest is detected by a stat.
+    """
+
+    name: str
+    title: str
+    stop_count: int
+    sha256: str
+    mtime_ns: int
+    size: int
+
+
+class ComponentMetrics(BaseModel):
+    """Connectivity metrics for one node of a map.
+
+    Fan-in counts nodes that depend on this one; fan-out counts nodes
+    it depends on. Transitive counts follow the whole chain. Depth is
+    the longest dependency path down to a leaf.
+    """
+
+    name: str
+    kind: str
+    visibility: float | None
+    maturity: float | None
+    fan_in: int
+    fan_out: int
+    transitive_fan_in: int
+    transitive_fan_out: int
+    depth: int
+
+
+class NeedTrace(BaseModel):
+    """The supply chain below one user need."""
+
+    need: str
+    anchors: list[str]
+    components: list[str]
+    depth: int
+    width: int
+    shared_with: list[str]
+
+
+class SharedComponent(BaseModel):
+    """A component reachable from more than one user need."""
+
+    name: str
+    needs: list[str]
+    anchors: list[str]
+
+
+class VisibilityLayer(BaseModel):
+    """Components in one visibility band, with their evolution range."""
+
+    name: str
+    components: list[str]
+    maturity_min: float | None
+    maturity_max: float | None
+    maturity_mean: float | None
+    near_boundary: list[str]
+
+
+class MapAnalytics(BaseModel):
+    """Precomputed graph analytics for a Wardley map."""
+
+    title: str
+    source_hash: str
+    components: list[ComponentMetrics]
+    anchor_reach: dict[str, list[str]]
+    need_traces: list[NeedTrace]
+    shared_components: list[SharedComponent]
+    layers: list[VisibilityLayer]
+    cross_layer_edges: dict[str, int]
+    warnings: list[str]
+
+
+class AtlasView(BaseModel):
+    """One atlas view and the project files it is derived from.
+
+    Paths are relative to the project directory, or to the client
+    directory for sources prefixed ``client:``; sources may be glob
+    patterns. ``per`` names what a templated view (``need-{slug}``) is
+    expanded over: ``anchor``, ``need`` or ``play``.
+    """
+
+    name: str
+    skill: str
+    sources: list[str]
+    outputs: list[str]
+    per: str = ""
+
+
+class AtlasViewStatus(BaseModel):
+    """Whether an atlas view needs regenerating, and why.
+
+    ``state`` is ``fresh``, ``stale``, or ``blocked`` when a required
+    source does not exist yet. ``indexed`` is False for views built
+    before the atlas index recorded them.
+    """
+
+    view: str
+    skill: str
+    state: str
+    reasons: list[str] = []
+    indexed: bool = False
+
+
 @runtime_checkable
 class TourManifestRepository(Protocol):
     """Repository for audience tour manifests.
@@ -62,6 +183,29 @@ class TourManifestRepository(Protocol):
         ...
 
 
+@runtime_checkable
+class TourCatalog(Protocol):
+    """Tour repository that can list tours without loading their manifests."""
+
+    def summaries(
+        self, client: str, engagement: str, project_slug: str
+    ) -> list[TourSummary]:
+        """Catalog entries for a project's tours, sorted by name."""
+        ...
+
+
+@runtime_checkable
+class TourStopChecker(Protocol):
+    """Checks tour stops against the files of their project's atlas."""
+
+    def check(self, manifests: list[TourManifest]) -> list[list[StopError]]:
+        """Stop errors for each manifest, in manifest order.
+
+        Each project's atlas is scanned at most once per call.
+        """
+        ...
+
+
 @runtime_checkable
 class ProjectLookup(Protocol):
     """Minimal project existence check.
@@ -73,3 +217,38 @@ class ProjectLookup(Protocol):
     def get(self, client: str, engagement: str, slug: str) -> object | None:
         """Return something truthy if the project exists, None otherwise."""
         ...
+
+
+@runtime_checkable
+class MapAnalyticsProvider(Protocol):
+    """Source of graph analytics for a project's OWM maps."""
+
+    def analyse(
+        self,
+        client: str,
+        engagement: str,
+        project_slug: str,
+        map_path: str,
+    ) -> MapAnalytics | None:
+        """Return analytics for a map, or None if the map does not exist."""
+        ...
+
+
+@runtime_checkable
+class AtlasIndex(Protocol):
+    """Dependency-tracked build index for a project's atlas views."""
+
+    def status(
+        self, client: str, engagement: str, project_slug: str
+    ) -> list[AtlasViewStatus]:
+        """Status of every atlas view of a project."""
+        ...
+
+    def record(
+        self, client: str, engagement: str, project_slug: str, view: str
+    ) -> AtlasViewStatus | None:
+        """Record a view as built from its current sources.
+
+        Returns None if the project has no such view.
+        """
+        ...
@@ -2,24 +2,61 @@
 
 from __future__ import annotations
 
-from practice.exceptions import NotFoundError
-from wardley_mapping.dtos import RegisterTourRequest, RegisterTourResponse
-from wardley_mapping.types import ProjectLookup, TourManifest, TourManifestRepository
+from practice.exceptions import DuplicateError, NotFoundError
+from wardley_mapping.dtos import (
+    AnalyseMapRequest,
+    AnalyseMapResponse,
+    GetAtlasStatusRequest,
+    GetAtlasStatusResponse,
+    ListedTour,
+    ListToursRequest,
+    ListToursResponse,
+    RecordAtlasViewRequest,
+    RecordAtlasViewResponse,
+    RegisteredTour,
+    RegisterToursBatchRequest,
+    RegisterToursBatchResponse,
+    RegisterTourRequest,
+    RegisterTourResponse,
+)
+from wardley_mapping.types import (
+    AtlasIndex,
+    MapAnalyticsProvider,
+    ProjectLookup,
+    StopError,
+    TourCatalog,
+    TourManifest,
+    TourManifestRepository,
+    TourStopChecker,
+)
+
+
+def _check_stops(
+    stops: TourStopChecker | None, manifests: list[TourManifest]
+) -> list[list[StopError]]:
+    if stops is None:
+        return [[] for _ in manifests]
+    return stops.check(manifests)
 
 
 class RegisterTourUseCase:
     """Validate project existence then persist a tour manifest.
 
     Replaces any existing tour with the same name (upsert semantics).
+    Stops whose files do not exist are reported in the response; the
+    tour is saved regardless, so it can be registered before the atlas
+    is complete. Without a stop checker no stops are reported.
     """
 
     def __init__(
         self,
         projects: ProjectLookup,
         tours: TourManifestRepository,
+        stops: TourStopChecker | None = None,
     ) -> None:
         self._projects = projects
         self._tours = tours
+        self._stops = stops
 
     def execute(self, request: RegisterTourRequest) -> RegisterTourResponse:
         if (
@@ -30,20 +67,234 @@ class RegisterTourUseCase:
                 f"Project not found: {request.client}/{request.project_slug}"
             )
 
-        self._tours.save(
+        manifest = TourManifest(
+            name=request.name,
+            client=request.client,
+            engagement=request.engagement,
+            project_slug=request.project_slug,
+            title=request.title,
+            stops=request.stops,
+        )
+        [errors] = _check_stops(self._stops, [manifest])
+        self._tours.save(manifest)
+
+        return RegisterTourResponse(
+            client=request.client,
+            project_slug=request.project_slug,
+            name=request.name,
+            stop_count=len(request.stops),
+            errors=errors,
+        )
+
+
+class RegisterToursBatchUseCase:
+    """Validate the project and every tour once, then persist them all.
+
+    Nothing is written unless the whole batch is valid: tour names
+    must be unique within the batch, and stop orders unique within
+    each tour. Stop references are checked against one scan of the
+    project and reported per tour, as in ``RegisterTourUseCase``.
+    """
+
+    def __init__(
+        self,
+        projects: ProjectLookup,
+        tours: TourManifestRepository,
+        stops: TourStopChecker | None = None,
+    ) -> None:
+        self._projects = projects
+        self._tours = tours
+        self._stops = stops
+
+    def execute(self, request: RegisterToursBatchRequest) -> RegisterToursBatchResponse:
+        if (
+            self._projects.get(request.client, request.engagement, request.project_slug)
+            is None
+        ):
+            raise NotFoundError(
+                f"Project not found: {request.client}/{request.project_slug}"
+            )
+
+        names = [t.name for t in request.tours]
+        if duplicates := sorted({n for n in names if names.count(n) > 1}):
+            raise DuplicateError(f"Duplicate tour names: {', '.join(duplicates)}")
+        for tour in request.tours:
+            orders = [s.order for s in tour.stops]
+            if duplicates := sorted({o for o in orders if orders.count(o) > 1}):
+                raise DuplicateError(
+                    f"Duplicate stop orders in tour '{tour.name}':"
+                    f" {', '.join(duplicates)}"
+                )
+
+        manifests = [
             TourManifest(
-                name=request.name,
+                name=tour.name,
                 client=request.client,
                 engagement=request.engagement,
                 project_slug=request.project_slug,
-                title=request.title,
-                stops=request.stops,
+                title=tour.title,
+                stops=tour.stops,
             )
+            for tour in request.tours
+        ]
+        errors = _check_stops(self._stops, manifests)
+        for manifest in manifests:
+            self._tours.save(manifest)
+
+        return RegisterToursBatchResponse(
+            client=request.client,
+            project_slug=request.project_slug,
+            tours=[
+                RegisteredTour(name=m.name, stop_count=len(m.stops), errors=e)
+                for m, e in zip(manifests, errors)
+            ],
         )
 
-        return RegisterTourResponse(
+
+class ListToursUseCase:
+    """Validate project existence then list its tours.
+
+    A repository with a catalog (``TourCatalog``) answers from the
+    catalog alone, so listing never reads or validates a manifest.
+    Other repositories list their manifests.
+    """
+
+    def __init__(
+        self,
+        projects: ProjectLookup,
+        tours: TourManifestRepository,
+    ) -> None:
+        self._projects = projects
+        self._tours = tours
+
+    def execute(self, request: ListToursRequest) -> ListToursResponse:
+        if (
+            self._projects.get(request.client, request.engagement, request.project_slug)
+            is None
+        ):
+            raise NotFoundError(
+                f"Project not found: {request.client}/{request.project_slug}"
+            )
+
+        key = (request.client, request.engagement, request.project_slug)
+        if isinstance(self._tours, TourCatalog):
+            tours = [
+                ListedTour(name=s.name, title=s.title, stop_count=s.stop_count)
+                for s in self._tours.summaries(*key)
+            ]
+        else:
+            tours = [
+                ListedTour(name=m.name, title=m.title, stop_count=len(m.stops))
+                for m in self._tours.list_all(*key)
+            ]
+
+        return ListToursResponse(
             client=request.client,
             project_slug=request.project_slug,
-            name=request.name,
-            stop_count=len(request.stops),
+            tours=tours,
+        )
+
+
+class AnalyseMapUseCase:
+    """Validate project existence then return analytics for one of its maps."""
+
+    def __init__(
+        self,
+        projects: ProjectLookup,
+        analytics: MapAnalyticsProvider,
+    ) -> None:
+        self._projects = projects
+        self._analytics = analytics
+
+    def execute(self, request: AnalyseMapRequest) -> AnalyseMapResponse:
+        if (
+            self._projects.get(request.client, request.engagement, request.project_slug)
+            is None
+        ):
+            raise NotFoundError(
+                f"Project not found: {request.client}/{request.project_slug}"
+            )
+
+        analytics = self._analytics.analyse(
+            request.client,
+            request.engagement,
+            request.project_slug,
+            request.map_path,
+        )
+        if analytics is None:
+            raise NotFoundError(
+                f"Map not found: {request.client}/{request.project_slug}"
+                f"/{request.map_path}"
+            )
+
+        return AnalyseMapResponse(
+            client=request.client,
+            project_slug=request.project_slug,
+            map_path=request.map_path,
+            analytics=analytics,
+        )
+
+
+class GetAtlasStatusUseCase:
+    """Validate project existence then report staleness of every atlas view."""
+
+    def __init__(
+        self,
+        projects: ProjectLookup,
+        atlas: AtlasIndex,
+    ) -> None:
+        self._projects = projects
+        self._atlas = atlas
+
+    def execute(self, request: GetAtlasStatusRequest) -> GetAtlasStatusResponse:
+        if (
+            self._projects.get(request.client, request.engagement, request.project_slug)
+            is None
+        ):
+            raise NotFoundError(
+                f"Project not found: {request.client}/{request.project_slug}"
+            )
+
+        return GetAtlasStatusResponse(
+            client=request.client,
+            project_slug=request.project_slug,
+            views=self._atlas.status(
+                request.client, request.engagement, request.project_slug
+            ),
+        )
+
+
+class RecordAtlasViewUseCase:
+    """Validate project existence then record an atlas view as rebuilt."""
+
+    def __init__(
+        self,
+        projects: ProjectLookup,
+        atlas: AtlasIndex,
+    ) -> None:
+        self._projects = projects
+        self._atlas = atlas
+
+    def execute(self, request: RecordAtlasViewRequest) -> RecordAtlasViewResponse:
+        if (
+            self._projects.get(request.client, request.engagement, request.project_slug)
+            is None
+        ):
+            raise NotFoundError(
+                f"Project not found: {request.client}/{request.project_slug}"
+            )
+
+        status = self._atlas.record(
+            request.client,
+            request.engagement,
+            request.project_slug,
+            request.view,
+        )
+        if status is None:
+            raise NotFoundError(f"Atlas view not found: {request.view}")
+
+        return RecordAtlasViewResponse(
+            client=request.client,
+            project_slug=request.project_slug,
+            status=status,
         )